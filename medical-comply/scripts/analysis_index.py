@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 분석 결과 인덱스
+medchecker/backend/data/analysis-results/*.json (병원별 분석 결과)을 SQLite 테이블로 평탄화합니다.
+
+- 증분 수집: 파일 mtime/크기가 바뀐 문서만 하나씩 읽어 반영 (삭제된 파일은 인덱스에서 제거)
+- analyses: 분석 1건당 1행 (처리 시간, 타임아웃 여부, 점수, 위험도, AI/OCR 호출 수, AI 비용, 위반/경고 수)
+- findings: violations[] / warnings[] 항목 1건당 1행 (ruleId, subcategory, finalScore, confidence ...)
+- hospitals: hospitals.json의 지역/좌표 (지역별 집계용)
+- 재분석 문서는 최신 결과('analysis')를 사용
+
+사용:
+  python3 analysis_index.py ingest
+  python3 analysis_index.py rule MED-EFF-007 --days 7
+  python3 analysis_index.py regions
+  python3 analysis_index.py sql "SELECT risk_level, COUNT(*) FROM analyses GROUP BY 1"
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+DATA_DIR = os.path.join(REPO_DIR, 'medchecker', 'backend', 'data')
+RESULTS_DIR = os.getenv('ANALYSIS_RESULTS_DIR', os.path.join(DATA_DIR, 'analysis-results'))
+HOSPITALS_FILE = os.getenv('HOSPITALS_FILE', os.path.join(DATA_DIR, 'hospitals', 'hospitals.json'))
+INDEX_FILE = os.getenv('ANALYSIS_INDEX_DB', os.path.join(SCRIPT_DIR, 'analysis_index.db'))
+
+SCHEMA_VERSION = 2
+COMMIT_EVERY = 500          # 이 파일 수마다 중간 커밋 (대량 수집 중 중단되어도 진행분 유지)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL UNIQUE,
+    hospital_id TEXT,
+    hospital_name TEXT,
+    url TEXT,
+    analyzed_at TEXT,
+    success INTEGER NOT NULL,
+    error TEXT,
+    timed_out INTEGER NOT NULL DEFAULT 0,
+    processing_ms INTEGER,
+    total_score INTEGER,
+    risk_level TEXT,
+    ai_calls INTEGER,
+    ai_cost REAL,
+    ai_total_calls INTEGER,
+    gemini_calls INTEGER,
+    claude_calls INTEGER,
+    ocr_images INTEGER,
+    ocr_api_calls INTEGER,
+    ocr_failed_calls INTEGER,
+    violations INTEGER NOT NULL DEFAULT 0,
+    warnings INTEGER NOT NULL DEFAULT 0,
+    reanalyzed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS findings (
+    analysis_id INTEGER NOT NULL REFERENCES analyses(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    rule_id TEXT,
+    category TEXT,
+    subcategory TEXT,
+    severity TEXT,
+    risk_score INTEGER,
+    final_score REAL,
+    confidence REAL,
+    decision TEXT,
+    matched_text TEXT
+);
+CREATE TABLE IF NOT EXISTS hospitals (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    region TEXT,
+    category TEXT,
+    mapx INTEGER,
+    mapy INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_hospital ON analyses(hospital_id);
+CREATE INDEX IF NOT EXISTS idx_analyses_time ON analyses(analyzed_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_risk ON analyses(risk_level);
+CREATE INDEX IF NOT EXISTS idx_findings_rule ON findings(rule_id, analysis_id);
+CREATE INDEX IF NOT EXISTS idx_findings_analysis ON findings(analysis_id);
+CREATE INDEX IF NOT EXISTS idx_hospitals_region ON hospitals(region);
+"""
+
+FINDING_KINDS = (('violations', 'violation'), ('warnings', 'warning'))
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def flatten(doc):
+    """분석 결과 문서 -> (analyses 행 dict, findings 행 목록)"""
+    # 재분석된 문서는 최상위가 이전 결과, 'analysis'가 최신 결과
+    result = doc.get('analysis') if isinstance(doc.get('analysis'), dict) else doc
+    ai_stats = result.get('aiStats') or {}
+    ocr_stats = result.get('ocrStats') or {}
+    ocr_api_stats = result.get('ocrApiStats') or {}
+    row = {
+        'hospital_id': doc.get('hospitalId'),
+        'hospital_name': doc.get('hospitalName'),
+        'url': doc.get('url') or result.get('url'),
+        'analyzed_at': result.get('analyzedAt') or doc.get('analyzedAt'),
+        'success': 1 if result.get('success', doc.get('success')) else 0,
+        'error': doc.get('error') or result.get('error'),
+        'timed_out': 1 if doc.get('isTimeout') and not result.get('success') else 0,
+        'processing_ms': _int(result.get('processingTimeMs')),
+        'total_score': _int(result.get('totalScore')),
+        'risk_level': result.get('riskLevel'),
+        'ai_calls': _int(result.get('aiCalls')),
+        'ai_cost': _float(result.get('aiCost')),
+        'ai_total_calls': _int(ai_stats.get('totalCalls')),
+        'gemini_calls': _int(ai_stats.get('geminiCalls')),
+        'claude_calls': _int(ai_stats.get('claudeCalls')),
+        'ocr_images': _int(ocr_stats.get('processedImages')),
+        'ocr_api_calls': _int(ocr_api_stats.get('totalCalls')),
+        'ocr_failed_calls': _int(ocr_api_stats.get('failedCalls')),
+        'violations': len(result.get('violations') or []),
+        'warnings': len(result.get('warnings') or []),
+        'reanalyzed': 1 if result is not doc else 0,
+    }
+    findings = []
+    for key, kind in FINDING_KINDS:
+        for item in result.get(key) or []:
+            if not isinstance(item, dict):
+                continue
+            findings.append((
+                kind, item.get('ruleId'), item.get('category'), item.get('subcategory'), item.get('severity'),
+                _int(item.get('riskScore')), _float(item.get('finalScore')), _float(item.get('confidence')),
+                item.get('decision'), item.get('matchedText'),
+            ))
+    return row, findings
+
+
+def _since(days=None, since=None):
+    """--days / --since -> analyzed_at 비교용 ISO 문자열 (없으면 None)"""
+    if since:
+        return since
+    if days is not None:
+        moment = datetime.now(timezone.utc) - timedelta(days=days)
+        return moment.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    return None
+
+
+class AnalysisIndex:
+    """analysis-results 디렉토리의 SQLite 인덱스"""
+
+    def __init__(self, path=INDEX_FILE, results_dir=RESULTS_DIR, hospitals_file=HOSPITALS_FILE):
+        self.path = path
+        self.results_dir = results_dir
+        self.hospitals_file = hospitals_file
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            # 스키마가 바뀌면 처음부터 다시 수집
+            for table in ('findings', 'analyses', 'hospitals', 'files'):
+                self.conn.execute(f'DROP TABLE IF EXISTS {table}')
+            self.conn.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- 수집 ---
+
+    def _changed(self, path, stat):
+        row = self.conn.execute('SELECT mtime_ns, size FROM files WHERE path = ?', (path,)).fetchone()
+        return row != (stat.st_mtime_ns, stat.st_size)
+
+    def _mark(self, path, stat):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO files (path, mtime_ns, size) VALUES (?, ?, ?)',
+            (path, stat.st_mtime_ns, stat.st_size)
+        )
+
+    def _ingest_hospitals(self):
+        """hospitals.json이 바뀌었으면 hospitals 테이블 재작성 -> 반영 여부"""
+        try:
+            stat = os.stat(self.hospitals_file)
+        except OSError:
+            return False
+        if not self._changed(self.hospitals_file, stat):
+            return False
+        try:
+            with open(self.hospitals_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] hospitals.json 읽기 실패: {e}")
+            return False
+        hospitals = data.get('hospitals', []) if isinstance(data, dict) else data
+        self.conn.execute('DELETE FROM hospitals')
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO hospitals (id, name, region, category, mapx, mapy) VALUES (?, ?, ?, ?, ?, ?)',
+            [(h.get('id'), h.get('name'), h.get('region'), h.get('category'), _int(h.get('mapx')), _int(h.get('mapy')))
+             for h in hospitals if isinstance(h, dict) and h.get('id')]
+        )
+        self._mark(self.hospitals_file, stat)
+        return True
+
+    def _remove(self, name):
+        self.conn.execute('DELETE FROM analyses WHERE file = ?', (name,))
+        self.conn.execute('DELETE FROM files WHERE path = ?', (name,))
+
+    def ingest(self):
+        """변경된 분석 결과 파일만 반영 -> {'added', 'updated', 'removed', 'skipped', 'failed', 'seconds'}"""
+        started = time.monotonic()
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'skipped': 0, 'failed': 0}
+        stats['hospitals'] = self._ingest_hospitals()
+
+        try:
+            entries = [entry for entry in os.scandir(self.results_dir)
+                       if entry.name.endswith('.json') and entry.is_file()]
+        except OSError as e:
+            print(f"[ERROR] 분석 결과 디렉토리 없음: {self.results_dir} ({e})")
+            entries = []
+        # 오래된 파일부터 (중간에 중단되어도 다음 실행에서 새 파일부터 이어서 반영)
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+
+        known = {path for (path,) in self.conn.execute("SELECT path FROM files WHERE path NOT LIKE '%/%'")}
+        pending = 0
+        for entry in entries:
+            stat = entry.stat()
+            known.discard(entry.name)
+            if not self._changed(entry.name, stat):
+                stats['skipped'] += 1
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    doc = json.load(f)
+                row, findings = flatten(doc)
+            except (OSError, ValueError, AttributeError) as e:
+                print(f"[WARNING] {entry.name}: 읽기 실패 ({e})")
+                stats['failed'] += 1
+                continue
+
+            existed = self.conn.execute('SELECT 1 FROM analyses WHERE file = ?', (entry.name,)).fetchone()
+            self.conn.execute('DELETE FROM analyses WHERE file = ?', (entry.name,))
+            cursor = self.conn.execute(
+                f"INSERT INTO analyses (file, {', '.join(row)}) VALUES (?{', ?' * len(row)})",
+                (entry.name, *row.values())
+            )
+            self.conn.executemany(
+                'INSERT INTO findings (analysis_id, kind, rule_id, category, subcategory, severity, risk_score, '
+                'final_score, confidence, decision, matched_text) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(cursor.lastrowid, *finding) for finding in findings]
+            )
+            self._mark(entry.name, stat)
+            stats['updated' if existed else 'added'] += 1
+
+            pending += 1
+            if pending >= COMMIT_EVERY:
+                self.conn.commit()
+                pending = 0
+
+        for name in known:
+            self._remove(name)
+            stats['removed'] += 1
+
+        self.conn.commit()
+        stats['seconds'] = round(time.monotonic() - started, 3)
+        return stats
+
+    # --- 조회 ---
+
+    def query(self, sql, params=()):
+        """(열 이름 목록, 행 목록)"""
+        cursor = self.conn.execute(sql, params)
+        return [column[0] for column in cursor.description or ()], cursor.fetchall()
+
+    def rule_hits(self, rule_id, since=None):
+        """ruleId에 걸린 병원 (since 이후 분석, 최근 순)"""
+        sql = ('SELECT a.hospital_id, a.hospital_name, h.region, a.analyzed_at, f.kind, f.final_score, f.matched_text '
+               'FROM findings f JOIN analyses a ON a.id = f.analysis_id '
+               'LEFT JOIN hospitals h ON h.id = a.hospital_id WHERE f.rule_id = ?')
+        params = [rule_id]
+        if since:
+            sql += ' AND a.analyzed_at >= ?'
+            params.append(since)
+        return self.query(sql + ' ORDER BY a.analyzed_at DESC', params)
+
+    def by_region(self, since=None):
+        """지역별 분석 수, 평균 처리 시간, 평균 점수, 위반/경고 수, AI 비용"""
+        sql = ("SELECT COALESCE(h.region, '(미상)') AS region, COUNT(*) AS analyses, "
+               'ROUND(AVG(a.processing_ms)) AS avg_processing_ms, ROUND(AVG(a.total_score), 1) AS avg_score, '
+               'SUM(a.violations) AS violations, SUM(a.warnings) AS warnings, '
+               'ROUND(SUM(COALESCE(a.ai_cost, 0)), 4) AS ai_cost '
+               'FROM analyses a LEFT JOIN hospitals h ON h.id = a.hospital_id WHERE a.success = 1')
+        params = []
+        if since:
+            sql += ' AND a.analyzed_at >= ?'
+            params.append(since)
+        return self.query(sql + ' GROUP BY 1 ORDER BY analyses DESC', params)
+
+    def summary(self):
+        (analyses, succeeded, findings), = self.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(success), 0), (SELECT COUNT(*) FROM findings) FROM analyses'
+        ).fetchall()
+        return {'analyses': analyses, 'success': succeeded, 'findings': findings}
+
+
+def _width(text):
+    """터미널 표시 폭 (한글 등 전각 문자는 2칸)"""
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+
+
+def _pad(text, width):
+    return text + ' ' * (width - _width(text))
+
+
+def print_table(columns, rows, limit=50, max_width=40):
+    if not rows:
+        print("  (결과 없음)")
+        return
+    cells = [[' '.join(('' if value is None else str(value)).split())[:max_width] for value in row]
+             for row in rows[:limit]]
+    widths = [max(_width(column), *(_width(row[i]) for row in cells)) for i, column in enumerate(columns)]
+    print('  ' + '  '.join(_pad(column, widths[i]) for i, column in enumerate(columns)))
+    for row in cells:
+        print('  ' + '  '.join(_pad(value, widths[i]) for i, value in enumerate(row)))
+    if len(rows) > limit:
+        print(f"  ... 외 {len(rows) - limit}행")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 분석 결과 인덱스 (SQLite)')
+    parser.add_argument('--db', default=INDEX_FILE, help=f'인덱스 파일 (기본: {INDEX_FILE})')
+    parser.add_argument('--results-dir', default=RESULTS_DIR, help='분석 결과 디렉토리')
+    parser.add_argument('--no-ingest', action='store_true', help='조회 전에 증분 수집하지 않음')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('ingest', help='변경된 분석 결과 반영')
+
+    rule = sub.add_parser('rule', help='특정 ruleId에 걸린 병원')
+    rule.add_argument('rule_id')
+    for command in (rule, sub.add_parser('regions', help='지역별 처리 시간/점수/위반 수')):
+        command.add_argument('--days', type=float, help='최근 N일 분석만')
+        command.add_argument('--since', help='이 시각(ISO) 이후 분석만')
+
+    raw = sub.add_parser('sql', help='SQL 직접 실행 (analyses, findings, hospitals)')
+    raw.add_argument('statement')
+
+    args = parser.parse_args()
+
+    with AnalysisIndex(args.db, args.results_dir) as index:
+        if args.command == 'ingest' or not args.no_ingest:
+            stats = index.ingest()
+            if args.command == 'ingest':
+                print("=" * 50)
+                print("분석 결과 인덱스 수집")
+                print("=" * 50)
+                print(f"  추가 {stats['added']} / 갱신 {stats['updated']} / 삭제 {stats['removed']} / "
+                      f"변경 없음 {stats['skipped']} / 실패 {stats['failed']}")
+                if stats['hospitals']:
+                    print("  hospitals.json 반영")
+                summary = index.summary()
+                print(f"  분석 {summary['analyses']}건 (성공 {summary['success']}건), 위반/경고 {summary['findings']}건")
+                print(f"  [OK] {stats['seconds']:.3f}초 ({args.db})")
+                return 1 if stats['failed'] else 0
+
+        started = time.perf_counter()
+        since = _since(getattr(args, 'days', None), getattr(args, 'since', None))
+        if args.command == 'rule':
+            columns, rows = index.rule_hits(args.rule_id, since)
+        elif args.command == 'regions':
+            columns, rows = index.by_region(since)
+        else:
+            try:
+                columns, rows = index.query(args.statement)
+            except sqlite3.Error as e:
+                print(f"[ERROR] {e}")
+                return 1
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print_table(columns, rows)
+    print(f"\n[INFO] {len(rows)}행, 조회 {elapsed_ms:.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 """
 MEDCHECKER 서버 자동 재시작 스크립트
-- 지정된 포트의 프로세스 종료
-- 백엔드/프론트엔드 서버 재시작
+- 지정된 포트의 프로세스 종료 (SIGTERM 후 제한 시간 초과 시에만 SIGKILL)
+- 백엔드/프론트엔드 서버 재시작 (새 프로세스 그룹으로 실행, run/*.pid 기록)
+- 서버 출력은 logs/<서비스>.log에 기록 (service_logs.py tail backend 로 조회)
+- --supervise: 포그라운드에서 감시하며 비정상 종료 시 자동 재시작
+- --rolling: 백엔드 무중단 재시작 (프록시 뒤에서 대체 포트로 새 서버 기동 후 전환)
+
+서버 시작/재시작, --supervise, --rolling은 POSIX(Linux/macOS) 전용입니다
+(프로세스 그룹과 신호, 로그 수집의 파이프 selectors, 프록시 제어용 유닉스 소켓 사용).
+Windows에서는 포트 점유 프로세스 종료(--kill-only, --port: netstat/taskkill)만 지원합니다.
 """
 
 import subprocess
 import sys
 import os
-import time
 import signal
 import platform
+import time
+
+import service_logs
+from readiness import Service, READY_TIMEOUT, print_ready_results, wait_for_ports_free, wait_for_services
+from supervisor import RUN_DIR, ServiceSpec, Supervisor, listening_pids, spawn, stop_port
+from rolling_proxy import proxy_status, switch_upstream, wait_drained
+from perf_gate import record_ready_times
 
 # 프로젝트 경로
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +35,57 @@ FRONTEND_DIR = os.path.join(PROJECT_DIR, 'frontend')
 BACKEND_PORT = int(os.getenv('BACKEND_PORT', 5000))
 FRONTEND_PORT = int(os.getenv('FRONTEND_PORT', 5173))
 
+# 무중단 재시작: 프록시가 BACKEND_PORT를 잡고 백엔드는 대체 포트 두 개를 번갈아 사용
+BACKEND_ALT_PORTS = [
+    int(port) for port in os.getenv('BACKEND_ALT_PORTS', f'{BACKEND_PORT + 1},{BACKEND_PORT + 2}').split(',')
+]
+DRAIN_TIMEOUT = float(os.getenv('DRAIN_TIMEOUT', 30))
+PROXY_CONTROL = os.path.join(RUN_DIR, 'backend-proxy.sock')
+
+
+def backend_service(port=BACKEND_PORT, name='백엔드'):
+    return Service(name, port, f'http://localhost:{port}/api/health')
+
+
+def frontend_service():
+    return Service('프론트엔드', FRONTEND_PORT, f'http://localhost:{FRONTEND_PORT}/')
+
+
+def backend_spec(port=BACKEND_PORT, name='backend'):
+    # 무중단 재시작 중인 대체 포트 백엔드도 같은 backend 로그에 기록
+    return ServiceSpec(name, ['npm', 'start'], BACKEND_DIR, {'PORT': port}, port, log_name='backend')
+
+
+def proxy_spec(upstream_port):
+    cmd = [
+        sys.executable, os.path.join(SCRIPT_DIR, 'rolling_proxy.py'),
+        '--listen', str(BACKEND_PORT), '--upstream', str(upstream_port), '--control', PROXY_CONTROL,
+    ]
+    return ServiceSpec('backend-proxy', cmd, SCRIPT_DIR, {}, BACKEND_PORT, log_name='backend-proxy')
+
+
+def frontend_spec():
+    return ServiceSpec(
+        'frontend', ['npm', 'run', 'dev'], FRONTEND_DIR, {'PORT': FRONTEND_PORT}, FRONTEND_PORT, log_name='frontend'
+    )
+
+
+def wait_ready_recorded(services):
+    """서버 준비 대기 후 결과 출력 - {키: Service}, 모두 준비되면 True
+
+    준비 시간은 성능 회귀 검사(perf_gate.py)의 ready.<키>_ms 지표로 기록합니다.
+    """
+    results = wait_for_services(list(services.values()))
+    record_ready_times({key: result.ready_ms if result.ready else None
+                        for key, result in zip(services, results)})
+    return print_ready_results(results)
+
+def wait_ports_released(ports):
+    """종료한 프로세스가 포트를 놓을 때까지 대기 (고정 sleep 대신)"""
+    for port, released in wait_for_ports_free(ports).items():
+        if not released:
+            print(f"[WARNING] 포트 {port}가 아직 사용 중입니다")
+
 def kill_port(port):
     """특정 포트를 사용하는 프로세스 종료"""
     system = platform.system()
@@ -46,17 +110,12 @@ def kill_port(port):
             else:
                 print(f"[INFO] 포트 {port}에서 실행 중인 프로세스 없음")
         else:
-            # Linux/macOS
-            result = subprocess.run(
-                f'lsof -ti:{port}',
-                shell=True, capture_output=True, text=True
-            )
-            if result.stdout:
-                pids = result.stdout.strip().split('\n')
-                for pid in pids:
-                    if pid:
-                        subprocess.run(f'kill -9 {pid}', shell=True)
-                print(f"[OK] 포트 {port} 프로세스 종료 완료 (PID: {', '.join(pids)})")
+            # Linux/macOS - LISTEN 중인 프로세스만 SIGTERM으로 종료
+            terminated, killed = stop_port(port)
+            pids = terminated + killed
+            if pids:
+                forced = f", 강제 종료: {', '.join(map(str, killed))}" if killed else ""
+                print(f"[OK] 포트 {port} 프로세스 종료 완료 (PID: {', '.join(map(str, pids))}{forced})")
             else:
                 print(f"[INFO] 포트 {port}에서 실행 중인 프로세스 없음")
         return True
@@ -75,23 +134,13 @@ def start_backend(background=True):
         return False
 
     try:
-        env = os.environ.copy()
-        env['PORT'] = str(BACKEND_PORT)
-
         if background:
-            # 백그라운드 실행
-            subprocess.Popen(
-                'npm start',
-                shell=True,
-                cwd=BACKEND_DIR,
-                env=env,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            print(f"[OK] 백엔드 서버 백그라운드 시작")
+            # 백그라운드 실행 (새 프로세스 그룹)
+            child = spawn(backend_spec())
+            print(f"[OK] 백엔드 서버 백그라운드 시작 (PID: {child.pid})")
         else:
-            # 포그라운드 실행
-            subprocess.run('npm start', shell=True, cwd=BACKEND_DIR, env=env)
+            # 포그라운드 실행 (비정상 종료 시 자동 재시작)
+            Supervisor([backend_spec()]).run()
         return True
     except Exception as e:
         print(f"[ERROR] 백엔드 서버 시작 실패: {e}")
@@ -108,28 +157,103 @@ def start_frontend(background=True):
         return False
 
     try:
-        env = os.environ.copy()
-        env['PORT'] = str(FRONTEND_PORT)
-
         if background:
-            # 백그라운드 실행
-            subprocess.Popen(
-                'npm run dev',
-                shell=True,
-                cwd=FRONTEND_DIR,
-                env=env,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            print(f"[OK] 프론트엔드 서버 백그라운드 시작")
+            # 백그라운드 실행 (새 프로세스 그룹)
+            child = spawn(frontend_spec())
+            print(f"[OK] 프론트엔드 서버 백그라운드 시작 (PID: {child.pid})")
         else:
-            # 포그라운드 실행
-            subprocess.run('npm run dev', shell=True, cwd=FRONTEND_DIR, env=env)
+            # 포그라운드 실행 (비정상 종료 시 자동 재시작)
+            Supervisor([frontend_spec()]).run()
         return True
     except Exception as e:
         print(f"[ERROR] 프론트엔드 서버 시작 실패: {e}")
         return False
 
+def stop_rolling_backends():
+    """무중단 재시작으로 대체 포트에서 실행 중인 백엔드 종료"""
+    if platform.system() == 'Windows':
+        for port in BACKEND_ALT_PORTS:
+            kill_port(port)
+        return
+    for port in BACKEND_ALT_PORTS:
+        terminated, killed = stop_port(port)
+        if terminated or killed:
+            print(f"[OK] 대체 포트 {port} 백엔드 종료 (PID: {', '.join(map(str, terminated + killed))})")
+
+def wait_proxy_control(timeout=10):
+    """프록시 제어 소켓이 응답할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proxy_status(PROXY_CONTROL):
+            return True
+        time.sleep(0.02)
+    return False
+
+def rolling_restart_backend():
+    """백엔드 무중단 재시작
+
+    1. 현재 사용하지 않는 대체 포트에서 새 백엔드 시작 후 /api/health 정상 확인
+    2. 프록시의 upstream을 새 포트로 전환 (새 요청부터 새 서버로)
+    3. 이전 서버로 열린 연결이 끝날 때까지 대기(drain) 후 이전 서버 종료
+
+    새 서버가 준비되지 않으면 이전 서버를 그대로 두고 실패를 반환합니다.
+    """
+    print("=" * 50)
+    print("MEDCHECKER 백엔드 무중단 재시작")
+    print("=" * 50)
+
+    status = proxy_status(PROXY_CONTROL)
+    old_port = status['upstream'] if status else None
+    new_port = next(port for port in BACKEND_ALT_PORTS if port != old_port)
+
+    # 1. 새 서버 시작
+    print(f"\n[1단계] 새 백엔드 시작 (포트 {new_port})")
+    stop_port(new_port)
+    wait_ports_released([new_port])
+    child = spawn(backend_spec(new_port, f'backend-{new_port}'))
+    print(f"[OK] 새 백엔드 시작 (PID: {child.pid})")
+    if not wait_ready_recorded({'backend': backend_service(new_port, f'새 백엔드(:{new_port})')}):
+        service_logs.print_tail('backend')
+        stop_port(new_port)
+        print("\n[ERROR] 새 백엔드가 준비되지 않아 전환을 취소했습니다. 기존 서버는 그대로 동작합니다.")
+        return 1
+
+    # 2. 트래픽 전환
+    print("\n[2단계] 트래픽 전환")
+    if status:
+        if not switch_upstream(PROXY_CONTROL, new_port):
+            stop_port(new_port)
+            print("[ERROR] 프록시 전환 실패 - 새 백엔드를 종료했습니다.")
+            return 1
+        print(f"[OK] 프록시 :{BACKEND_PORT} -> :{new_port}")
+    else:
+        # 첫 전환: BACKEND_PORT를 직접 쓰던 백엔드를 프록시로 교체
+        # 프록시를 먼저 띄워 바인딩을 재시도하게 한 뒤 기존 서버를 종료 (공백 수 ms)
+        # 기존 서버가 없으면 프록시가 바로 포트를 잡으므로 종료하지 않음
+        direct = bool(listening_pids(BACKEND_PORT))
+        spawn(proxy_spec(new_port))
+        if not wait_proxy_control():
+            stop_port(new_port)
+            print("[ERROR] 프록시를 시작할 수 없습니다 - 새 백엔드를 종료했습니다.")
+            return 1
+        if direct:
+            kill_port(BACKEND_PORT)
+        if not print_ready_results(wait_for_services([backend_service(BACKEND_PORT, '프록시')])):
+            return 1
+        print(f"[OK] 프록시 시작 :{BACKEND_PORT} -> :{new_port} (다음 재시작부터 무중단)")
+
+    # 3. 이전 서버 drain 후 종료
+    if old_port is not None:
+        print(f"\n[3단계] 이전 백엔드 정리 (포트 {old_port})")
+        remaining = wait_drained(PROXY_CONTROL, old_port, DRAIN_TIMEOUT)
+        if remaining:
+            print(f"[WARNING] {DRAIN_TIMEOUT:g}초 후에도 연결 {remaining}개가 남아 있어 종료합니다.")
+        kill_port(old_port)
+
+    print("\n" + "=" * 50)
+    print(f"[OK] 백엔드 무중단 재시작 완료 (:{BACKEND_PORT} -> :{new_port})")
+    return 0
+
 def restart_all():
     """모든 서버 재시작"""
     print("=" * 50)
@@ -140,18 +264,19 @@ def restart_all():
     print("\n[1단계] 기존 프로세스 종료")
     kill_port(BACKEND_PORT)
     kill_port(FRONTEND_PORT)
+    stop_rolling_backends()
 
-    # 잠시 대기
-    time.sleep(2)
+    # 포트 해제 대기
+    wait_ports_released([BACKEND_PORT, FRONTEND_PORT])
 
     # 2. 서버 시작
     print("\n[2단계] 서버 시작")
     backend_ok = start_backend(background=True)
     frontend_ok = start_frontend(background=True)
 
-    # 서버 시작 대기
-    print("\n서버 시작 대기 중 (5초)...")
-    time.sleep(5)
+    # 서버 준비 대기 (포트 바인딩 → 헬스 체크 폴링)
+    print(f"\n서버 준비 대기 중 (최대 {READY_TIMEOUT:g}초)...")
+    wait_ready_recorded({'backend': backend_service(), 'frontend': frontend_service()})
 
     # 3. 상태 확인
     print("\n[3단계] 상태 확인")
@@ -166,7 +291,7 @@ def restart_all():
         return 0
     else:
         print("[WARNING] 일부 서버가 아직 시작 중이거나 오류가 있습니다.")
-        print("         잠시 후 다시 확인하거나 로그를 확인해주세요.")
+        print(f"         잠시 후 다시 확인하거나 로그를 확인해주세요. ({service_logs.LOG_DIR})")
         return 1
 
 def main():
@@ -177,6 +302,10 @@ def main():
     parser.add_argument('--frontend-only', action='store_true', help='프론트엔드만 재시작')
     parser.add_argument('--kill-only', action='store_true', help='프로세스만 종료 (재시작 안함)')
     parser.add_argument('--port', type=int, help='특정 포트만 종료')
+    parser.add_argument('--rolling', action='store_true',
+                        help='백엔드 무중단 재시작 (프록시 뒤에서 새 서버로 전환)')
+    parser.add_argument('--supervise', action='store_true',
+                        help='포그라운드에서 서버를 감시하며 비정상 종료 시 자동 재시작 (Ctrl+C로 종료)')
 
     args = parser.parse_args()
 
@@ -187,20 +316,42 @@ def main():
     if args.kill_only:
         kill_port(BACKEND_PORT)
         kill_port(FRONTEND_PORT)
+        stop_rolling_backends()
         print("\n모든 서버 프로세스를 종료했습니다.")
         return 0
 
+    if platform.system() == 'Windows':
+        print("[ERROR] 서버 시작/재시작, --supervise, --rolling은 Linux/macOS에서만 지원합니다.")
+        print("        Windows에서는 --kill-only 또는 --port로 종료한 뒤 npm start / npm run dev로 직접 실행하세요.")
+        return 1
+
+    if args.rolling:
+        return rolling_restart_backend()
+
+    if args.supervise:
+        specs = [backend_spec(), frontend_spec()]
+        if args.backend_only:
+            specs = [backend_spec()]
+        elif args.frontend_only:
+            specs = [frontend_spec()]
+        for spec in specs:
+            kill_port(spec.port)
+        wait_ports_released([spec.port for spec in specs])
+        print("\n[감시 모드] Ctrl+C로 모든 서버를 종료합니다.")
+        return Supervisor(specs).run()
+
     if args.backend_only:
         kill_port(BACKEND_PORT)
-        time.sleep(1)
+        stop_rolling_backends()
+        wait_ports_released([BACKEND_PORT])
         start_backend(background=True)
-        return 0
+        return 0 if wait_ready_recorded({'backend': backend_service()}) else 1
 
     if args.frontend_only:
         kill_port(FRONTEND_PORT)
-        time.sleep(1)
+        wait_ports_released([FRONTEND_PORT])
         start_frontend(background=True)
-        return 0
+        return 0 if wait_ready_recorded({'frontend': frontend_service()}) else 1
 
     return restart_all()
 
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 배치 분석 프로파일러
+batch-analysis-log.json, timeout-hospitals.json, 분석 결과 인덱스(analysis_index.py)를 합쳐
+야간 batch-analyzer.js 실행 규모를 정하는 데 필요한 수치를 보여줍니다.
+
+- 단계별 시간 추정: 결과에 단계별 타이머가 없으므로 processingTimeMs를 OCR 이미지 수,
+  AI 호출 수로 회귀하여 크롤링/규칙(기본), OCR, AI 몫을 추정 (설명력 R²도 표시)
+- 가장 느린 병원/도메인, 호스트(기본 도메인)·병원 체인별 타임아웃 묶음
+- 타임아웃 초과: 타임아웃 임계를 넘겨 끝난 분석 (이벤트 루프 블로킹 의심)
+- 동시 실행 수별 처리량: 관측된 분석 시간 분포로 작업자 N개 배치를 시뮬레이션
+  (--ai-rpm / --ocr-rpm으로 외부 API 한도 반영)
+
+사용:
+  python3 batch_profile.py
+  python3 batch_profile.py --concurrency 1 2 4 8 --hospitals 500 --window-hours 6 --ai-rpm 50
+"""
+
+import heapq
+import json
+import os
+import random
+import statistics
+import sys
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlparse
+
+from analysis_index import DATA_DIR, INDEX_FILE, RESULTS_DIR, AnalysisIndex
+
+BATCH_LOG_FILE = os.path.join(DATA_DIR, 'batch-analysis-log.json')
+TIMEOUT_LOG_FILE = os.path.join(DATA_DIR, 'timeout-hospitals.json')
+
+# batch-analyzer.js CONFIG 기본값
+DELAY_MS = 3000
+TIMEOUT_MS = 90000
+
+CONCURRENCY_LEVELS = (1, 2, 4, 8, 16)
+SIMULATION_RUNS = 50
+TRIM_PERCENTILE = 95        # 회귀에서 제외할 상위 이상치 (분포 꼬리)
+SECOND_LEVEL = {'co', 'or', 'go', 'ac', 'ne', 're', 'pe', 'ms', 'hs', 'es', 'sc', 'kg', 'com', 'net', 'org'}
+CHAIN_SUFFIXES = ('의원', '병원', '클리닉', '피부과', '성형외과', '한의원', '치과')
+STAGES = (('ocr_images', 'OCR'), ('gemini_calls', 'AI (Gemini)'), ('claude_calls', 'AI (Claude)'))
+
+
+# --- 로드 ---
+
+def load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def host_of(url):
+    host = (urlparse(url if '//' in (url or '') else f'//{url or ""}').hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def base_domain(host):
+    """'a.b.example.co.kr' -> 'example.co.kr'"""
+    labels = host.split('.')
+    if len(labels) >= 3 and labels[-2] in SECOND_LEVEL and len(labels[-1]) == 2:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def chain_name(name):
+    """병원 이름에서 지점명을 뺀 체인 이름 ('유앤아이의원 명동점' -> '유앤아이의원')"""
+    tokens = (name or '').split()
+    for token in tokens:
+        if token.endswith(CHAIN_SUFFIXES):
+            return token
+    return tokens[0] if tokens else ''
+
+
+def load_runs(index):
+    """분석 1건당 dict 목록 (타임아웃 기록과 배치 로그 오류를 hospitalId로 합침)"""
+    _, rows = index.query(
+        'SELECT hospital_id, hospital_name, url, analyzed_at, success, error, timed_out, processing_ms, '
+        'COALESCE(ocr_images, 0), COALESCE(gemini_calls, 0), COALESCE(claude_calls, 0), '
+        'COALESCE(ocr_api_calls, 0) FROM analyses'
+    )
+    runs = {}
+    for (hospital_id, name, url, analyzed_at, success, error, timed_out, processing_ms,
+         ocr_images, gemini_calls, claude_calls, ocr_api_calls) in rows:
+        runs[hospital_id] = {
+            'id': hospital_id, 'name': name, 'url': url or '', 'analyzed_at': analyzed_at,
+            'success': bool(success), 'error': error, 'timed_out': bool(timed_out),
+            'processing_ms': processing_ms, 'threshold_ms': None,
+            'ocr_images': ocr_images, 'gemini_calls': gemini_calls, 'claude_calls': claude_calls,
+            'ocr_api_calls': ocr_api_calls,
+        }
+
+    # 결과 파일이 없는 실패도 배치 로그/타임아웃 기록에서 보충
+    for item in load_json(BATCH_LOG_FILE, {}).get('errors', []):
+        run = runs.setdefault(item.get('hospitalId'), {
+            'id': item.get('hospitalId'), 'name': None, 'url': '', 'analyzed_at': item.get('time'),
+            'success': False, 'error': item.get('error'), 'timed_out': False, 'processing_ms': None,
+            'threshold_ms': None, 'ocr_images': 0, 'gemini_calls': 0, 'claude_calls': 0, 'ocr_api_calls': 0,
+        })
+        if 'timeout' in (item.get('error') or '').lower():
+            run['timed_out'] = True
+    for item in load_json(TIMEOUT_LOG_FILE, {}).get('timeoutHospitals', []):
+        run = runs.get(item.get('id'))
+        if run is None:
+            continue
+        run['timed_out'] = True
+        run['name'] = run['name'] or item.get('name')
+        run['url'] = run['url'] or item.get('url', '')
+        run['processing_ms'] = run['processing_ms'] or item.get('elapsedMs')
+        run['threshold_ms'] = item.get('timeoutThreshold')
+
+    for run in runs.values():
+        run['host'] = host_of(run['url'])
+        run['domain'] = base_domain(run['host']) if run['host'] else '(미상)'
+        run['chain'] = chain_name(run['name'])
+    return list(runs.values())
+
+
+# --- 단계별 시간 추정 ---
+
+def _solve(matrix, vector):
+    """정규방정식 풀이 (가우스 소거, 특이 행렬이면 None)"""
+    size = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(size)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-9:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(size):
+            if r != col:
+                factor = rows[r][col] / rows[col][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return [rows[i][size] / rows[i][i] for i in range(size)]
+
+
+def fit_stages(runs):
+    """processing_ms ~ 기본 + Σ 계수 × (OCR 이미지 수, AI 호출 수) 비음수 최소제곱
+
+    -> {'base_ms', 'per_unit': {열: ms}, 'r2', 'samples'} (표본 부족 시 None)
+    """
+    samples = [run for run in runs if run['success'] and (run['processing_ms'] or 0) >= 100]
+    if len(samples) < 10:
+        return None
+    cutoff = statistics.quantiles([run['processing_ms'] for run in samples], n=100)[TRIM_PERCENTILE - 1]
+    samples = [run for run in samples if run['processing_ms'] <= cutoff]
+    target = [float(run['processing_ms']) for run in samples]
+
+    columns = [column for column, _ in STAGES if any(run[column] for run in samples)]
+    while True:
+        features = [[1.0] + [float(run[column]) for column in columns] for run in samples]
+        size = len(columns) + 1
+        gram = [[sum(row[i] * row[j] for row in features) for j in range(size)] for i in range(size)]
+        moment = [sum(row[i] * y for row, y in zip(features, target)) for i in range(size)]
+        coefficients = _solve(gram, moment)
+        if coefficients is None:
+            return None
+        negative = [column for column, value in zip(columns, coefficients[1:]) if value < 0]
+        if not negative:
+            break
+        # 음수 계수(물리적으로 불가능)는 제외하고 다시 적합
+        columns = [column for column in columns if column not in negative]
+
+    predicted = [sum(c * x for c, x in zip(coefficients, row)) for row in features]
+    mean = statistics.fmean(target)
+    total = sum((y - mean) ** 2 for y in target)
+    residual = sum((y - p) ** 2 for y, p in zip(target, predicted))
+    return {
+        'base_ms': max(coefficients[0], 0.0),
+        'per_unit': dict(zip(columns, coefficients[1:])),
+        'r2': 1 - residual / total if total else 0.0,
+        'samples': len(samples),
+        'cutoff_ms': cutoff,
+    }
+
+
+def stage_breakdown(runs, model):
+    """성공한 분석 전체에 모델을 적용한 단계별 추정 시간 합계 {단계: ms}"""
+    totals = defaultdict(float)
+    for run in runs:
+        if not run['success'] or not run['processing_ms']:
+            continue
+        explained = 0.0
+        for column, label in STAGES:
+            share = model['per_unit'].get(column, 0.0) * run[column]
+            totals[label] += share
+            explained += share
+        # 나머지(크롤링, 규칙 검사, 설명되지 않는 대기)는 기본 단계로
+        totals['크롤링/규칙 (기타)'] += max(run['processing_ms'] - explained, 0.0)
+    return dict(totals)
+
+
+# --- 묶음 ---
+
+def group_by(runs, key):
+    """key별 {'count', 'timeouts', 'failures', 'median_ms', 'max_ms', 'total_ms'}"""
+    groups = defaultdict(list)
+    for run in runs:
+        groups[run[key] or '(미상)'].append(run)
+    summary = {}
+    for name, members in groups.items():
+        times = [run['processing_ms'] for run in members if run['processing_ms']]
+        summary[name] = {
+            'count': len(members),
+            'timeouts': sum(run['timed_out'] for run in members),
+            'failures': sum(not run['success'] and not run['timed_out'] for run in members),
+            'median_ms': statistics.median(times) if times else None,
+            'max_ms': max(times) if times else None,
+            'total_ms': sum(times),
+        }
+    return summary
+
+
+def timeout_clusters(runs, key):
+    """타임아웃이 난 key 묶음 (타임아웃 수 내림차순)"""
+    groups = group_by(runs, key)
+    clusters = [(name, data) for name, data in groups.items() if data['timeouts']]
+    return sorted(clusters, key=lambda item: (-item[1]['timeouts'], -item[1]['count']))
+
+
+def overruns(runs, timeout_ms=TIMEOUT_MS):
+    """타임아웃 임계를 넘기고 끝난 분석 (성공 포함) - 처리 시간 내림차순"""
+    late = [run for run in runs
+            if run['processing_ms'] and run['processing_ms'] > (run['threshold_ms'] or timeout_ms) * 1.1]
+    return sorted(late, key=lambda run: run['processing_ms'], reverse=True)
+
+
+# --- 처리량 ---
+
+def observed_throughput(runs):
+    """날짜별 실제 처리량 (첫 분석 ~ 마지막 분석 시각 기준) {날짜: (건수, 시간, 시간당 건수)}"""
+    days = defaultdict(list)
+    for run in runs:
+        if run['analyzed_at']:
+            moment = datetime.fromisoformat(run['analyzed_at'].replace('Z', '+00:00'))
+            days[moment.date().isoformat()].append(moment)
+    observed = {}
+    for day, moments in sorted(days.items()):
+        hours = (max(moments) - min(moments)).total_seconds() / 3600
+        observed[day] = (len(moments), hours, len(moments) / hours if hours > 0 else None)
+    return observed
+
+
+def simulate(durations_ms, hospitals, workers, delay_ms, runs=SIMULATION_RUNS, seed=0):
+    """작업자 workers개가 큐에서 병원을 하나씩 가져가는 배치 -> 완료 시간(초) 목록
+
+    분석 시간은 관측값에서 복원 추출하고, 작업자마다 분석 뒤 delay_ms를 쉽니다.
+    """
+    rng = random.Random(seed)
+    makespans = []
+    for _ in range(runs):
+        free_at = [0.0] * workers
+        finish = 0.0
+        for _ in range(hospitals):
+            start = heapq.heappop(free_at)
+            end = start + rng.choice(durations_ms)
+            finish = max(finish, end)
+            heapq.heappush(free_at, end + delay_ms)
+        makespans.append(finish / 1000)
+    return sorted(makespans)
+
+
+def throughput_table(runs, levels, hospitals, delay_ms, ai_rpm=None, ocr_rpm=None):
+    """동시 실행 수별 예상 완료 시간/처리량 행 목록"""
+    durations = [run['processing_ms'] for run in runs if run['processing_ms']]
+    if not durations:
+        return [], {}
+
+    # 외부 API 한도 -> 시간당 최대 분석 수
+    caps = {}
+    count = len(runs)
+    ai_calls = sum(run['gemini_calls'] + run['claude_calls'] for run in runs) / count
+    ocr_calls = sum(run['ocr_api_calls'] for run in runs) / count
+    if ai_rpm and ai_calls:
+        caps['AI'] = ai_rpm * 60 / ai_calls
+    if ocr_rpm and ocr_calls:
+        caps['OCR'] = ocr_rpm * 60 / ocr_calls
+    cap = min(caps.values()) if caps else None
+
+    rows = []
+    for workers in levels:
+        makespans = simulate(durations, hospitals, workers, delay_ms)
+        p50 = makespans[len(makespans) // 2]
+        p90 = makespans[min(len(makespans) - 1, int(len(makespans) * 0.9))]
+        per_hour = hospitals / (p50 / 3600) if p50 else 0.0
+        limited = min(per_hour, cap) if cap else per_hour
+        rows.append({
+            'workers': workers,
+            'p50_hours': p50 / 3600,
+            # API 한도에 걸리면 완료 시간도 그만큼 늘어남
+            'p50_hours_limited': hospitals / limited if limited else None,
+            'p90_hours': p90 / 3600,
+            'per_hour': per_hour,
+            'per_hour_limited': limited,
+        })
+    return rows, {'caps_per_hour': caps, 'ai_calls_per_analysis': ai_calls, 'ocr_calls_per_analysis': ocr_calls}
+
+
+# --- 출력 ---
+
+def _seconds(ms):
+    return '-' if ms is None else f"{ms / 1000:.1f}초"
+
+
+def build_report(runs, args):
+    model = fit_stages(runs)
+    table, limits = throughput_table(runs, args.concurrency, args.hospitals, args.delay_ms,
+                                     args.ai_rpm, args.ocr_rpm)
+    recommended = next((row['workers'] for row in table
+                        if row['p90_hours'] <= args.window_hours
+                        and (row['p50_hours_limited'] or 0) <= args.window_hours), None)
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'runs': len(runs),
+        'success': sum(run['success'] for run in runs),
+        'timeouts': sum(run['timed_out'] for run in runs),
+        'crawl_failures': sum(not run['success'] and not run['timed_out'] for run in runs),
+        'observed': observed_throughput(runs),
+        'stage_model': model,
+        'stages_ms': stage_breakdown(runs, model) if model else {},
+        'slowest': sorted((run for run in runs if run['processing_ms']),
+                          key=lambda run: run['processing_ms'], reverse=True)[:args.top],
+        'domains': sorted(group_by(runs, 'domain').items(),
+                          key=lambda item: -(item[1]['median_ms'] or 0))[:args.top],
+        'timeout_domains': timeout_clusters(runs, 'domain'),
+        'timeout_chains': timeout_clusters(runs, 'chain'),
+        'overruns': overruns(runs),
+        'throughput': table,
+        'limits': limits,
+        'recommended_workers': recommended,
+    }
+
+
+def print_report(report, args):
+    print(f"\n분석 {report['runs']}건: 성공 {report['success']} / 타임아웃 {report['timeouts']} / "
+          f"크롤링 등 실패 {report['crawl_failures']}")
+    for day, (count, hours, per_hour) in report['observed'].items():
+        rate = f"{per_hour:.1f}건/시간" if per_hour else '-'
+        print(f"  {day}: {count}건, {hours:.1f}시간 ({rate}, 순차 실행 관측값)")
+
+    print("\n[단계별 시간 (추정)]")
+    model = report['stage_model']
+    if not model:
+        print("  [SKIP] 회귀에 필요한 성공 분석이 부족합니다")
+    else:
+        total = sum(report['stages_ms'].values()) or 1
+        for stage, ms in sorted(report['stages_ms'].items(), key=lambda item: -item[1]):
+            print(f"  {stage:<20} {ms / 3600000:>7.2f}시간  {ms / total * 100:5.1f}%")
+        units = ', '.join(f"{column} {value / 1000:.2f}초" for column, value in model['per_unit'].items())
+        print(f"  기본 {model['base_ms'] / 1000:.1f}초 + 단위당 {units or '-'} "
+              f"(R² {model['r2']:.2f}, 표본 {model['samples']}건, {_seconds(model['cutoff_ms'])} 이하)")
+        if model['r2'] < 0.3:
+            print("  [WARNING] 설명력이 낮습니다 - 대부분의 시간이 OCR/AI 호출 수와 무관한 크롤링·대기에서 발생")
+
+    print(f"\n[가장 느린 병원 {len(report['slowest'])}곳]")
+    for run in report['slowest']:
+        status = '타임아웃' if run['timed_out'] else ('성공' if run['success'] else '실패')
+        print(f"  {_seconds(run['processing_ms']):>9}  {status:<4}  {(run['name'] or run['id'])[:20]:<20}  {run['host']}"
+              f"  (OCR {run['ocr_images']}장, AI {run['gemini_calls'] + run['claude_calls']}회)")
+
+    print(f"\n[가장 느린 도메인 {len(report['domains'])}곳] (중앙값 기준)")
+    for name, data in report['domains']:
+        print(f"  {name:<28} {data['count']:>3}건  중앙값 {_seconds(data['median_ms']):>8}  최대 {_seconds(data['max_ms']):>8}")
+
+    for title, clusters in (('도메인', report['timeout_domains']), ('병원 체인', report['timeout_chains'])):
+        print(f"\n[타임아웃 묶음 - {title}]")
+        if not clusters:
+            print("  (없음)")
+        for name, data in clusters:
+            print(f"  {name:<28} 타임아웃 {data['timeouts']}/{data['count']}건  최대 {_seconds(data['max_ms'])}")
+
+    late = report['overruns']
+    if late:
+        print(f"\n[WARNING] 타임아웃 임계({TIMEOUT_MS // 1000}초)를 넘겨 끝난 분석 {len(late)}건 "
+              f"- 타이머가 제때 동작하지 않음 (동기 작업으로 이벤트 루프 블로킹 의심)")
+        for run in late[:5]:
+            print(f"    {_seconds(run['processing_ms']):>9}  {(run['name'] or run['id'])[:20]}  {run['host']}")
+
+    print(f"\n[동시 실행 수별 예상] 병원 {args.hospitals}곳, 분석 간 대기 {args.delay_ms / 1000:.0f}초, "
+          f"시뮬레이션 {SIMULATION_RUNS}회")
+    limits = report['limits']
+    for name, cap in limits.get('caps_per_hour', {}).items():
+        print(f"  {name} API 한도: 시간당 최대 {cap:.0f}건")
+    for row in report['throughput']:
+        limited = ''
+        if row['per_hour_limited'] < row['per_hour']:
+            limited = f" -> API 한도 적용 {row['per_hour_limited']:.0f}건/시간, {row['p50_hours_limited']:.1f}시간"
+        print(f"  작업자 {row['workers']:>2}개: 중앙값 {row['p50_hours']:5.1f}시간 (p90 {row['p90_hours']:5.1f}시간), "
+              f"{row['per_hour']:6.0f}건/시간{limited}")
+    sequential = next((row for row in report['throughput'] if row['workers'] == 1), None)
+    busiest = max(report['observed'].values(), key=lambda item: item[0], default=None)
+    if sequential and busiest and busiest[2]:
+        # 관측값에는 결과 저장, 패턴 학습, 중단/재시작 시간 등 시뮬레이션 밖의 시간이 포함됨
+        print(f"  [INFO] 실제 순차 실행 관측 {busiest[2]:.0f}건/시간 (작업자 1개 예상의 "
+              f"{busiest[2] / sequential['per_hour'] * 100:.0f}%) - 예상치는 이 비율만큼 낮춰 보세요")
+    if report['recommended_workers']:
+        print(f"\n[OK] {args.window_hours:g}시간 안에 끝내려면 작업자 {report['recommended_workers']}개 이상")
+    elif report['throughput']:
+        print(f"\n[WARNING] 검토한 동시 실행 수로는 {args.window_hours:g}시간 안에 끝나지 않습니다")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 배치 분석 처리량/타임아웃 프로파일')
+    parser.add_argument('--db', default=INDEX_FILE, help=f'분석 결과 인덱스 (기본: {INDEX_FILE})')
+    parser.add_argument('--results-dir', default=RESULTS_DIR, help='분석 결과 디렉토리')
+    parser.add_argument('--no-ingest', action='store_true', help='프로파일 전에 인덱스를 증분 수집하지 않음')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=list(CONCURRENCY_LEVELS),
+                        help='검토할 동시 실행 수 (기본: 1 2 4 8 16)')
+    parser.add_argument('--hospitals', type=int, help='야간 배치 병원 수 (기본: hospitals.json 병원 수)')
+    parser.add_argument('--delay-ms', type=int, default=DELAY_MS, help=f'작업자별 분석 간 대기 (기본: {DELAY_MS})')
+    parser.add_argument('--window-hours', type=float, default=6.0, help='야간 배치 허용 시간 (기본: 6)')
+    parser.add_argument('--ai-rpm', type=float, help='AI API 분당 호출 한도')
+    parser.add_argument('--ocr-rpm', type=float, help='OCR API 분당 호출 한도')
+    parser.add_argument('--top', type=int, default=10, help='느린 병원/도메인 출력 수')
+    parser.add_argument('--json', metavar='PATH', help='보고서를 JSON으로 저장')
+
+    args = parser.parse_args()
+    if min(args.concurrency) < 1:
+        parser.error('--concurrency 값은 1 이상이어야 합니다')
+    if args.hospitals is not None and args.hospitals < 1:
+        parser.error('--hospitals 값은 1 이상이어야 합니다')
+    if args.delay_ms < 0:
+        parser.error('--delay-ms 값은 0 이상이어야 합니다')
+
+    print("=" * 60)
+    print("MEDCHECKER 배치 분석 프로파일")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+
+    with AnalysisIndex(args.db, args.results_dir) as index:
+        if not args.no_ingest:
+            index.ingest()
+        runs = load_runs(index)
+        if args.hospitals is None:
+            (args.hospitals,), = index.query('SELECT COUNT(*) FROM hospitals')[1] or [(0,)]
+            args.hospitals = args.hospitals or len(runs)
+
+    if not runs:
+        print("[ERROR] 분석 결과가 없습니다")
+        return 1
+
+    report = build_report(runs, args)
+    print_report(report, args)
+
+    if args.json:
+        tmp_path = args.json + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, args.json)
+        print(f"\n결과 저장: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
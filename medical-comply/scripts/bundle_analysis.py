@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 프론트엔드 번들 분석 (오프라인)
+ux_audit.py의 성능 카테고리와 perf_gate.py의 번들 크기 지표에서 사용합니다.
+
+- 모듈 스캔: import / export ... from / import() / lazy(() => import()) 와 인라인 에셋(data: URI, <svg>)
+- 의존성 그래프: 상대 경로 import를 파일로 해석하여 진입점에서 정적으로 도달하는 모듈 계산
+- package-lock.json: 여러 버전이 설치된 패키지, dependencies/devDependencies 중복 선언
+- 빌드 결과물(dist): JS/CSS 청크별 크기와 gzip 크기
+"""
+
+import base64
+import gzip
+import json
+import os
+import re
+from pathlib import Path
+
+CODE_EXTENSIONS = ('.jsx', '.js', '.tsx', '.ts')
+BUNDLE_EXTENSIONS = ('.js', '.css')
+
+# vite 기본값: assetsInlineLimit 4KB, chunkSizeWarningLimit 500KB
+INLINE_ASSET_LIMIT = 4096
+CHUNK_WARNING_BYTES = 500 * 1024
+
+_IMPORT_FROM = re.compile(r'''\b(?:import|export)\s+(?:type\s+)?([\w$*{}\s,]+?)\s+from\s+['"]([^'"]+)['"]''')
+_SIDE_EFFECT_IMPORT = re.compile(r'''\bimport\s+['"]([^'"]+)['"]''')
+_DYNAMIC_IMPORT = re.compile(r'''\bimport\(\s*['"]([^'"]+)['"]\s*\)''')
+_LAZY_BINDING = re.compile(
+    r'''\b(?:const|let|var)\s+([\w$]+)\s*=\s*(?:React\.)?lazy\(\s*(?:async\s*)?\(\)\s*=>\s*'''
+    r'''(?:\{\s*return\s+)?import\(\s*['"]([^'"]+)['"]'''
+)
+_DATA_URI = re.compile(r'data:([\w/+.-]+);base64,([A-Za-z0-9+/=]+)')
+_INLINE_SVG = re.compile(r'<svg\b.*?</svg>', re.DOTALL)
+_COMMENT = re.compile(r'/\*.*?\*/|(?<![:\'"])//[^\n]*', re.DOTALL)
+
+# vite 출력 파일명의 해시: index-BxK3l2aB.js -> index.js
+_CHUNK_HASH = re.compile(r'-[\w-]{8}(?=\.[a-z]+$)')
+
+
+def inline_assets(content):
+    """인라인 에셋 목록 [[종류, 바이트]] - data: URI는 디코딩한 크기"""
+    assets = []
+    for match in _DATA_URI.finditer(content):
+        assets.append([match.group(1), decoded_size(match.group(2))])
+    for match in _INLINE_SVG.finditer(content):
+        assets.append(['inline-svg', len(match.group(0).encode('utf-8'))])
+    return assets
+
+
+def scan_module(content):
+    """모듈의 import 정보와 크기 (ux_audit 부분 결과로 캐시됨)
+
+    bindings: 기본(default) import 이름 -> 모듈 경로, lazy: lazy()로 불러오는 이름 -> 모듈 경로
+    """
+    code = _COMMENT.sub('', content)
+    imports = []
+    bindings = {}
+    for match in _IMPORT_FROM.finditer(code):
+        clause, specifier = match.groups()
+        imports.append(specifier)
+        default = clause.split(',', 1)[0].strip()
+        if default and default[0] not in '{*':
+            bindings[default] = specifier
+    imports += _SIDE_EFFECT_IMPORT.findall(code)
+
+    return {
+        'bytes': len(content.encode('utf-8')),
+        'lines': content.count('\n') + 1,
+        'imports': imports,
+        'dynamic_imports': _DYNAMIC_IMPORT.findall(code),
+        'bindings': bindings,
+        'lazy': {name: specifier for name, specifier in _LAZY_BINDING.findall(code)},
+        'inline_assets': inline_assets(content),
+    }
+
+
+def package_name(specifier):
+    """'react-dom/client' -> 'react-dom', '@scope/pkg/x' -> '@scope/pkg'"""
+    parts = specifier.split('/')
+    return '/'.join(parts[:2]) if specifier.startswith('@') else parts[0]
+
+
+def resolve(specifier, importer):
+    """상대 경로 import -> 파일 Path (패키지나 해석할 수 없는 경로는 None)"""
+    if not specifier.startswith('.'):
+        return None
+    base = (Path(importer).parent / specifier).resolve()
+    candidates = [base] + [base.with_name(base.name + ext) for ext in CODE_EXTENSIONS]
+    candidates += [base / f'index{ext}' for ext in CODE_EXTENSIONS]
+    return next((path for path in candidates if path.is_file()), None)
+
+
+class ImportGraph:
+    """모듈 간 정적/동적 import 그래프 - modules: {Path: scan_module 결과}"""
+
+    def __init__(self, modules):
+        self.modules = modules
+        self.static = {}
+        self.dynamic = {}
+        self.packages = {}
+        for path, info in modules.items():
+            self.static[path] = [target for target in (resolve(spec, path) for spec in info['imports']) if target]
+            self.dynamic[path] = [target for target in (resolve(spec, path) for spec in info['dynamic_imports'])
+                                  if target]
+            self.packages[path] = sorted({package_name(spec) for spec in info['imports'] + info['dynamic_imports']
+                                          if not spec.startswith('.')})
+
+    def closure(self, entry):
+        """entry에서 정적 import로 도달하는 파일 집합 (초기 번들에 함께 포함되는 모듈)"""
+        seen = set()
+        stack = [Path(entry)]
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            stack.extend(self.static.get(path, ()))
+        return seen
+
+    def size(self, paths):
+        """파일 크기 합계 (분석하지 않은 CSS 등은 파일 크기 사용)"""
+        total = 0
+        for path in paths:
+            info = self.modules.get(path)
+            if info:
+                total += info['bytes']
+            elif path.is_file():
+                total += path.stat().st_size
+        return total
+
+    def largest(self, count=5):
+        """크기순 모듈 [(Path, 바이트, 줄 수)]"""
+        ranked = sorted(self.modules.items(), key=lambda item: item[1]['bytes'], reverse=True)
+        return [(path, info['bytes'], info['lines']) for path, info in ranked[:count]]
+
+
+def lockfile_duplicates(package_dir):
+    """package-lock.json에서 여러 버전이 설치된 런타임 패키지 {이름: [버전...]}
+
+    dev 전용 패키지는 번들에 포함되지 않으므로 제외합니다.
+    """
+    try:
+        with open(os.path.join(package_dir, 'package-lock.json'), 'r', encoding='utf-8') as f:
+            lock = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    versions = {}
+    for key, entry in lock.get('packages', {}).items():
+        if 'node_modules/' not in key or entry.get('dev'):
+            continue
+        name = key.rsplit('node_modules/', 1)[1]
+        versions.setdefault(name, set()).add(entry.get('version', '?'))
+    return {name: sorted(found) for name, found in sorted(versions.items()) if len(found) > 1}
+
+
+def declared_twice(package_dir):
+    """dependencies와 devDependencies에 모두 선언된 패키지 목록"""
+    try:
+        with open(os.path.join(package_dir, 'package.json'), 'r', encoding='utf-8') as f:
+            package = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return sorted(set(package.get('dependencies', {})) & set(package.get('devDependencies', {})))
+
+
+def chunk_name(filename):
+    return _CHUNK_HASH.sub('', filename)
+
+
+def dist_chunks(dist_dir):
+    """빌드 결과물의 JS/CSS 청크 [(해시 제거한 이름, 바이트, gzip 바이트)] (크기순)"""
+    chunks = []
+    for root, _, files in os.walk(dist_dir):
+        for filename in files:
+            if not filename.endswith(BUNDLE_EXTENSIONS):
+                continue
+            path = os.path.join(root, filename)
+            with open(path, 'rb') as f:
+                data = f.read()
+            name = chunk_name(os.path.relpath(path, dist_dir).replace(os.sep, '/'))
+            chunks.append((name, len(data), len(gzip.compress(data, 6))))
+    return sorted(chunks, key=lambda chunk: chunk[1], reverse=True)
+
+
+def decoded_size(data_uri_payload):
+    """base64 본문의 디코딩 크기 (잘못된 본문은 근사값)"""
+    try:
+        return len(base64.b64decode(data_uri_payload, validate=True))
+    except ValueError:
+        return len(data_uri_payload) * 3 // 4
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 전체 병원 컴플라이언스 집계 (NumPy)
+analysis_index.py의 SQLite 인덱스를 열 단위 배열로 한 번 읽어 배열 연산으로 집계합니다.
+
+- ruleId / subcategory별 위반·경고 수, 해당 병원 수, 평균 finalScore/confidence, AI 비용 배분액
+- finalScore / confidence 분포 (0.1 간격 히스토그램, 백분위수)
+- 지역(hospitals.json region)별 위험도 구성
+- 발견 1건당 AI 비용 (분석별 aiCost를 그 분석의 발견 수로 균등 배분)
+
+결과: <출력 디렉토리>/rules.csv, subcategories.csv, regions.csv, distributions.csv, summary.json
+NumPy 필요 (pip install -r requirements.txt)
+
+사용:
+  python3 compliance_analytics.py
+  python3 compliance_analytics.py --out /tmp/analytics --top 20
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from analysis_index import INDEX_FILE, RESULTS_DIR, AnalysisIndex
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.getenv('ANALYTICS_OUTPUT_DIR', os.path.join(SCRIPT_DIR, 'analytics'))
+
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+SCORE_BINS = tuple(i / 10 for i in range(11))
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+# --- 로드 ---
+
+def factorize(values):
+    """문자열 열 -> (고유값 배열, 코드 배열)"""
+    labels, codes = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return labels, codes
+
+
+def _columns(rows, count):
+    """행 목록 -> 열 목록 (행이 없으면 빈 열)"""
+    return list(zip(*rows)) if rows else [()] * count
+
+
+def load_frame(index):
+    """인덱스를 열 배열 dict 두 개로 로드 -> (analyses, findings)
+
+    findings['analysis']는 analyses 배열의 행 번호, findings['rule'] / ['subcategory']는
+    findings['labels'][열 이름]의 인덱스입니다.
+    """
+    _, rows = index.query(
+        "SELECT a.id, a.success, COALESCE(a.risk_level, ''), COALESCE(a.ai_cost, 0), "
+        "COALESCE(a.total_score, -1), COALESCE(h.region, '(미상)') "
+        'FROM analyses a LEFT JOIN hospitals h ON h.id = a.hospital_id ORDER BY a.id'
+    )
+    ids, success, risk, cost, score, region = _columns(rows, 6)
+    analyses = {
+        'id': np.asarray(ids, dtype=np.int64),
+        'success': np.asarray(success, dtype=bool),
+        'risk': np.asarray(risk, dtype=str),
+        'ai_cost': np.asarray(cost, dtype=np.float64),
+        'total_score': np.asarray(score, dtype=np.float64),
+        'region': np.asarray(region, dtype=str),
+    }
+
+    _, rows = index.query(
+        "SELECT analysis_id, kind, COALESCE(rule_id, ''), COALESCE(subcategory, ''), "
+        'final_score, confidence FROM findings'
+    )
+    analysis_ids, kind, rule, subcategory, final, confidence = _columns(rows, 6)
+    findings = {
+        'analysis': np.searchsorted(analyses['id'], np.asarray(analysis_ids, dtype=np.int64)),
+        'violation': np.asarray(kind, dtype=str) == 'violation',
+        # None -> NaN (집계에서 제외)
+        'final_score': np.asarray(final, dtype=np.float64),
+        'confidence': np.asarray(confidence, dtype=np.float64),
+        'labels': {},
+    }
+    for key, values in (('rule', rule), ('subcategory', subcategory)):
+        findings['labels'][key], findings[key] = factorize(values)
+    return analyses, findings
+
+
+# --- 집계 ---
+
+def cost_shares(analyses, findings):
+    """발견별 AI 비용 배분액 (분석의 aiCost / 그 분석의 발견 수)"""
+    per_analysis = np.bincount(findings['analysis'], minlength=len(analyses['id']))
+    return analyses['ai_cost'][findings['analysis']] / np.maximum(per_analysis[findings['analysis']], 1)
+
+
+def _mean_by(codes, values, size):
+    """그룹별 평균 (NaN 제외, 값이 없는 그룹은 NaN)"""
+    valid = ~np.isnan(values)
+    total = np.bincount(codes[valid], weights=values[valid], minlength=size)
+    count = np.bincount(codes[valid], minlength=size)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+def group_stats(key, analyses, findings, shares):
+    """findings[key] 값별 집계 행 목록 (발견 수 내림차순)"""
+    labels, codes = findings['labels'][key], findings[key]
+    size = len(labels)
+    if size == 0:
+        return []
+    violations = np.bincount(codes[findings['violation']], minlength=size)
+    warnings = np.bincount(codes[~findings['violation']], minlength=size)
+    # (그룹, 분석) 쌍의 고유 개수 = 그룹별 해당 병원(분석) 수
+    pairs = np.unique(codes.astype(np.int64) * len(analyses['id']) + findings['analysis'])
+    hospitals = np.bincount(pairs // len(analyses['id']), minlength=size)
+    final = _mean_by(codes, findings['final_score'], size)
+    confidence = _mean_by(codes, findings['confidence'], size)
+    cost = np.bincount(codes, weights=shares, minlength=size)
+
+    order = np.argsort(-(violations + warnings), kind='stable')
+    return [{
+        key: labels[i] or '(미상)',
+        'findings': int(violations[i] + warnings[i]),
+        'violations': int(violations[i]),
+        'warnings': int(warnings[i]),
+        'hospitals': int(hospitals[i]),
+        'avg_final_score': _round(final[i]),
+        'avg_confidence': _round(confidence[i]),
+        'ai_cost': round(float(cost[i]), 6),
+        'ai_cost_per_finding': round(float(cost[i] / (violations[i] + warnings[i])), 6),
+    } for i in order]
+
+
+def distribution(values):
+    """0~1 점수 분포 (히스토그램 + 백분위수)"""
+    values = values[~np.isnan(values)]
+    counts, _ = np.histogram(np.clip(values, 0.0, 1.0), bins=SCORE_BINS)
+    summary = {'count': int(values.size), 'histogram': counts.tolist()}
+    if values.size:
+        summary['mean'] = _round(values.mean())
+        summary.update({f'p{p}': _round(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))})
+    return summary
+
+
+def region_risk(analyses):
+    """지역별 위험도 구성 (성공한 분석만) - 행 목록 (분석 수 내림차순)"""
+    ok = analyses['success']
+    labels, codes = factorize(analyses['region'][ok])
+    if len(labels) == 0:
+        return []
+    levels = np.asarray(RISK_LEVELS + ('other',))
+    risk = analyses['risk'][ok]
+    risk_codes = np.full(risk.shape, len(RISK_LEVELS), dtype=np.int64)
+    for i, level in enumerate(RISK_LEVELS):
+        risk_codes[risk == level] = i
+    matrix = np.bincount(codes * len(levels) + risk_codes, minlength=len(labels) * len(levels))
+    matrix = matrix.reshape(len(labels), len(levels))
+    totals = matrix.sum(axis=1)
+    scores = analyses['total_score'][ok]
+    valid = scores >= 0
+    avg_score = np.bincount(codes[valid], weights=scores[valid], minlength=len(labels)) / np.maximum(
+        np.bincount(codes[valid], minlength=len(labels)), 1)
+    high_share = matrix[:, RISK_LEVELS.index('high'):len(RISK_LEVELS)].sum(axis=1) / np.maximum(totals, 1)
+
+    order = np.argsort(-totals, kind='stable')
+    return [{
+        'region': labels[i],
+        'analyses': int(totals[i]),
+        **{str(level): int(matrix[i, j]) for j, level in enumerate(levels)},
+        'high_or_worse_share': _round(high_share[i]),
+        'avg_total_score': _round(avg_score[i], 1),
+    } for i in order]
+
+
+def _round(value, digits=3):
+    value = float(value)
+    return None if np.isnan(value) else round(value, digits)
+
+
+def analyze(index):
+    """전체 집계 -> summary dict (CSV 행 목록 포함)"""
+    analyses, findings = load_frame(index)
+    shares = cost_shares(analyses, findings)
+    total_findings = int(findings['rule'].size)
+    total_cost = float(analyses['ai_cost'].sum())
+    allocated = float(shares.sum())
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'analyses': int(analyses['id'].size),
+        'successful': int(analyses['success'].sum()),
+        'findings': total_findings,
+        'violations': int(findings['violation'].sum()),
+        'warnings': int(total_findings - findings['violation'].sum()),
+        'ai_cost': {
+            'total': round(total_cost, 6),
+            'per_finding': round(total_cost / total_findings, 6) if total_findings else None,
+            # 발견이 없는 분석에서 쓴 비용 (규칙별로 배분되지 않음)
+            'unallocated': round(total_cost - allocated, 6),
+        },
+        'distributions': {
+            'final_score': distribution(findings['final_score']),
+            'confidence': distribution(findings['confidence']),
+        },
+        'rules': group_stats('rule', analyses, findings, shares),
+        'subcategories': group_stats('subcategory', analyses, findings, shares),
+        'regions': region_risk(analyses),
+    }
+
+
+# --- 출력 ---
+
+def write_csv(path, rows):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f:
+        if rows:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    os.replace(tmp_path, path)
+
+
+def write_outputs(summary, out_dir):
+    """CSV 4개 + summary.json 저장 -> 저장한 파일 목록"""
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for name in ('rules', 'subcategories', 'regions'):
+        path = os.path.join(out_dir, f'{name}.csv')
+        write_csv(path, summary[name])
+        written.append(path)
+
+    edges = SCORE_BINS
+    rows = [{'bin': f'{edges[i]:.1f}-{edges[i + 1]:.1f}',
+             **{name: dist['histogram'][i] for name, dist in summary['distributions'].items()}}
+            for i in range(len(edges) - 1)]
+    path = os.path.join(out_dir, 'distributions.csv')
+    write_csv(path, rows)
+    written.append(path)
+
+    path = os.path.join(out_dir, 'summary.json')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    written.append(path)
+    return written
+
+
+def print_summary(summary, top=10):
+    print(f"\n분석 {summary['analyses']}건 (성공 {summary['successful']}건), "
+          f"위반 {summary['violations']}건 / 경고 {summary['warnings']}건")
+    cost = summary['ai_cost']
+    if cost['per_finding'] is not None:
+        print(f"AI 비용 ${cost['total']:.4f} (발견 1건당 ${cost['per_finding']:.4f}, 미배분 ${cost['unallocated']:.4f})")
+
+    print(f"\n[ruleId별 상위 {top}개]")
+    for row in summary['rules'][:top]:
+        print(f"  {row['rule']:<14} {row['findings']:>5}건  병원 {row['hospitals']:>4}  "
+              f"finalScore {row['avg_final_score']}  confidence {row['avg_confidence']}")
+
+    print(f"\n[지역별 위험도 상위 {top}개] (low/medium/high/critical)")
+    for row in summary['regions'][:top]:
+        print(f"  {row['region']:<16} {row['analyses']:>4}건  "
+              f"{row['low']}/{row['medium']}/{row['high']}/{row['critical']}  평균 {row['avg_total_score']}점")
+
+    for name, dist in summary['distributions'].items():
+        if dist['count']:
+            print(f"\n[{name}] {dist['count']}건  평균 {dist['mean']}  p10 {dist['p10']}  p50 {dist['p50']}  p90 {dist['p90']}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 전체 병원 컴플라이언스 집계')
+    parser.add_argument('--db', default=INDEX_FILE, help=f'분석 결과 인덱스 (기본: {INDEX_FILE})')
+    parser.add_argument('--results-dir', default=RESULTS_DIR, help='분석 결과 디렉토리')
+    parser.add_argument('--no-ingest', action='store_true', help='집계 전에 인덱스를 증분 수집하지 않음')
+    parser.add_argument('--out', default=OUTPUT_DIR, help=f'결과 디렉토리 (기본: {OUTPUT_DIR})')
+    parser.add_argument('--top', type=int, default=10, help='화면에 출력할 상위 항목 수')
+
+    args = parser.parse_args()
+
+    if np is None:
+        print("[ERROR] numpy가 설치되어 있지 않습니다.")
+        print("  pip install -r scripts/requirements.txt  (또는 pip install numpy)")
+        return 1
+
+    print("=" * 60)
+    print("MEDCHECKER 컴플라이언스 집계")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+
+    with AnalysisIndex(args.db, args.results_dir) as index:
+        if not args.no_ingest:
+            stats = index.ingest()
+            print(f"[INFO] 인덱스 수집: 추가 {stats['added']} / 갱신 {stats['updated']} / 삭제 {stats['removed']}")
+        started = time.perf_counter()
+        summary = analyze(index)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print_summary(summary, args.top)
+    written = write_outputs(summary, args.out)
+    print(f"\n[OK] 집계 {elapsed_ms:.1f}ms, 저장: {', '.join(os.path.basename(path) for path in written)} ({args.out})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
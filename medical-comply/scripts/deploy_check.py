@@ -1,69 +1,114 @@
 #!/usr/bin/env python3
 """
 MEDCHECKER 배포 전 종합 검사 스크립트
-모든 검사 스크립트를 순차적으로 실행합니다.
-
-실행 순서:
-1. 코드 품질 검사 (lint_and_fix.py)
-2. 서버 재시작 (auto_restart.py)
-3. 헬스 체크 (healthcheck.py)
+검사 단계를 의존성 그래프로 구성하여 독립적인 단계는 동시에 실행합니다.
+
+단계 및 의존 관계:
+1. 코드 품질 검사 - Python / ESLint / TypeScript (서로 독립, 실패해도 계속 진행)
+2. 프론트엔드 빌드 (ESLint 자동 수정이 끝난 뒤 실행)
+3. 서버 재시작 (빌드 성공 후)
+4. 헬스 체크 (재시작 후)
+5. 성능 회귀 검사 (헬스 체크 후) - 빌드 시간, 번들 크기, 서버 준비 시간, 지연 시간을
+   perf_history.jsonl에 기록하고 최근 기록 대비 허용치를 넘게 나빠지면 실패
+6. hospitals.json 증분 내보내기 (--export-hospitals 지정 시, 독립) - 바뀐 경우에만
+   새 버전 스냅샷(.gz/.br)과 직전 버전 대비 델타를 medchecker/frontend/public/data/hospitals/에
+   저장 (hospital_delta.py, git 추적 제외). 아직 manifest.json/델타를 읽는 프론트엔드 코드는 없음
+
+실패한 단계는 그 단계에 의존하는 단계만 건너뛰며,
+마지막에 단계별 소요 시간과 임계 경로를 출력합니다.
+재시작/헬스 체크가 실패하면 요약 뒤에 서버 로그 최근 줄을 출력합니다.
 """
 
-import subprocess
 import sys
 import os
-import time
 from datetime import datetime
 
+import hospital_delta
+import perf_gate
+import service_logs
+from task_graph import Task, TaskGraph
+
 # 프로젝트 경로
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+FRONTEND_DIR = os.path.join(PROJECT_DIR, 'frontend')
+
+# 실패 시 로그를 출력할 서버 단계와 로그 이름
+SERVER_STAGES = ('restart', 'healthcheck')
+SERVER_LOGS = ('backend', 'frontend')
+LOG_TAIL_LINES = 30
+
+def script_task(name, label, script_name, args=(), deps=(), soft=False):
+    """scripts/ 아래 파이썬 스크립트를 실행하는 단계"""
+    return Task(
+        name, label,
+        cmd=[sys.executable, os.path.join(SCRIPT_DIR, script_name), *args],
+        cwd=SCRIPT_DIR, deps=deps, soft=soft,
+    )
+
+def lint_tasks():
+    """lint_and_fix.py를 검사 종류별로 나눈 단계 (서로 독립)"""
+    return [
+        script_task('lint-python', 'Python 문법 검사', 'lint_and_fix.py', ['--python-only'], soft=True),
+        script_task('lint-eslint', 'ESLint 검사', 'lint_and_fix.py', ['--eslint-only'], soft=True),
+        script_task('lint-ts', 'TypeScript 검사', 'lint_and_fix.py', ['--typescript-only'], soft=True),
+    ]
+
+def build_task(deps=()):
+    """프론트엔드 빌드 단계 (디렉토리가 없으면 통과 처리)"""
+    if not os.path.exists(FRONTEND_DIR):
+        print("[SKIP] 프론트엔드 디렉토리 없음 - 빌드 단계 통과 처리")
+        return Task('build', '프론트엔드 빌드', func=lambda: True, deps=deps)
+    return Task('build', '프론트엔드 빌드', cmd=['npm', 'run', 'build'], cwd=FRONTEND_DIR, deps=deps)
+
+def perf_task(graph, since, threshold, deps=()):
+    """성능 회귀 검사 단계 - 빌드 시간은 같은 실행의 빌드 단계 결과에서 가져옴"""
+    def run():
+        build = graph.results.get('build')
+        build_seconds = None
+        if build and build.status == 'passed' and graph.tasks['build'].cmd:
+            build_seconds = build.duration
+        return perf_gate.run_gate(build_seconds, since=since, threshold=threshold)
+    return Task('perf', '성능 회귀 검사', func=run, deps=deps)
+
+def export_task():
+    """hospitals.json 증분 내보내기 단계 (다른 단계와 무관하게 실행)"""
+    return Task('export-hospitals', 'hospitals.json 증분 내보내기', func=hospital_delta.run_export)
+
+def build_graph(args, since=None):
+    """명령행 옵션에 맞는 단계 그래프 구성"""
+    graph = TaskGraph()
+    run_lint = args.lint_only or not (args.skip_lint or args.quick)
+
+    if run_lint:
+        for task in lint_tasks():
+            graph.add(task)
+    if args.lint_only:
+        return graph
 
-def run_script(script_name, args="", description=""):
-    """스크립트 실행"""
-    script_path = os.path.join(SCRIPT_DIR, script_name)
+    if args.export_hospitals and not args.quick:
+        graph.add(export_task())
 
-    print("\n" + "=" * 60)
-    print(f"[실행] {description}")
-    print(f"스크립트: {script_name} {args}")
-    print("=" * 60 + "\n")
-
-    if not os.path.exists(script_path):
-        print(f"[ERROR] 스크립트를 찾을 수 없습니다: {script_path}")
-        return False
-
-    try:
-        result = subprocess.run(
-            f"python3 {script_path} {args}",
-            shell=True,
-            cwd=SCRIPT_DIR
-        )
-        return result.returncode == 0
-    except Exception as e:
-        print(f"[ERROR] 스크립트 실행 실패: {e}")
-        return False
-
-def run_npm_build():
-    """프론트엔드 빌드"""
-    print("\n" + "=" * 60)
-    print("[실행] 프론트엔드 빌드")
-    print("=" * 60 + "\n")
-
-    frontend_dir = os.path.join(PROJECT_DIR, 'frontend')
-    if not os.path.exists(frontend_dir):
-        print("[SKIP] 프론트엔드 디렉토리 없음")
-        return True
-
-    try:
-        result = subprocess.run(
-            "npm run build",
-            shell=True,
-            cwd=frontend_dir
-        )
-        return result.returncode == 0
-    except Exception as e:
-        print(f"[ERROR] 빌드 실패: {e}")
-        return False
+    last = ()
+    if not (args.skip_build or args.quick):
+        # ESLint --fix가 빌드 입력 파일을 수정하므로 ESLint 이후에 빌드
+        graph.add(build_task(deps=('lint-eslint',) if run_lint else ()))
+        last = ('build',)
+
+    # 서버 재시작 (auto_restart.py가 서버 준비 완료까지 대기)
+    if not args.skip_restart:
+        if args.rolling:
+            graph.add(script_task('restart', '백엔드 무중단 재시작', 'auto_restart.py', ['--rolling'], deps=last))
+        else:
+            graph.add(script_task('restart', '서버 재시작', 'auto_restart.py', deps=last))
+        last = ('restart',)
+
+    # 서버 로그는 요약 뒤에 한 번만 출력
+    graph.add(script_task('healthcheck', '헬스 체크', 'healthcheck.py', ['--no-logs'], deps=last))
+
+    if not (args.skip_perf or args.quick):
+        graph.add(perf_task(graph, since, args.perf_threshold, deps=('healthcheck',)))
+    return graph
 
 def main():
     import argparse
@@ -71,9 +116,17 @@ def main():
     parser = argparse.ArgumentParser(description='MEDCHECKER 배포 전 종합 검사')
     parser.add_argument('--skip-lint', action='store_true', help='린트 검사 건너뛰기')
     parser.add_argument('--skip-build', action='store_true', help='빌드 건너뛰기')
+    parser.add_argument('--export-hospitals', action='store_true',
+                        help='hospitals.json 증분 내보내기 단계 추가 (medchecker/frontend/public/data/hospitals/)')
     parser.add_argument('--skip-restart', action='store_true', help='서버 재시작 건너뛰기')
-    parser.add_argument('--quick', action='store_true', help='빠른 검사 (린트, 빌드 건너뛰기)')
+    parser.add_argument('--rolling', action='store_true', help='백엔드만 무중단 재시작 (auto_restart.py --rolling)')
+    parser.add_argument('--quick', action='store_true', help='빠른 검사 (린트, 빌드, 내보내기, 성능 검사 건너뛰기)')
     parser.add_argument('--lint-only', action='store_true', help='린트 검사만 실행')
+    parser.add_argument('--skip-perf', action='store_true', help='성능 회귀 검사 건너뛰기')
+    parser.add_argument('--perf-threshold', type=float, default=perf_gate.THRESHOLD,
+                        help=f'성능 지표 허용 악화율 (%%, 기본: {perf_gate.THRESHOLD:g})')
+    parser.add_argument('--jobs', type=int, default=0,
+                        help='동시에 실행할 최대 단계 수 (기본: 제한 없음, 1이면 순차 실행)')
 
     args = parser.parse_args()
 
@@ -84,41 +137,8 @@ def main():
     print(f"시작 시간: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
-    results = []
-
-    # 린트 검사만
-    if args.lint_only:
-        success = run_script("lint_and_fix.py", "", "코드 품질 검사")
-        results.append(("코드 품질 검사", success))
-    else:
-        # 1. 코드 품질 검사
-        if not args.skip_lint and not args.quick:
-            success = run_script("lint_and_fix.py", "", "코드 품질 검사")
-            results.append(("코드 품질 검사", success))
-            if not success:
-                print("\n[WARNING] 코드 품질 검사에서 문제가 발견되었습니다.")
-                print("계속 진행합니다...")
-
-        # 2. 프론트엔드 빌드
-        if not args.skip_build and not args.quick:
-            success = run_npm_build()
-            results.append(("프론트엔드 빌드", success))
-            if not success:
-                print("\n[ERROR] 빌드 실패! 배포를 중단합니다.")
-                return 1
-
-        # 3. 서버 재시작
-        if not args.skip_restart:
-            success = run_script("auto_restart.py", "", "서버 재시작")
-            results.append(("서버 재시작", success))
-
-            # 서버 시작 대기
-            print("\n서버 안정화 대기 중 (5초)...")
-            time.sleep(5)
-
-        # 4. 헬스 체크
-        success = run_script("healthcheck.py", "", "서버 상태 확인")
-        results.append(("헬스 체크", success))
+    graph = build_graph(args, since=start_time.timestamp())
+    results = graph.run(max_workers=args.jobs or None)
 
     # 결과 요약
     end_time = datetime.now()
@@ -129,11 +149,24 @@ def main():
     print("=" * 60)
 
     all_passed = True
-    for name, passed in results:
-        status = "[PASS]" if passed else "[FAIL]"
-        print(f"  {status} {name}")
-        if not passed:
+    for name, task in graph.tasks.items():
+        result = results[name]
+        if result.status == 'passed':
+            print(f"  [PASS] {task.label}")
+        elif result.status == 'skipped':
+            print(f"  [SKIP] {task.label} ({result.reason})")
             all_passed = False
+        else:
+            note = " (경고 - 계속 진행)" if task.soft else ""
+            print(f"  [FAIL] {task.label}{note}")
+            all_passed = False
+
+    graph.print_timing()
+
+    if any(results[name].status == 'failed' for name in SERVER_STAGES if name in results):
+        print("\n[서버 로그]")
+        if not any([service_logs.print_tail(name, LOG_TAIL_LINES) for name in SERVER_LOGS]):
+            print(f"  기록된 로그 없음 ({service_logs.LOG_DIR})")
 
     print(f"\n소요 시간: {duration:.1f}초")
     print("=" * 60)
@@ -3,63 +3,485 @@
 MEDCHECKER 서버 상태 확인 스크립트
 - 백엔드 서버 (기본 포트: 5000)
 - 프론트엔드 서버 (기본 포트: 5173)
+- 추가 대상 (HEALTHCHECK_TARGETS 환경변수 또는 --config 파일)
+- 다중 인스턴스 (--fleet 또는 BACKEND_INSTANCES 환경변수)
+- 지연 시간 측정 (--samples / --duration: connect/TTFB/total 백분위수)
+- 상시 감시 (--watch: 롤링 윈도우 가용성/지연 SLO 평가, 위반 시에만 알림)
+- 백엔드/프론트엔드 확인 실패 시 서버 로그(service_logs) 최근 줄 출력
+
+모든 대상을 asyncio로 동시에 확인하므로 전체 소요 시간은
+가장 느린 대상 하나의 응답 시간(최대 전체 제한 시간)으로 제한됩니다.
 """
 
-import requests
+import asyncio
+import json
+import math
+import signal
 import sys
 import os
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 
+from http_probe import ConnectionPool, HttpResponse, fetch
+from latency import LatencyHistogram
+
 # 환경변수에서 포트 설정 (기본값 사용)
 BACKEND_PORT = int(os.getenv('BACKEND_PORT', 5000))
 FRONTEND_PORT = int(os.getenv('FRONTEND_PORT', 5173))
 BACKEND_HOST = os.getenv('BACKEND_HOST', 'localhost')
 FRONTEND_HOST = os.getenv('FRONTEND_HOST', 'localhost')
 
-def check_backend():
-    """백엔드 서버 상태 확인"""
-    url = f"http://{BACKEND_HOST}:{BACKEND_PORT}/api/health"
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
+# 대상별 제한 시간 / 전체 제한 시간 (초)
+PROBE_TIMEOUT = float(os.getenv('HEALTHCHECK_TIMEOUT', 10))
+TOTAL_BUDGET = float(os.getenv('HEALTHCHECK_BUDGET', 15))
+
+# 실패 시 출력할 서버 로그 줄 수
+LOG_TAIL_LINES = int(os.getenv('HEALTHCHECK_LOG_LINES', 20))
+
+
+@dataclass
+class Target:
+    """헬스 체크 대상"""
+    name: str
+    url: str
+    kind: str = 'http'      # 'api': /api/health JSON 응답 (상태/DB 필드 출력)
+    timeout: float = PROBE_TIMEOUT
+    port: int = None
+    log: str = None         # 실패 시 최근 줄을 출력할 서버 로그 이름 (service_logs)
+
+
+def backend_target(timeout=PROBE_TIMEOUT):
+    return Target('백엔드', f"http://{BACKEND_HOST}:{BACKEND_PORT}/api/health",
+                  kind='api', timeout=timeout, port=BACKEND_PORT, log='backend')
+
+
+def frontend_target(timeout=PROBE_TIMEOUT):
+    return Target('프론트엔드', f"http://{FRONTEND_HOST}:{FRONTEND_PORT}",
+                  timeout=timeout, port=FRONTEND_PORT, log='frontend')
+
+
+def _make_target(name, url, timeout, kind=None):
+    if kind is None:
+        kind = 'api' if url.rstrip('/').endswith('/api/health') else 'http'
+    return Target(name, url, kind=kind, timeout=float(timeout))
+
+
+def load_extra_targets(config_path=None, timeout=PROBE_TIMEOUT):
+    """추가 대상 로드
+
+    - HEALTHCHECK_TARGETS="이름=URL,이름2=URL2"
+    - 설정 파일 (JSON): {"budget": 20, "targets": [{"name", "url", "timeout", "kind"}]}
+    반환: (대상 목록, 설정 파일의 budget 또는 None)
+    """
+    targets = []
+    budget = None
+
+    for item in os.getenv('HEALTHCHECK_TARGETS', '').split(','):
+        name, sep, url = item.strip().partition('=')
+        if sep and url:
+            targets.append(_make_target(name.strip(), url.strip(), timeout))
+
+    config_path = config_path or os.getenv('HEALTHCHECK_CONFIG')
+    if config_path:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        budget = config.get('budget')
+        for item in config.get('targets', []):
+            targets.append(_make_target(
+                item['name'], item['url'], item.get('timeout', timeout), item.get('kind')
+            ))
+
+    return targets, budget
+
+
+def fleet_targets(urls, timeout=PROBE_TIMEOUT):
+    """인스턴스 기본 URL 목록 -> /api/health 대상 목록"""
+    targets = []
+    for url in urls:
+        url = url.strip().rstrip('/')
+        if not url:
+            continue
+        if '://' not in url:
+            url = f'http://{url}'
+        health_url = url if url.endswith('/api/health') else f'{url}/api/health'
+        targets.append(Target(url, health_url, kind='api', timeout=timeout))
+    return targets
+
+
+async def probe(target, pool=None):
+    """단일 대상 확인 (대상별 제한 시간 적용)"""
+    return await fetch(target.url, timeout=target.timeout, pool=pool)
+
+
+async def probe_all(targets, budget=TOTAL_BUDGET, pool=None):
+    """모든 대상을 동시에 확인 - 전체 제한 시간을 넘긴 대상은 시간 초과 처리"""
+    tasks = [asyncio.ensure_future(probe(target, pool)) for target in targets]
+    if not tasks:
+        return []
+
+    done, pending = await asyncio.wait(tasks, timeout=budget)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    responses = []
+    for target, task in zip(targets, tasks):
+        if task in done:
+            responses.append(task.result())
+        else:
+            responses.append(HttpResponse(
+                target.url, error='timeout', detail=f'전체 제한 시간 {budget:g}초 초과',
+                total_ms=budget * 1000
+            ))
+    return responses
+
+
+def report(target, response, show_logs=True):
+    """프로브 결과 출력 후 정상 여부 반환 (실패 시 서버 로그 최근 줄 출력)"""
+    where = f"포트: {target.port}" if target.port else target.url
+
+    if response.ok:
+        print(f"[OK] {target.name} 서버 정상 ({where})")
+        if target.kind == 'api':
             data = response.json()
-            print(f"[OK] 백엔드 서버 정상 (포트: {BACKEND_PORT})")
             print(f"     - 상태: {data.get('status', 'unknown')}")
             print(f"     - DB: {data.get('database', 'unknown')}")
-            return True
-        else:
-            print(f"[ERROR] 백엔드 서버 응답 오류 (HTTP {response.status_code})")
-            return False
-    except requests.exceptions.ConnectionError:
-        print(f"[ERROR] 백엔드 서버 연결 실패 (포트: {BACKEND_PORT})")
-        return False
-    except requests.exceptions.Timeout:
-        print(f"[ERROR] 백엔드 서버 응답 시간 초과")
-        return False
-    except Exception as e:
-        print(f"[ERROR] 백엔드 체크 실패: {e}")
-        return False
+        print(f"     - 응답 시간: {response.total_ms:.0f}ms")
+        return True
+
+    if response.error is None:
+        print(f"[ERROR] {target.name} 서버 응답 오류 (HTTP {response.status})")
+    elif response.error == 'connect':
+        print(f"[ERROR] {target.name} 서버 연결 실패 ({where})")
+    elif response.error == 'timeout':
+        print(f"[ERROR] {target.name} 서버 응답 시간 초과 ({response.detail})")
+    else:
+        print(f"[ERROR] {target.name} 체크 실패: {response.detail}")
+    if show_logs and target.log:
+        import service_logs
+        service_logs.print_tail(target.log, LOG_TAIL_LINES)
+    return False
+
+
+def check_backend():
+    """백엔드 서버 상태 확인"""
+    target = backend_target()
+    return report(target, asyncio.run(probe(target)))
+
 
 def check_frontend():
     """프론트엔드 서버 상태 확인"""
-    url = f"http://{FRONTEND_HOST}:{FRONTEND_PORT}"
+    target = frontend_target()
+    return report(target, asyncio.run(probe(target)))
+
+
+async def probe_fleet(targets, budget=TOTAL_BUDGET):
+    """모든 인스턴스를 동시에 한 번씩 확인
+
+    인스턴스마다 요청이 한 번뿐이라 연결 풀은 쓰지 않음 (재사용할 연결이 없음).
+    반복 확인(--watch)과 지연 측정(--samples)은 keep-alive 풀을 유지합니다.
+    """
+    return await probe_all(targets, budget)
+
+
+def summarize_fleet(targets, responses):
+    """인스턴스별 결과를 하나의 문서로 집계"""
+    instances = []
+    databases = {}
+    for target, response in zip(targets, responses):
+        data = response.json() if response.ok else {}
+        database = data.get('database', 'unknown') if response.ok else None
+        if database:
+            databases[database] = databases.get(database, 0) + 1
+        instances.append({
+            'instance': target.name,
+            'ok': response.ok,
+            'http_status': response.status or None,
+            'status': data.get('status') if response.ok else None,
+            'database': database,
+            'latency_ms': round(response.total_ms, 1) if response.total_ms is not None else None,
+            'error': response.error,
+            'detail': response.detail or None,
+        })
+
+    healthy = sum(1 for item in instances if item['ok'])
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'total': len(instances),
+        'healthy': healthy,
+        'unhealthy': len(instances) - healthy,
+        'databases': databases,
+        'instances': instances,
+    }
+
+
+ERROR_LABELS = {'connect': '연결 실패', 'timeout': '시간 초과', 'protocol': '응답 오류', 'error': '체크 실패'}
+
+
+def print_fleet(summary):
+    """인스턴스 집계 표 출력"""
+    width = max([len('인스턴스')] + [len(item['instance']) for item in summary['instances']])
+    print(f"  {'인스턴스'.ljust(width)}  상태    HTTP  DB            응답(ms)")
+    print("  " + "-" * (width + 40))
+    for item in summary['instances']:
+        status = "[OK]  " if item['ok'] else "[FAIL]"
+        http_status = str(item['http_status'] or '-')
+        latency = f"{item['latency_ms']:.0f}" if item['latency_ms'] is not None else '-'
+        database = item['database'] or ERROR_LABELS.get(item['error'], item['error'] or '-')
+        print(f"  {item['instance'].ljust(width)}  {status}  {http_status:<4}  {database:<12}  {latency:>8}")
+
+    databases = ', '.join(f"{name} {count}" for name, count in sorted(summary['databases'].items()))
+    print()
+    print(f"정상: {summary['healthy']}/{summary['total']}" + (f" (DB: {databases})" if databases else ""))
+
+
+def run_fleet(urls, timeout, budget, as_json=False):
+    """다중 인스턴스 모드 실행"""
+    targets = fleet_targets(urls, timeout)
+    if not targets:
+        print("[ERROR] 확인할 인스턴스가 없습니다. --fleet 또는 BACKEND_INSTANCES를 지정하세요.")
+        return 1
+
+    responses = asyncio.run(probe_fleet(targets, budget))
+    summary = summarize_fleet(targets, responses)
+
+    if as_json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print("=" * 50)
+        print(f"MEDCHECKER 인스턴스 상태 확인 ({len(targets)}개)")
+        print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("=" * 50)
+        print_fleet(summary)
+        print("=" * 50)
+
+    return 0 if summary['unhealthy'] == 0 else 1
+
+
+LATENCY_PHASES = ('connect', 'ttfb', 'total')
+
+
+async def sample_latency(url, samples=None, duration=None, concurrency=1,
+                         timeout=PROBE_TIMEOUT, keepalive=False):
+    """반복 프로브로 단계별 지연 시간 수집
+
+    samples 횟수 또는 duration 초 동안 concurrency개 워커가 요청을 보냅니다.
+    keepalive가 아니면 매 요청마다 새 연결을 열어 connect 시간도 측정합니다.
+    """
+    histograms = {phase: LatencyHistogram() for phase in LATENCY_PHASES}
+    errors = {}
+    issued = 0
+    deadline = time.perf_counter() + duration if duration else None
+    pool = ConnectionPool() if keepalive else None
+
+    async def worker():
+        nonlocal issued
+        while True:
+            if samples is not None and issued >= samples:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            issued += 1
+
+            response = await fetch(url, timeout=timeout, pool=pool)
+            if response.ok:
+                # 재사용 연결은 connect 단계가 없으므로 connect 분포에서 제외
+                if not response.reused:
+                    histograms['connect'].record(response.connect_ms)
+                histograms['ttfb'].record(response.ttfb_ms)
+                histograms['total'].record(response.total_ms)
+            else:
+                kind = response.error or f'http_{response.status}'
+                errors[kind] = errors.get(kind, 0) + 1
+
+    started = time.perf_counter()
     try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200:
-            print(f"[OK] 프론트엔드 서버 정상 (포트: {FRONTEND_PORT})")
-            return True
-        else:
-            print(f"[ERROR] 프론트엔드 서버 응답 오류 (HTTP {response.status_code})")
-            return False
-    except requests.exceptions.ConnectionError:
-        print(f"[ERROR] 프론트엔드 서버 연결 실패 (포트: {FRONTEND_PORT})")
-        return False
-    except requests.exceptions.Timeout:
-        print(f"[ERROR] 프론트엔드 서버 응답 시간 초과")
-        return False
-    except Exception as e:
-        print(f"[ERROR] 프론트엔드 체크 실패: {e}")
-        return False
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    finally:
+        if pool:
+            await pool.close()
+
+    return {
+        'url': url,
+        'timestamp': datetime.now().isoformat(),
+        'requests': issued,
+        'errors': errors,
+        'elapsed_s': round(time.perf_counter() - started, 3),
+        'histograms': histograms,
+    }
+
+
+def print_latency(result):
+    """단계별 백분위수 표와 total 히스토그램 출력"""
+    histograms = result['histograms']
+    error_count = sum(result['errors'].values())
+
+    print(f"대상: {result['url']}")
+    print(f"요청: {result['requests']}회 / 오류: {error_count}회 / 소요: {result['elapsed_s']:.1f}초")
+    for kind, count in sorted(result['errors'].items()):
+        print(f"  - {ERROR_LABELS.get(kind, kind)}: {count}회")
+
+    print("\n[단계별 지연 시간 (ms)]")
+    print(f"  {'단계':<8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for phase in LATENCY_PHASES:
+        summary = histograms[phase].summary()
+        if not summary['count']:
+            continue
+        values = ''.join(f"{summary[key]:>9.1f}" for key in ('p50', 'p95', 'p99', 'max'))
+        print(f"  {phase:<8}{values}")
+
+    total = histograms['total']
+    if total.count:
+        print("\n[total 백분위 분포]")
+        for p, value, count in total.percentile_ladder():
+            print(f"  {p:>6g}%  {value:>9.2f}ms  ({count})")
+        print("\n[total 히스토그램]")
+        for line in total.ascii_chart():
+            print(f"  {line}")
+
+
+def latency_to_dict(result):
+    """JSON 저장용 변환"""
+    data = {key: value for key, value in result.items() if key != 'histograms'}
+    data['phases'] = {phase: hist.to_dict() for phase, hist in result['histograms'].items()}
+    return data
+
+
+def run_latency(url, samples, duration, concurrency, timeout, keepalive, json_out=None):
+    """지연 시간 측정 모드 실행"""
+    print("=" * 50)
+    print("MEDCHECKER 지연 시간 측정")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
+
+    if samples is None and duration is None:
+        samples = 100
+    result = asyncio.run(sample_latency(url, samples, duration, concurrency, timeout, keepalive))
+    print_latency(result)
+
+    if json_out:
+        with open(json_out, 'w', encoding='utf-8') as f:
+            json.dump(latency_to_dict(result), f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {json_out}")
+
+    print("=" * 50)
+    return 0 if result['requests'] and not result['errors'] else 1
+
+
+class SloWindow:
+    """대상별 롤링 윈도우 - 고정 크기 링 버퍼로 가용성/지연 SLO 평가
+
+    버퍼 크기는 window / interval 로 고정되므로 장기 실행 시에도 메모리가 일정합니다.
+    """
+
+    def __init__(self, window, interval, min_samples=5):
+        self.window = window
+        self.samples = deque(maxlen=max(1, math.ceil(window / interval)) + 1)
+        self.min_samples = min(min_samples, self.samples.maxlen)
+        self.breached = False
+
+    def add(self, timestamp, ok, latency_ms):
+        self.samples.append((timestamp, ok, latency_ms))
+
+    def evaluate(self, now, availability_target, p95_target=None):
+        """윈도우 내 표본으로 SLO 평가 -> {'samples', 'availability', 'p95', 'violations'}"""
+        while self.samples and self.samples[0][0] < now - self.window:
+            self.samples.popleft()
+
+        count = len(self.samples)
+        histogram = LatencyHistogram()
+        ok_count = 0
+        for _, ok, latency_ms in self.samples:
+            if ok:
+                ok_count += 1
+                histogram.record(latency_ms)
+
+        availability = ok_count / count * 100 if count else None
+        p95 = histogram.percentile(95)
+        violations = []
+        if count >= self.min_samples:
+            if availability < availability_target:
+                violations.append(f"가용성 {availability:.2f}% < {availability_target:g}%")
+            if p95_target is not None and p95 is not None and p95 > p95_target:
+                violations.append(f"p95 {p95:.0f}ms > {p95_target:g}ms")
+
+        return {'samples': count, 'availability': availability, 'p95': p95, 'violations': violations}
+
+
+async def watch(targets, interval, window, availability_target, p95_target=None,
+                exit_on_breach=False, verbose=False):
+    """상시 감시 루프 - 하나의 keep-alive 연결 풀로 interval초마다 확인
+
+    SLO 위반이 시작/해소될 때만 [ALERT]/[RECOVERED] 줄을 출력합니다.
+    반환: 종료 시점에 위반 중인 대상이 있거나 exit_on_breach로 중단하면 1, 아니면 0
+    """
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    pool = ConnectionPool()
+    windows = {target.name: SloWindow(window, interval) for target in targets}
+    next_tick = loop.time()
+
+    try:
+        while not stop.is_set():
+            responses = await probe_all(targets, budget=interval, pool=pool)
+            now = time.time()
+            stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+            for target, response in zip(targets, responses):
+                slo = windows[target.name]
+                slo.add(now, response.ok, response.total_ms)
+                state = slo.evaluate(now, availability_target, p95_target)
+                scope = f"최근 {window:g}초, {state['samples']}회"
+
+                if state['violations'] and not slo.breached:
+                    slo.breached = True
+                    print(f"[ALERT] {stamp} {target.name} SLO 위반 ({scope}): "
+                          + ', '.join(state['violations']), flush=True)
+                    if exit_on_breach:
+                        return 1
+                elif not state['violations'] and slo.breached:
+                    slo.breached = False
+                    print(f"[RECOVERED] {stamp} {target.name} SLO 회복 ({scope})", flush=True)
+                elif verbose:
+                    status = "OK" if response.ok else ERROR_LABELS.get(response.error, f"HTTP {response.status}")
+                    availability = f"{state['availability']:.2f}%" if state['availability'] is not None else '-'
+                    print(f"[{stamp}] {target.name}: {status} {response.total_ms:.0f}ms "
+                          f"(가용성 {availability})", flush=True)
+
+            next_tick += interval
+            try:
+                await asyncio.wait_for(stop.wait(), max(0, next_tick - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await pool.close()
+
+    return 1 if any(slo.breached for slo in windows.values()) else 0
+
+
+def run_watch(targets, args):
+    """상시 감시 모드 실행"""
+    p95 = f", p95 < {args.slo_p95:g}ms" if args.slo_p95 else ""
+    print(f"MEDCHECKER 상시 감시 시작 - {len(targets)}개 대상, {args.interval:g}초 간격, "
+          f"SLO: 가용성 {args.slo_availability:g}%{p95} / {args.window:g}초 윈도우", flush=True)
+    for target in targets:
+        target.timeout = min(target.timeout, args.interval)
+    try:
+        return asyncio.run(watch(
+            targets, args.interval, args.window, args.slo_availability, args.slo_p95,
+            exit_on_breach=args.exit_on_breach, verbose=args.verbose
+        ))
+    except KeyboardInterrupt:
+        return 0
+
 
 def check_port_in_use(port):
     """특정 포트가 사용 중인지 확인"""
@@ -67,26 +489,71 @@ def check_port_in_use(port):
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         return s.connect_ex(('localhost', port)) == 0
 
+
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 서버 상태 확인')
+    parser.add_argument('--config', help='추가 대상 설정 파일 (JSON)')
+    parser.add_argument('--timeout', type=float, default=PROBE_TIMEOUT, help='대상별 제한 시간 (초)')
+    parser.add_argument('--budget', type=float, help=f'전체 제한 시간 (초, 기본값: {TOTAL_BUDGET:g})')
+    parser.add_argument('--fleet', nargs='*', metavar='URL',
+                        help='다중 인스턴스 모드 (URL 생략 시 BACKEND_INSTANCES 사용)')
+    parser.add_argument('--fleet-file', help='인스턴스 URL 목록 파일 (한 줄에 하나)')
+    parser.add_argument('--json', action='store_true', help='다중 인스턴스 결과를 JSON으로 출력')
+    parser.add_argument('--samples', type=int, help='지연 시간 측정: 요청 횟수')
+    parser.add_argument('--duration', type=float, help='지연 시간 측정: 측정 시간 (초)')
+    parser.add_argument('--concurrency', type=int, default=1, help='지연 시간 측정: 동시 요청 수')
+    parser.add_argument('--url', help='지연 시간 측정 대상 (기본값: 백엔드 /api/health)')
+    parser.add_argument('--keepalive', action='store_true', help='지연 시간 측정 시 연결 재사용')
+    parser.add_argument('--json-out', help='지연 시간 측정 결과 JSON 저장 경로')
+    parser.add_argument('--watch', action='store_true', help='상시 감시 모드 (SLO 위반 시에만 알림)')
+    parser.add_argument('--interval', type=float, default=10, help='상시 감시: 확인 간격 (초)')
+    parser.add_argument('--window', type=float, default=300, help='상시 감시: SLO 평가 윈도우 (초)')
+    parser.add_argument('--slo-availability', type=float, default=99.9, help='상시 감시: 가용성 목표 (%%)')
+    parser.add_argument('--slo-p95', type=float, help='상시 감시: p95 지연 목표 (ms)')
+    parser.add_argument('--exit-on-breach', action='store_true', help='상시 감시: SLO 위반 시 즉시 종료 (코드 1)')
+    parser.add_argument('--verbose', action='store_true', help='상시 감시: 매 확인 결과 출력')
+    parser.add_argument('--no-logs', action='store_true', help='실패 시 서버 로그 출력 안함')
+
+    args = parser.parse_args()
+
+    if args.samples is not None or args.duration is not None:
+        url = args.url or backend_target().url
+        return run_latency(url, args.samples, args.duration, args.concurrency,
+                           args.timeout, args.keepalive, args.json_out)
+
+    if args.fleet is not None or args.fleet_file:
+        urls = list(args.fleet or [])
+        if args.fleet_file:
+            with open(args.fleet_file, 'r', encoding='utf-8') as f:
+                urls += [line for line in f.read().splitlines() if line.strip() and not line.startswith('#')]
+        if not urls:
+            urls = os.getenv('BACKEND_INSTANCES', '').split(',')
+        return run_fleet(urls, args.timeout, args.budget or TOTAL_BUDGET, args.json)
+
+    extra_targets, config_budget = load_extra_targets(args.config, args.timeout)
+    targets = [backend_target(args.timeout), frontend_target(args.timeout)] + extra_targets
+    budget = args.budget or config_budget or TOTAL_BUDGET
+
+    if args.watch:
+        if args.url:
+            targets = [_make_target(args.url, args.url, args.timeout)]
+        return run_watch(targets, args)
+
     print("=" * 50)
     print(f"MEDCHECKER 서버 상태 확인")
     print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
     print()
 
-    results = []
+    responses = asyncio.run(probe_all(targets, budget))
 
-    # 백엔드 체크
-    print("[백엔드 서버]")
-    backend_ok = check_backend()
-    results.append(('백엔드', backend_ok))
-    print()
-
-    # 프론트엔드 체크
-    print("[프론트엔드 서버]")
-    frontend_ok = check_frontend()
-    results.append(('프론트엔드', frontend_ok))
-    print()
+    results = []
+    for target, response in zip(targets, responses):
+        print(f"[{target.name} 서버]")
+        results.append((target.name, report(target, response, show_logs=not args.no_logs)))
+        print()
 
     # 결과 요약
     print("=" * 50)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 프론트엔드 hospitals.json 증분 내보내기
+hospitals.json이 바뀔 때마다 버전을 올리고, 직전 버전과의 차이(델타)만 따로 저장합니다.
+최근 버전을 가진 클라이언트는 전체 파일 대신 델타 몇 KB만 받으면 됩니다.
+
+출력 (public/data/hospitals/):
+  manifest.json          최신 버전, 버전별 스냅샷/델타 파일과 크기
+  v{N}.json              전체 스냅샷 (공백 없는 JSON) + .gz / .br 사전 압축본
+  delta-{N}.json         v{N-1} -> v{N} 차이: added(레코드), changed(id + 바뀐 필드), removed(id)
+
+클라이언트 갱신 순서:
+  1. manifest.json을 받아 latest와 내 버전 비교
+  2. 내 버전 >= oldest_delta - 1 이면 delta-{내 버전+1} ... delta-{latest} 순서로 적용
+  3. 아니면 (또는 델타 합계가 전체 압축본보다 크면) v{latest}.json.gz 전체 다운로드
+
+- 레코드 비교 키는 병원 id, 변경은 최상위 필드 단위 (set / unset)
+- 내용이 같으면 버전을 올리지 않음 (sha256 비교)
+- 파일은 .tmp에 쓴 뒤 교체하고, manifest.json은 마지막에 교체
+- brotli 패키지가 없으면 .br 압축은 건너뜀 (gzip만)
+- 출력 디렉토리는 배포 산출물이라 git 추적 제외 (medchecker/frontend/.gitignore)
+- 아직 manifest.json/델타를 읽는 프론트엔드 코드는 없음 (public/js는 hospitals.json 전체를 받음)
+  위 갱신 순서는 클라이언트를 붙일 때 따를 규약
+
+사용:
+  python3 hospital_delta.py                 # 변경분 내보내기
+  python3 hospital_delta.py --status        # 현재 버전 정보
+  python3 hospital_delta.py --keep 5 --history 60
+  python3 deploy_check.py --export-hospitals   # 배포 검사 단계로 실행
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+PUBLIC_DATA_DIR = os.path.join(REPO_DIR, 'medchecker', 'frontend', 'public', 'data')
+SOURCE_FILE = os.getenv('FRONTEND_HOSPITALS_FILE', os.path.join(PUBLIC_DATA_DIR, 'hospitals.json'))
+EXPORT_DIR = os.getenv('HOSPITALS_EXPORT_DIR', os.path.join(PUBLIC_DATA_DIR, 'hospitals'))
+MANIFEST_NAME = 'manifest.json'
+
+FORMAT_VERSION = 1
+KEEP_SNAPSHOTS = 3              # 전체 스냅샷 보관 개수 (롤백용)
+KEEP_HISTORY = 30               # 델타 보관 개수 - 이보다 오래된 클라이언트는 전체 다운로드
+
+
+def canonical(value):
+    """비교/해시용 JSON 직렬화 (키 정렬, 공백 없음)"""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def compact(value):
+    """배포용 JSON 직렬화 (원래 키 순서 유지, 공백 없음)"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_records(path=SOURCE_FILE):
+    with open(path, encoding='utf-8') as f:
+        records = json.load(f)
+    if not isinstance(records, list):
+        raise ValueError(f"병원 목록이 배열이 아님: {path}")
+    ids = [record.get('id') for record in records]
+    if None in ids:
+        raise ValueError(f"id 없는 병원 {ids.count(None)}건: {path}")
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"중복 id {len(ids) - len(set(ids))}건: {path}")
+    return records
+
+
+def diff(old_records, new_records):
+    """두 버전의 차이 -> (added, changed, removed)
+
+    changed 항목은 {'id', 'set': 바뀌거나 추가된 필드, 'unset': 없어진 필드 이름}
+    """
+    old_by_id = {record['id']: record for record in old_records}
+    new_ids = {record['id'] for record in new_records}
+
+    added, changed = [], []
+    for record in new_records:
+        before = old_by_id.get(record['id'])
+        if before is None:
+            added.append(record)
+            continue
+        fields = {key: value for key, value in record.items()
+                  if key not in before or canonical(before[key]) != canonical(value)}
+        missing = [key for key in before if key not in record]
+        if fields or missing:
+            entry = {'id': record['id'], 'set': fields}
+            if missing:
+                entry['unset'] = missing
+            changed.append(entry)
+    removed = [record['id'] for record in old_records if record['id'] not in new_ids]
+    return added, changed, removed
+
+
+def apply_delta(records, delta):
+    """델타 적용 (클라이언트 로직과 같음) - 새 버전 목록 반환"""
+    removed = set(delta['removed'])
+    by_id = {record['id']: dict(record) for record in records if record['id'] not in removed}
+    for entry in delta['changed']:
+        record = by_id[entry['id']]
+        record.update(entry['set'])
+        for key in entry.get('unset', ()):
+            record.pop(key, None)
+    for record in delta['added']:
+        by_id[record['id']] = record
+    return list(by_id.values())
+
+
+# --- 파일 ---
+
+def _write(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def load_manifest(out_dir=EXPORT_DIR):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def _snapshot_name(version):
+    return f'v{version}.json'
+
+
+def _delta_name(version):
+    return f'delta-{version}.json'
+
+
+def _load_snapshot(out_dir, version):
+    """직전 스냅샷 (없거나 손상되면 None -> 델타 없이 새 기준 버전)"""
+    try:
+        with open(os.path.join(out_dir, _snapshot_name(version)), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_snapshot(out_dir, version, payload):
+    """전체 스냅샷 + 사전 압축본 저장 -> 파일별 크기"""
+    name = _snapshot_name(version)
+    files = {'json': {'file': name, 'bytes': _write(os.path.join(out_dir, name), payload)}}
+    # mtime=0: 같은 내용이면 같은 .gz (CDN 캐시/ETag 유지)
+    data = gzip.compress(payload, compresslevel=9, mtime=0)
+    files['gzip'] = {'file': name + '.gz', 'bytes': _write(os.path.join(out_dir, name + '.gz'), data)}
+    if brotli is not None:
+        data = brotli.compress(payload, mode=brotli.MODE_TEXT, quality=11)
+        files['br'] = {'file': name + '.br', 'bytes': _write(os.path.join(out_dir, name + '.br'), data)}
+    return files
+
+
+def prune(out_dir, versions, keep, history):
+    """보관 개수를 넘은 스냅샷/델타 삭제 -> manifest에 남길 버전 목록"""
+    versions = versions[-history:] if history > 0 else versions[-1:]
+    snapshot_keep = {entry['version'] for entry in versions[-max(keep, 1):]}
+    delta_keep = {entry['version'] for entry in versions if entry.get('delta')}
+
+    for name in os.listdir(out_dir):
+        stem = name.split('.', 1)[0]
+        if stem.startswith('v') and stem[1:].isdigit() and int(stem[1:]) not in snapshot_keep:
+            os.remove(os.path.join(out_dir, name))
+        elif stem.startswith('delta-') and stem[6:].isdigit() and int(stem[6:]) not in delta_keep:
+            os.remove(os.path.join(out_dir, name))
+
+    for entry in versions:
+        if entry['version'] not in snapshot_keep:
+            entry.pop('snapshot', None)
+    return versions
+
+
+def export(source=SOURCE_FILE, out_dir=EXPORT_DIR, keep=KEEP_SNAPSHOTS, history=KEEP_HISTORY):
+    """hospitals.json 변경분 내보내기 -> 이번 버전 항목 (변경 없으면 None)"""
+    records = load_records(source)
+    payload = compact(records)
+    digest = hashlib.sha256(canonical(records).encode('utf-8')).hexdigest()
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir) or {'format': FORMAT_VERSION, 'latest': 0, 'versions': []}
+    latest = manifest['latest']
+    if latest and manifest['versions'] and manifest['versions'][-1]['sha256'] == digest \
+            and os.path.exists(os.path.join(out_dir, _snapshot_name(latest))):
+        return None
+
+    version = latest + 1
+    entry = {
+        'version': version,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'sha256': digest,
+        'count': len(records),
+        'snapshot': write_snapshot(out_dir, version, payload),
+        'delta': None,
+    }
+
+    previous = _load_snapshot(out_dir, latest) if latest else None
+    if previous is not None:
+        added, changed, removed = diff(previous, records)
+        delta = {'from': latest, 'to': version, 'added': added, 'changed': changed, 'removed': removed}
+        name = _delta_name(version)
+        entry['delta'] = {
+            'file': name,
+            'bytes': _write(os.path.join(out_dir, name), compact(delta)),
+            'added': len(added), 'changed': len(changed), 'removed': len(removed),
+        }
+
+    versions = prune(out_dir, manifest['versions'] + [entry], keep, history)
+    # 델타 사슬이 끊기지 않은 가장 오래된 버전 (이 버전 - 1 이상인 클라이언트는 델타로 갱신 가능)
+    oldest = version
+    for item in reversed(versions):
+        if not item.get('delta'):
+            break
+        oldest = item['version']
+    manifest = {
+        'format': FORMAT_VERSION,
+        'latest': version,
+        'sha256': digest,
+        'count': len(records),
+        'oldest_delta': oldest if entry['delta'] else None,
+        'full': entry['snapshot'],
+        'versions': versions,
+    }
+    _write(os.path.join(out_dir, MANIFEST_NAME), json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    return entry
+
+
+def run_export(source=SOURCE_FILE, out_dir=EXPORT_DIR, keep=KEEP_SNAPSHOTS, history=KEEP_HISTORY):
+    """deploy_check.py 단계용 - 결과 출력 후 성공 여부 반환"""
+    if not os.path.exists(source):
+        print(f"[SKIP] {source} 없음 - 내보내기 건너뜀")
+        return True
+    try:
+        entry = export(source, out_dir, keep, history)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] hospitals.json 내보내기 실패: {e}")
+        return False
+
+    if entry is None:
+        manifest = load_manifest(out_dir)
+        print(f"[OK] 변경 없음 - v{manifest['latest']} 유지 ({manifest['count']}곳)")
+        return True
+
+    sizes = ', '.join(f"{kind} {info['bytes'] / 1024:.1f}KB" for kind, info in entry['snapshot'].items())
+    print(f"[OK] v{entry['version']} 스냅샷 ({entry['count']}곳): {sizes}")
+    if brotli is None:
+        print("[INFO] brotli 패키지 없음 - .br 압축 생략")
+    delta = entry['delta']
+    if delta:
+        print(f"[OK] 델타 v{entry['version'] - 1} -> v{entry['version']}: "
+              f"추가 {delta['added']}, 변경 {delta['changed']}, 삭제 {delta['removed']} "
+              f"({delta['bytes'] / 1024:.1f}KB)")
+    else:
+        print("[INFO] 직전 스냅샷 없음 - 델타 없이 기준 버전 생성")
+    return True
+
+
+def print_status(out_dir=EXPORT_DIR):
+    manifest = load_manifest(out_dir)
+    if manifest is None:
+        print(f"[INFO] 내보낸 버전 없음 ({out_dir})")
+        return
+    print(f"최신 버전: v{manifest['latest']} ({manifest['count']}곳, sha256 {manifest['sha256'][:12]})")
+    print(f"델타 갱신 가능: v{manifest['oldest_delta'] - 1} 이후" if manifest['oldest_delta'] else "델타 없음")
+    print(f"\n{'버전':>6} {'생성':<20} {'병원':>5} {'추가':>5} {'변경':>5} {'삭제':>5} {'델타':>9} {'gzip':>9}")
+    for entry in manifest['versions']:
+        delta = entry.get('delta') or {}
+        gz = (entry.get('snapshot') or {}).get('gzip')
+        print(f"{'v' + str(entry['version']):>6} {entry['created']:<20} {entry['count']:>5} "
+              f"{delta.get('added', '-'):>5} {delta.get('changed', '-'):>5} {delta.get('removed', '-'):>5} "
+              f"{_kb(delta):>9} {_kb(gz):>9}")
+
+
+def _kb(info):
+    return f"{info['bytes'] / 1024:.1f}KB" if info else '-'
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER hospitals.json 증분 내보내기')
+    parser.add_argument('--source', default=SOURCE_FILE, help=f'원본 hospitals.json (기본: {SOURCE_FILE})')
+    parser.add_argument('--out', default=EXPORT_DIR, help=f'출력 디렉토리 (기본: {EXPORT_DIR})')
+    parser.add_argument('--keep', type=int, default=KEEP_SNAPSHOTS,
+                        help=f'전체 스냅샷 보관 개수 (기본: {KEEP_SNAPSHOTS})')
+    parser.add_argument('--history', type=int, default=KEEP_HISTORY,
+                        help=f'델타 보관 개수 (기본: {KEEP_HISTORY})')
+    parser.add_argument('--status', action='store_true', help='현재 버전 정보만 출력')
+    args = parser.parse_args()
+
+    if args.status:
+        print_status(args.out)
+        return 0
+
+    print("=" * 50)
+    print("hospitals.json 증분 내보내기")
+    print("=" * 50)
+    return 0 if run_export(args.source, args.out, args.keep, args.history) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
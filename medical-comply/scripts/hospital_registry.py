@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 병원 레지스트리 (메모리 맵 바이너리)
+hospitals.json을 한 번 변환해 두고, 전체를 파싱하지 않고 필요한 병원만 읽습니다.
+
+- id -> 병원: 해시 테이블 (O(1))
+- 홈페이지 호스트 -> 병원: 해시 테이블 (homepageUrl / url)
+- 이름·주소·지역·분류 토큰 -> 병원: 정렬된 토큰 표에서 접두어 이진 탐색 ('강남' -> 강남구, 강남역 ...)
+- mapx/mapy(경도/위도 x 1e7) 격자 색인: 반경 N km 검색
+- 병원 레코드는 개별 JSON으로 저장되어 조회된 것만 역직렬화
+
+파일 구조 (리틀 엔디언): 헤더 | 섹션 표(오프셋, 길이) | 섹션들 (8바이트 정렬)
+
+사용:
+  python3 hospital_registry.py build
+  python3 hospital_registry.py get hosp-1769182841131-58z15fuvp
+  python3 hospital_registry.py search 강남 피부과
+  python3 hospital_registry.py near 37.4979 127.0276 --km 1.5
+  python3 hospital_registry.py url https://www.gangnam.ceramiqueclinic.com
+"""
+
+import bisect
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+import unicodedata
+from urllib.parse import urlparse
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+SOURCE_FILE = os.getenv('HOSPITALS_FILE', os.path.join(REPO_DIR, 'medchecker', 'backend', 'data', 'hospitals',
+                                                        'hospitals.json'))
+REGISTRY_FILE = os.getenv('HOSPITAL_REGISTRY', os.path.join(SCRIPT_DIR, 'hospital_registry.bin'))
+
+MAGIC = b'MCHR'
+FORMAT_VERSION = 1
+GRID_CELL_DEG = 0.01            # 격자 한 칸 (위도 약 1.1km)
+COORD_SCALE = 1e7               # 네이버 검색 API mapx/mapy 배율
+EARTH_RADIUS_KM = 6371.0088
+TOKEN_FIELDS = ('name', 'address', 'region', 'category')
+
+HEADER = struct.Struct('<4sHHId')            # magic, version, 섹션 수, 병원 수, 격자 칸 크기
+SECTION = struct.Struct('<QQ')               # 오프셋, 길이
+CELL = struct.Struct('<iiII')                # 격자 x, 격자 y, entries 시작, 개수
+SECTIONS = (
+    'records.offsets', 'records.data', 'coords',
+    'id.slots', 'id.keys.offsets', 'id.keys.data', 'id.postings.offsets', 'id.postings',
+    'host.slots', 'host.keys.offsets', 'host.keys.data', 'host.postings.offsets', 'host.postings',
+    'token.keys.offsets', 'token.keys.data', 'token.postings.offsets', 'token.postings',
+    'grid.cells', 'grid.entries',
+)
+
+_TOKEN = re.compile(r'\w+')
+
+
+# --- 정규화 ---
+
+def tokens(text):
+    """검색 토큰 (NFKC 정규화, 소문자, 단어 문자 단위)"""
+    return _TOKEN.findall(unicodedata.normalize('NFKC', text or '').lower())
+
+
+def normalize_host(url):
+    """'https://www.Example.co.kr/path' -> 'example.co.kr'"""
+    url = (url or '').strip()
+    host = (urlparse(url if '//' in url else f'//{url}').hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def fields(record):
+    """원본 형식(백엔드 레지스트리 / 프론트엔드 분석 요약)과 무관한 공통 필드"""
+    return {
+        'id': record.get('id') or record.get('hospitalId') or '',
+        'name': record.get('name') or record.get('hospitalName') or '',
+        'address': record.get('address') or '',
+        'region': record.get('region') or '',
+        'category': record.get('category') or '',
+        'url': record.get('homepageUrl') or record.get('url') or '',
+    }
+
+
+def coordinates(record):
+    """(경도, 위도) - 좌표가 없으면 None"""
+    try:
+        lon, lat = int(record['mapx']) / COORD_SCALE, int(record['mapy']) / COORD_SCALE
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (lon, lat) if -180 <= lon <= 180 and -90 <= lat <= 90 else None
+
+
+def _hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _cell(value, cell_deg):
+    return math.floor(value / cell_deg)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+# --- 변환 ---
+
+def _u32(values):
+    return struct.pack(f'<{len(values)}I', *values)
+
+
+def _u64(values):
+    return struct.pack(f'<{len(values)}Q', *values)
+
+
+def _blob(strings):
+    """문자열 목록 -> (오프셋 섹션, 데이터 섹션)"""
+    offsets, data = [0], bytearray()
+    for string in strings:
+        data += string.encode('utf-8')
+        offsets.append(len(data))
+    return _u32(offsets), bytes(data)
+
+
+def _postings(lists):
+    offsets, flat = [0], []
+    for items in lists:
+        flat.extend(items)
+        offsets.append(len(flat))
+    return _u32(offsets), _u32(flat)
+
+
+def _hash_index(prefix, mapping):
+    """key -> 레코드 번호 목록 dict를 개방 주소법 해시 섹션들로"""
+    keys = sorted(mapping)
+    size = 1
+    while size < max(2 * len(keys), 8):
+        size *= 2
+    slots = [0] * size
+    for number, key in enumerate(keys):
+        slot = _hash(key) & (size - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = number + 1
+    key_offsets, key_data = _blob(keys)
+    posting_offsets, postings = _postings([mapping[key] for key in keys])
+    return {
+        f'{prefix}.slots': _u32(slots),
+        f'{prefix}.keys.offsets': key_offsets, f'{prefix}.keys.data': key_data,
+        f'{prefix}.postings.offsets': posting_offsets, f'{prefix}.postings': postings,
+    }
+
+
+def load_source(path=SOURCE_FILE):
+    """hospitals.json -> 병원 레코드 목록 ({'hospitals': [...]} 또는 배열)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    records = data.get('hospitals', []) if isinstance(data, dict) else data
+    return [record for record in records if isinstance(record, dict) and fields(record)['id']]
+
+
+def build(records, path=REGISTRY_FILE, cell_deg=GRID_CELL_DEG):
+    """레코드 목록 -> 레지스트리 파일 (임시 파일에 쓴 뒤 교체) -> 병원 수"""
+    # id가 중복되면 뒤의 레코드가 우선
+    by_id = {}
+    for record in records:
+        by_id[fields(record)['id']] = record
+    records = list(by_id.values())
+
+    sections = {}
+    record_offsets, record_data = [0], bytearray()
+    coords = []
+    ids, hosts, token_map, cells = {}, {}, {}, {}
+    for number, record in enumerate(records):
+        record_data += json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        record_offsets.append(len(record_data))
+
+        common = fields(record)
+        ids[common['id']] = [number]
+        host = normalize_host(common['url'])
+        if host:
+            hosts.setdefault(host, []).append(number)
+        for token in {token for field in TOKEN_FIELDS for token in tokens(common[field])}:
+            token_map.setdefault(token, []).append(number)
+
+        point = coordinates(record)
+        coords += point if point else (math.nan, math.nan)
+        if point:
+            cells.setdefault((_cell(point[0], cell_deg), _cell(point[1], cell_deg)), []).append(number)
+
+    sections['records.offsets'] = _u64(record_offsets)
+    sections['records.data'] = bytes(record_data)
+    sections['coords'] = struct.pack(f'<{len(coords)}d', *coords)
+    sections.update(_hash_index('id', ids))
+    sections.update(_hash_index('host', hosts))
+
+    # 토큰은 UTF-8 바이트 순으로 정렬 (접두어 탐색 시 바이트 비교와 같은 순서)
+    token_keys = sorted(token_map, key=lambda token: token.encode('utf-8'))
+    sections['token.keys.offsets'], sections['token.keys.data'] = _blob(token_keys)
+    sections['token.postings.offsets'], sections['token.postings'] = _postings([token_map[t] for t in token_keys])
+
+    cell_table, entries = bytearray(), []
+    for key in sorted(cells):
+        cell_table += CELL.pack(key[0], key[1], len(entries), len(cells[key]))
+        entries.extend(cells[key])
+    sections['grid.cells'] = bytes(cell_table)
+    sections['grid.entries'] = _u32(entries)
+
+    offset = HEADER.size + SECTION.size * len(SECTIONS)
+    table, body = bytearray(), bytearray()
+    for name in SECTIONS:
+        padding = -(offset + len(body)) % 8
+        body += b'\0' * padding
+        table += SECTION.pack(offset + len(body), len(sections[name]))
+        body += sections[name]
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(SECTIONS), len(records), cell_deg))
+        f.write(table)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+# --- 조회 ---
+
+class Registry:
+    """메모리 맵으로 연 병원 레지스트리 (레코드는 조회할 때만 파싱)"""
+
+    def __init__(self, path=REGISTRY_FILE):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, section_count, self.count, self.cell_deg = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or section_count != len(SECTIONS):
+            self._map.close()
+            raise ValueError(f"레지스트리 형식이 다릅니다: {path} (다시 build 하세요)")
+        self._sections = {
+            name: SECTION.unpack_from(self._map, HEADER.size + SECTION.size * i) for i, name in enumerate(SECTIONS)
+        }
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    # 섹션 읽기
+
+    def _u32(self, section, index):
+        return struct.unpack_from('<I', self._map, self._sections[section][0] + 4 * index)[0]
+
+    def _u32_range(self, section, start, stop):
+        return struct.unpack_from(f'<{stop - start}I', self._map, self._sections[section][0] + 4 * start)
+
+    def _string(self, prefix, index):
+        start, stop = self._u32_range(f'{prefix}.offsets', index, index + 2)
+        base = self._sections[f'{prefix}.data'][0]
+        return self._map[base + start:base + stop]
+
+    def _postings(self, prefix, index):
+        start, stop = self._u32_range(f'{prefix}.postings.offsets', index, index + 2)
+        return self._u32_range(f'{prefix}.postings', start, stop)
+
+    def record(self, number):
+        """레코드 번호 -> 병원 dict (이 레코드만 역직렬화)"""
+        offset = self._sections['records.offsets'][0] + 8 * number
+        start, stop = struct.unpack_from('<QQ', self._map, offset)
+        base = self._sections['records.data'][0]
+        return json.loads(self._map[base + start:base + stop])
+
+    def coordinates(self, number):
+        lon, lat = struct.unpack_from('<dd', self._map, self._sections['coords'][0] + 16 * number)
+        return None if math.isnan(lon) else (lon, lat)
+
+    def _lookup(self, prefix, key):
+        """해시 섹션에서 key의 레코드 번호 목록"""
+        size = self._sections[f'{prefix}.slots'][1] // 4
+        encoded = key.encode('utf-8')
+        slot = _hash(key) & (size - 1)
+        while True:
+            number = self._u32(f'{prefix}.slots', slot)
+            if number == 0:
+                return ()
+            if self._string(f'{prefix}.keys', number - 1) == encoded:
+                return self._postings(prefix, number - 1)
+            slot = (slot + 1) & (size - 1)
+
+    def get(self, hospital_id):
+        """id -> 병원 dict (없으면 None)"""
+        numbers = self._lookup('id', hospital_id)
+        return self.record(numbers[0]) if numbers else None
+
+    def by_url(self, url):
+        """홈페이지 URL(호스트 기준) -> 병원 dict 목록"""
+        return [self.record(number) for number in self._lookup('host', normalize_host(url))]
+
+    # 토큰 검색
+
+    def _token_count(self):
+        return self._sections['token.keys.offsets'][1] // 4 - 1
+
+    def _prefix_matches(self, prefix):
+        """접두어가 prefix인 토큰들의 레코드 번호 집합"""
+        encoded = prefix.encode('utf-8')
+        count = self._token_count()
+        index = bisect.bisect_left(range(count), encoded, key=lambda i: self._string('token.keys', i))
+        numbers = set()
+        while index < count and self._string('token.keys', index).startswith(encoded):
+            numbers.update(self._postings('token', index))
+            index += 1
+        return numbers
+
+    def search(self, query, limit=20):
+        """이름/주소/지역/분류 검색 - 검색어의 모든 토큰을 (접두어로) 포함하는 병원 dict 목록"""
+        terms = tokens(query)
+        if not terms:
+            return []
+        numbers = None
+        for term in sorted(terms, key=len, reverse=True):
+            matches = self._prefix_matches(term)
+            numbers = matches if numbers is None else numbers & matches
+            if not numbers:
+                return []
+        return [self.record(number) for number in sorted(numbers)[:limit]]
+
+    # 반경 검색
+
+    def _cell_entries(self, cx, cy):
+        base, length = self._sections['grid.cells']
+        count = length // CELL.size
+        index = bisect.bisect_left(range(count), (cx, cy),
+                                   key=lambda i: CELL.unpack_from(self._map, base + CELL.size * i)[:2])
+        if index < count:
+            x, y, start, size = CELL.unpack_from(self._map, base + CELL.size * index)
+            if (x, y) == (cx, cy):
+                return self._u32_range('grid.entries', start, start + size)
+        return ()
+
+    def near(self, lat, lon, km, limit=50):
+        """(lat, lon)에서 km 이내 병원 [(거리 km, 병원 dict)] (가까운 순)"""
+        dlat = km / 111.32
+        dlon = km / max(111.32 * math.cos(math.radians(lat)), 1e-6)
+        x_range = range(_cell(lon - dlon, self.cell_deg), _cell(lon + dlon, self.cell_deg) + 1)
+        y_range = range(_cell(lat - dlat, self.cell_deg), _cell(lat + dlat, self.cell_deg) + 1)
+        base, length = self._sections['grid.cells']
+        cell_count = length // CELL.size
+        if len(x_range) * len(y_range) > cell_count:
+            # 반경이 넓으면 칸마다 이진 탐색하는 대신 격자 표를 한 번 훑음
+            candidates = []
+            for i in range(cell_count):
+                cx, cy, start, size = CELL.unpack_from(self._map, base + CELL.size * i)
+                if cx in x_range and cy in y_range:
+                    candidates.extend(self._u32_range('grid.entries', start, start + size))
+        else:
+            candidates = [number for cx in x_range for cy in y_range for number in self._cell_entries(cx, cy)]
+
+        found = []
+        for number in candidates:
+            point_lon, point_lat = self.coordinates(number)
+            distance = haversine_km(lat, lon, point_lat, point_lon)
+            if distance <= km:
+                found.append((distance, number))
+        found.sort()
+        return [(round(distance, 3), self.record(number)) for distance, number in found[:limit]]
+
+
+def open_registry(path=REGISTRY_FILE, source=SOURCE_FILE):
+    """레지스트리 열기 - 없거나 원본 JSON이 더 최신이면 먼저 다시 변환"""
+    try:
+        stale = os.path.getmtime(path) < os.path.getmtime(source)
+    except OSError:
+        stale = True
+    if stale and os.path.exists(source):
+        build(load_source(source), path)
+    return Registry(path)
+
+
+def _summary(record):
+    common = fields(record)
+    return f"{common['id']}  {common['name']}  {common['address'] or common['region']}  {common['url']}"
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 병원 레지스트리 (메모리 맵 바이너리)')
+    parser.add_argument('--registry', default=REGISTRY_FILE, help=f'레지스트리 파일 (기본: {REGISTRY_FILE})')
+    parser.add_argument('--source', default=SOURCE_FILE, help='원본 hospitals.json')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build_cmd = sub.add_parser('build', help='hospitals.json -> 레지스트리 변환')
+    build_cmd.add_argument('--cell-deg', type=float, default=GRID_CELL_DEG, help='격자 칸 크기 (도)')
+    sub.add_parser('info', help='레지스트리 정보')
+    sub.add_parser('get', help='id로 조회').add_argument('id')
+    sub.add_parser('url', help='홈페이지 URL로 조회').add_argument('url')
+    search = sub.add_parser('search', help='이름/주소/지역/분류 토큰(접두어) 검색')
+    search.add_argument('query', nargs='+')
+    search.add_argument('--limit', type=int, default=20)
+    near = sub.add_parser('near', help='반경 검색')
+    near.add_argument('lat', type=float)
+    near.add_argument('lon', type=float)
+    near.add_argument('--km', type=float, default=1.0, help='반경 km (기본: 1)')
+    near.add_argument('--limit', type=int, default=20)
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        try:
+            count = build(load_source(args.source), args.registry, args.cell_deg)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] 변환 실패: {e}")
+            return 1
+        print(f"[OK] 병원 {count}곳 -> {args.registry} ({os.path.getsize(args.registry) / 1024:.1f}KB)")
+        return 0
+
+    try:
+        registry = open_registry(args.registry, args.source)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    with registry:
+        if args.command == 'info':
+            print(f"{args.registry}: 병원 {len(registry)}곳, 격자 {registry.cell_deg}도")
+            for name, (offset, length) in registry._sections.items():
+                print(f"  {name:<24} {length:>10} bytes")
+            return 0
+        if args.command == 'get':
+            record = registry.get(args.id)
+            if record is None:
+                print(f"[ERROR] 없는 id: {args.id}")
+                return 1
+            print(json.dumps(record, ensure_ascii=False, indent=2))
+            return 0
+        if args.command == 'url':
+            results = registry.by_url(args.url)
+        elif args.command == 'search':
+            results = registry.search(' '.join(args.query), args.limit)
+        else:
+            results = registry.near(args.lat, args.lon, args.km, args.limit)
+
+    if not results:
+        print("  (결과 없음)")
+    for item in results:
+        if isinstance(item, tuple):
+            print(f"  {item[0]:>6.2f}km  {_summary(item[1])}")
+        else:
+            print(f"  {_summary(item)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
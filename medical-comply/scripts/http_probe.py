@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 비동기 HTTP 프로브 클라이언트
+asyncio 스트림 위에서 동작하는 최소한의 HTTP/1.1 클라이언트입니다.
+
+- 외부 패키지 없이 동시 실행 가능 (asyncio)
+- 대상별 제한 시간 (connect/응답 구분)
+- 단계별 지연 시간 측정: 연결(connect), 첫 바이트(TTFB), 전체(total)
+- ConnectionPool: keep-alive 연결 재사용 (반복 확인/지연 측정용)
+- 리다이렉트(301/302/303/307/308) 추적 - 같은 제한 시간 안에서 최대 MAX_REDIRECTS번
+"""
+
+import asyncio
+import json
+import ssl
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = 'medchecker-healthcheck/1.0'
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 5
+
+
+class HttpProtocolError(Exception):
+    """응답을 HTTP로 해석할 수 없음"""
+
+
+@dataclass
+class HttpResponse:
+    """프로브 결과 - 실패해도 측정된 단계까지의 시간은 채워짐"""
+    url: str
+    status: int = 0
+    headers: dict = field(default_factory=dict)
+    body: bytes = b''
+    error: str = None        # 'connect' | 'timeout' | 'protocol' | 'error'
+    detail: str = ''
+    connect_ms: float = None
+    ttfb_ms: float = None
+    total_ms: float = None
+    reused: bool = False     # 풀의 keep-alive 연결 재사용 여부 (connect_ms = 0)
+    redirects: int = 0       # 따라간 리다이렉트 수 (url은 최종 주소)
+
+    @property
+    def ok(self):
+        return self.error is None and self.status == 200
+
+    def json(self):
+        """본문을 JSON으로 해석 (실패 시 빈 dict)"""
+        try:
+            return json.loads(self.body.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError):
+            return {}
+
+
+def split_url(url):
+    """URL -> (scheme, host, port, path)"""
+    parts = urlsplit(url if '://' in url else f'http://{url}')
+    scheme = parts.scheme or 'http'
+    port = parts.port or (443 if scheme == 'https' else 80)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    return scheme, parts.hostname, port, path
+
+
+async def _read_body(reader, headers, status):
+    """응답 본문 읽기 -> (body, 연결 재사용 가능 여부)"""
+    if status in (204, 304) or 100 <= status < 200:
+        return b'', True
+
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise HttpProtocolError('chunked 응답이 중간에 끊김')
+            size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+            if size == 0:
+                # 트레일러 헤더 건너뜀
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        return b''.join(chunks), True
+
+    if 'content-length' in headers:
+        return await reader.readexactly(int(headers['content-length'])), True
+
+    return await reader.read(), False
+
+
+async def open_connection(scheme, host, port):
+    ssl_context = ssl.create_default_context() if scheme == 'https' else None
+    return await asyncio.open_connection(host, port, ssl=ssl_context)
+
+
+class ConnectionPool:
+    """keep-alive 연결 풀 - (scheme, host, port)별 유휴 연결 재사용
+
+    하나의 이벤트 루프 안에서만 사용합니다. 사용이 끝나면 close()를 호출하세요.
+    """
+
+    def __init__(self, max_idle_per_host=8):
+        self.max_idle_per_host = max_idle_per_host
+        self.stats = {'opened': 0, 'reused': 0}
+        self._idle = {}
+
+    async def acquire(self, scheme, host, port):
+        """연결 획득 -> (reader, writer, 재사용 여부)"""
+        idle = self._idle.get((scheme, host, port))
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.stats['reused'] += 1
+                return reader, writer, True
+            writer.close()
+
+        reader, writer = await open_connection(scheme, host, port)
+        self.stats['opened'] += 1
+        return reader, writer, False
+
+    def release(self, scheme, host, port, reader, writer):
+        """응답을 모두 읽은 연결을 풀에 반환"""
+        idle = self._idle.setdefault((scheme, host, port), [])
+        if len(idle) < self.max_idle_per_host and not writer.is_closing():
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def close(self):
+        """유휴 연결 모두 종료"""
+        writers = [writer for idle in self._idle.values() for _, writer in idle]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+
+
+class _StaleConnection(Exception):
+    """재사용한 유휴 연결이 이미 서버 쪽에서 닫힘"""
+
+
+def _build_request(method, path, host_header, keep_alive, body, headers):
+    lines = [
+        f'{method} {path} HTTP/1.1',
+        f'Host: {host_header}',
+        f'User-Agent: {USER_AGENT}',
+        'Accept: */*',
+        f'Connection: {"keep-alive" if keep_alive else "close"}',
+    ]
+    lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+    if body is not None:
+        lines.append(f'Content-Length: {len(body)}')
+    head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    return head + body if body else head
+
+
+async def _send_and_receive(response, reader, writer, request, reused, started):
+    writer.write(request)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    if not status_line and reused:
+        raise _StaleConnection()
+    response.ttfb_ms = (time.perf_counter() - started) * 1000
+    parts = status_line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise HttpProtocolError(f'잘못된 상태 줄: {status_line[:80]!r}')
+    response.status = int(parts[1])
+
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        response.headers[name.strip().lower()] = value.strip()
+
+    response.body, reusable = await _read_body(reader, response.headers, response.status)
+    return reusable and response.headers.get('connection', '').lower() != 'close'
+
+
+async def _exchange(response, scheme, host, port, path, started, pool, method='GET', body=None, headers=None):
+    """연결 → 요청 → 응답 수신 (각 단계 시간 기록)"""
+    default_port = 443 if scheme == 'https' else 80
+    host_header = host if port == default_port else f'{host}:{port}'
+    request = _build_request(method, path, host_header, pool is not None, body, headers)
+
+    for attempt in range(2):
+        if pool:
+            reader, writer, reused = await pool.acquire(scheme, host, port)
+        else:
+            reader, writer = await open_connection(scheme, host, port)
+            reused = False
+        response.reused = reused
+        response.headers = {}
+        response.connect_ms = 0.0 if reused else (time.perf_counter() - started) * 1000
+
+        keep = False
+        try:
+            keep = await _send_and_receive(response, reader, writer, request, reused, started)
+            keep = keep and pool is not None
+            return
+        except (_StaleConnection, ConnectionResetError, BrokenPipeError):
+            # 유휴 연결이 끊긴 경우 새 연결로 한 번만 재시도
+            if not reused or attempt:
+                raise
+        finally:
+            if keep:
+                pool.release(scheme, host, port, reader, writer)
+            else:
+                writer.close()
+
+
+async def _follow(response, started, pool, method, body, headers, follow_redirects):
+    """요청 후 리다이렉트를 따라가며 최종 응답을 response에 채움"""
+    url = response.url if '://' in response.url else f'http://{response.url}'
+    while True:
+        scheme, host, port, path = split_url(url)
+        await _exchange(response, scheme, host, port, path, started, pool, method, body, headers)
+        location = response.headers.get('location')
+        if not follow_redirects or response.status not in REDIRECT_STATUSES or not location:
+            return
+        if response.redirects >= MAX_REDIRECTS:
+            raise HttpProtocolError(f'리다이렉트 {MAX_REDIRECTS}회 초과')
+        # requests와 같이 303과 POST의 301/302는 본문 없는 GET으로 전환
+        if response.status == 303 or (response.status in (301, 302) and method == 'POST'):
+            method, body = 'GET', None
+        url = urljoin(url, location)
+        response.url = url
+        response.redirects += 1
+        response.status = 0
+        response.body = b''
+
+
+async def fetch(url, timeout=10.0, pool=None, method='GET', body=None, headers=None, follow_redirects=True):
+    """URL에 요청 후 HttpResponse 반환 (예외를 던지지 않음)
+
+    pool을 지정하면 keep-alive 연결을 재사용합니다.
+    body(bytes)가 있으면 Content-Length를 붙여 전송합니다 (Content-Type은 headers로 지정).
+    리다이렉트는 requests.get처럼 기본으로 따라가며, timeout은 모든 단계를 합친 시간입니다.
+    """
+    response = HttpResponse(url)
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(
+            _follow(response, started, pool, method, body, headers, follow_redirects), timeout
+        )
+    except asyncio.TimeoutError:
+        response.error = 'timeout'
+        response.detail = f'{timeout:g}초 초과'
+    except (HttpProtocolError, asyncio.IncompleteReadError, ValueError) as e:
+        response.error = 'protocol'
+        response.detail = str(e)
+    except _StaleConnection:
+        response.error = 'protocol'
+        response.detail = '서버가 연결을 닫음'
+    except (ConnectionError, OSError) as e:
+        response.error = 'connect'
+        response.detail = str(e)
+    except Exception as e:
+        response.error = 'error'
+        response.detail = str(e)
+    response.total_ms = (time.perf_counter() - started) * 1000
+    return response
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+JSX/HTML 태그 토크나이저
+소스를 한 번만 선형으로 훑으며 요소 시작/종료 이벤트와 속성을 생성합니다.
+
+- JSX 표현식 속성 ({...}) 내부의 '>' 와 중첩 중괄호, 문자열, 주석, 중첩 JSX 요소 처리
+- 여러 줄에 걸친 속성 지원
+- feed()로 나누어 입력 가능 (미완성 태그는 다음 입력까지 보관)
+- HTML 주석, <!DOCTYPE>, <script>/<style> 본문 건너뜀
+"""
+
+import re
+from collections import namedtuple
+
+# kind: 'start' | 'end'
+# attrs: {이름: 값} - 따옴표 문자열은 내용, JSX 표현식은 '{...}' 원문, 값 없는 속성은 True
+MarkupEvent = namedtuple('MarkupEvent', ['kind', 'name', 'attrs', 'self_closing'])
+
+_TAG_NAME = re.compile(r'[A-Za-z][\w.:-]*')
+_ATTR_NAME = re.compile(r'[^\s=/>{"\']+')
+_UNQUOTED_VALUE = re.compile(r'[^\s>]+')
+_WHITESPACE = re.compile(r'\s*')
+_BRACE_TOKEN = re.compile(r'[{}"\'`<]|//|/\*')
+_JSX_CHILD_TOKEN = re.compile(r'[{<]')
+_WORD_CHAR = re.compile(r'[\w$]')
+# 이 키워드 뒤의 '<'는 비교 연산자가 아니라 JSX 요소
+_JSX_KEYWORDS = ('return', 'yield', 'default')
+# 표현식 안 JSX 중첩 한도 (넘으면 '<'를 연산자로 보고 재귀하지 않음)
+MAX_JSX_NESTING = 32
+
+RAW_TEXT_TAGS = ('script', 'style')
+_RAW_TEXT_END = {tag: re.compile(r'</' + tag, re.IGNORECASE) for tag in RAW_TEXT_TAGS}
+
+# _parse_* 반환값: 입력이 끝나 판단할 수 없음 / 태그가 아님 (예: a < b 비교식)
+_INCOMPLETE = object()
+_NOT_A_TAG = object()
+
+
+def _starts_jsx(buf, lt, lower):
+    """표현식 안의 '<'가 JSX 요소 시작인지 (앞 토큰이 피연산자면 비교 연산자로 봄)"""
+    k = lt - 1
+    while k > lower and buf[k].isspace():
+        k -= 1
+    prev = buf[k]
+    if prev in ')]"\'`':
+        return False
+    if not _WORD_CHAR.match(prev):
+        return True
+    start = k
+    while start > lower and _WORD_CHAR.match(buf[start - 1]):
+        start -= 1
+    return buf[start:k + 1] in _JSX_KEYWORDS
+
+
+def _skip_quoted(buf, pos, quote):
+    """pos부터 닫는 quote 다음 위치 반환 (이스케이프 처리)"""
+    while True:
+        end = buf.find(quote, pos)
+        if end == -1:
+            return _INCOMPLETE
+        backslashes = 0
+        k = end - 1
+        while k >= pos and buf[k] == '\\':
+            backslashes += 1
+            k -= 1
+        pos = end + 1
+        if backslashes % 2 == 0:
+            return pos
+
+
+def _skip_jsx_element(buf, pos, nesting):
+    """표현식 안의 JSX 요소(자식 포함) 끝 다음 위치 반환
+
+    자식 텍스트의 따옴표(Can't 등)는 문자열이 아니므로 '{'와 '<'만 따라감
+    """
+    n = len(buf)
+    if buf.startswith('<>', pos):
+        j = pos + 2
+    else:
+        result = _parse_start_tag(buf, pos, nesting)
+        if result is _INCOMPLETE or result is _NOT_A_TAG:
+            return result
+        event, j = result
+        if event.self_closing:
+            return j
+
+    depth = 1
+    while True:
+        m = _JSX_CHILD_TOKEN.search(buf, j)
+        if not m:
+            return _INCOMPLETE
+        j = m.start()
+        if buf[j] == '{':
+            j = _skip_braces(buf, j, nesting + 1)
+            if j is _INCOMPLETE:
+                return _INCOMPLETE
+            continue
+        if j + 1 >= n:
+            return _INCOMPLETE
+        nxt = buf[j + 1]
+        if nxt == '/':
+            end = buf.find('>', j + 2)
+            if end == -1:
+                return _INCOMPLETE
+            j = end + 1
+            depth -= 1
+            if depth == 0:
+                return j
+        elif nxt == '>':
+            depth += 1
+            j += 2
+        elif nxt.isascii() and nxt.isalpha():
+            result = _parse_start_tag(buf, j, nesting)
+            if result is _INCOMPLETE:
+                return _INCOMPLETE
+            if result is _NOT_A_TAG:
+                j += 1
+                continue
+            event, j = result
+            if not event.self_closing:
+                depth += 1
+        else:
+            j += 1
+
+
+def _skip_braces(buf, pos, nesting=0):
+    """pos의 '{'와 짝이 맞는 '}' 다음 위치 반환
+
+    문자열/주석 내부 중괄호는 무시하고, 중첩 JSX 요소는 통째로 건너뜀
+    """
+    start = pos
+    depth = 0
+    n = len(buf)
+    while pos < n:
+        m = _BRACE_TOKEN.search(buf, pos)
+        if not m:
+            return _INCOMPLETE
+        c = m.group()
+        pos = m.end()
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return pos
+        elif c == '<':
+            if nesting < MAX_JSX_NESTING and pos < n and (buf[pos] == '>' or buf[pos].isascii() and buf[pos].isalpha()) \
+                    and _starts_jsx(buf, m.start(), start):
+                end = _skip_jsx_element(buf, m.start(), nesting + 1)
+                if end is _INCOMPLETE:
+                    return _INCOMPLETE
+                if end is not _NOT_A_TAG:
+                    pos = end
+        elif c == '//':
+            end = buf.find('\n', pos)
+            if end == -1:
+                return _INCOMPLETE
+            pos = end + 1
+        elif c == '/*':
+            end = buf.find('*/', pos)
+            if end == -1:
+                return _INCOMPLETE
+            pos = end + 2
+        else:
+            # 문자열/템플릿 리터럴 끝까지 건너뜀
+            pos = _skip_quoted(buf, pos, c)
+            if pos is _INCOMPLETE:
+                return _INCOMPLETE
+    return _INCOMPLETE
+
+
+def _parse_start_tag(buf, pos, nesting=0):
+    """buf[pos] == '<' 위치의 시작 태그 파싱 -> (MarkupEvent, 다음 위치)"""
+    n = len(buf)
+    m = _TAG_NAME.match(buf, pos + 1)
+    name = m.group()
+    j = m.end()
+    if j >= n:
+        return _INCOMPLETE
+    if buf[j] not in ' \t\r\n/>{':
+        return _NOT_A_TAG
+
+    attrs = {}
+    while True:
+        j = _WHITESPACE.match(buf, j).end()
+        if j >= n:
+            return _INCOMPLETE
+        c = buf[j]
+
+        if c == '>':
+            return MarkupEvent('start', name, attrs, False), j + 1
+        if c == '/':
+            if j + 1 >= n:
+                return _INCOMPLETE
+            if buf[j + 1] == '>':
+                return MarkupEvent('start', name, attrs, True), j + 2
+            return _NOT_A_TAG
+        if c == '{':
+            # 스프레드 속성 {...props}
+            end = _skip_braces(buf, j, nesting)
+            if end is _INCOMPLETE:
+                return _INCOMPLETE
+            j = end
+            continue
+
+        m = _ATTR_NAME.match(buf, j)
+        if not m:
+            return _NOT_A_TAG
+        attr_name = m.group()
+        j = _WHITESPACE.match(buf, m.end()).end()
+        if j >= n:
+            return _INCOMPLETE
+        if buf[j] != '=':
+            attrs[attr_name] = True
+            continue
+
+        j = _WHITESPACE.match(buf, j + 1).end()
+        if j >= n:
+            return _INCOMPLETE
+        c = buf[j]
+        if c in '"\'':
+            end = buf.find(c, j + 1)
+            if end == -1:
+                return _INCOMPLETE
+            attrs[attr_name] = buf[j + 1:end]
+            j = end + 1
+        elif c == '{':
+            end = _skip_braces(buf, j, nesting)
+            if end is _INCOMPLETE:
+                return _INCOMPLETE
+            attrs[attr_name] = buf[j:end]
+            j = end
+        else:
+            m = _UNQUOTED_VALUE.match(buf, j)
+            if not m:
+                return _NOT_A_TAG
+            attrs[attr_name] = m.group()
+            j = m.end()
+
+
+class JSXTokenizer:
+    """증분 JSX/HTML 태그 토크나이저
+
+    사용법:
+        tokenizer = JSXTokenizer()
+        for chunk in chunks:
+            for event in tokenizer.feed(chunk):
+                ...
+        events = tokenizer.close()
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._raw_tag = None
+
+    def feed(self, data):
+        """입력 추가 후 완성된 이벤트 목록 반환"""
+        self._buffer += data
+        return self._parse(final=False)
+
+    def close(self):
+        """남은 입력을 처리하고 마지막 이벤트 목록 반환"""
+        events = self._parse(final=True)
+        self._buffer = ''
+        return events
+
+    def _parse(self, final):
+        buf = self._buffer
+        n = len(buf)
+        events = []
+        i = 0
+
+        while i < n:
+            if self._raw_tag:
+                m = _RAW_TEXT_END[self._raw_tag].search(buf, i)
+                if not m:
+                    # 종료 태그가 입력 경계에 걸칠 수 있으므로 끝부분만 보관
+                    i = n if final else max(i, n - len(self._raw_tag) - 2)
+                    break
+                self._raw_tag = None
+                i = m.start()
+                continue
+
+            lt = buf.find('<', i)
+            if lt == -1:
+                i = n
+                break
+            if lt + 1 >= n:
+                i = n if final else lt
+                break
+
+            nxt = buf[lt + 1]
+            if nxt == '!' or nxt == '?':
+                terminator = '-->' if buf.startswith('<!--', lt) else '>'
+                end = buf.find(terminator, lt + 2)
+                if end != -1:
+                    i = end + len(terminator)
+                elif final:
+                    # 닫히지 않은 주석은 입력 끝까지 (HTML과 같음)
+                    i = n
+                    break
+                else:
+                    i = lt
+                    break
+            elif nxt == '/':
+                m = _TAG_NAME.match(buf, lt + 2)
+                j = _WHITESPACE.match(buf, m.end()).end() if m else lt + 2
+                if j >= n and not final:
+                    i = lt
+                    break
+                if m and j < n and buf[j] == '>':
+                    events.append(MarkupEvent('end', m.group(), {}, False))
+                    i = j + 1
+                else:
+                    # 프래그먼트 </> 또는 태그가 아닌 '</'
+                    i = lt + 2
+            elif nxt.isascii() and nxt.isalpha():
+                result = _parse_start_tag(buf, lt)
+                if result is _INCOMPLETE and not final:
+                    i = lt
+                    break
+                if result is _INCOMPLETE:
+                    # 입력 끝까지 닫히지 않은 태그 - 나머지는 모두 그 태그의 일부로 봄 (HTML과 같음)
+                    # 다음 '<'부터 다시 훑으면 미완성 태그마다 끝까지 재탐색해 O(n^2)
+                    i = n
+                    break
+                if result is _NOT_A_TAG:
+                    i = lt + 1
+                    continue
+                event, i = result
+                events.append(event)
+                if event.name.lower() in RAW_TEXT_TAGS and not event.self_closing:
+                    self._raw_tag = event.name.lower()
+            else:
+                i = lt + 1
+
+        self._buffer = buf[i:]
+        return events
+
+
+def tokenize(content):
+    """전체 소스 문자열을 이벤트 목록으로 변환"""
+    tokenizer = JSXTokenizer()
+    return tokenizer.feed(content) + tokenizer.close()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 지연 시간 히스토그램
+HDR 히스토그램 방식(로그-선형 버킷)으로 지연 시간을 기록하고 백분위수를 계산합니다.
+
+- 값은 마이크로초 정수로 저장, 상대 오차는 유효 자릿수(기본 2자리 = 1% 이내)로 제한
+- 버킷 수는 값의 범위(로그)에만 비례하므로 샘플이 아무리 많아도 메모리 일정
+- 여러 히스토그램 병합 가능 (병렬 워커/구간별 집계)
+"""
+
+import math
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """밀리초 단위로 기록하는 로그-선형 지연 시간 히스토그램"""
+
+    def __init__(self, significant_digits=2):
+        # 유효 자릿수 d -> 각 2의 거듭제곱 구간을 2 * 10^d 이상 개로 분할
+        self.significant_digits = significant_digits
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.counts = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = None
+
+    def _bucket(self, value_us):
+        shift = max(0, value_us.bit_length() - self.sub_bucket_bits)
+        return shift, value_us >> shift
+
+    @staticmethod
+    def _bucket_range(shift, sub):
+        """버킷이 나타내는 값 범위 [low, high] (마이크로초)"""
+        low = sub << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value_ms, count=1):
+        """지연 시간(ms) 기록"""
+        value_us = max(0, int(round(value_ms * 1000)))
+        key = self._bucket(value_us)
+        self.counts[key] = self.counts.get(key, 0) + count
+        self.count += count
+        self.total_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def merge(self, other):
+        """다른 히스토그램의 기록을 합침 (유효 자릿수가 같아야 함)"""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError('유효 자릿수가 다른 히스토그램은 병합할 수 없습니다')
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.count:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            self.max_us = other.max_us if self.max_us is None else max(self.max_us, other.max_us)
+
+    def percentile(self, p):
+        """p 백분위수 (ms) - 해당 버킷 상한값, max를 넘지 않음"""
+        if not self.count:
+            return None
+        if p >= 100:
+            return self.max_us / 1000
+        target = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for shift, sub in sorted(self.counts, key=lambda key: self._bucket_range(*key)):
+            seen += self.counts[(shift, sub)]
+            if seen >= target:
+                _, high = self._bucket_range(shift, sub)
+                return min(high, self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def mean(self):
+        return self.total_us / self.count / 1000 if self.count else None
+
+    @property
+    def min(self):
+        return self.min_us / 1000 if self.min_us is not None else None
+
+    @property
+    def max(self):
+        return self.max_us / 1000 if self.max_us is not None else None
+
+    def summary(self, percentiles=PERCENTILES):
+        """{'count', 'min', 'mean', 'p50', ..., 'max'} (ms)"""
+        data = {'count': self.count, 'min': self.min, 'mean': self.mean}
+        for p in percentiles:
+            data[f'p{p:g}'] = self.percentile(p)
+        data['max'] = self.max
+        return {key: round(value, 3) if isinstance(value, float) else value for key, value in data.items()}
+
+    def to_dict(self):
+        """JSON 저장용 - 요약과 버킷 목록 [하한(ms), 상한(ms), 개수]"""
+        buckets = []
+        for key in sorted(self.counts, key=lambda key: self._bucket_range(*key)):
+            low, high = self._bucket_range(*key)
+            buckets.append([low / 1000, high / 1000, self.counts[key]])
+        return {
+            'significant_digits': self.significant_digits,
+            'summary': self.summary(),
+            'buckets': buckets,
+        }
+
+    def percentile_ladder(self, steps=(50, 75, 90, 95, 99, 99.9, 100)):
+        """HDR 스타일 백분위 표 [(백분위, 값ms, 누적 개수)]"""
+        rows = []
+        for p in steps:
+            value = self.percentile(p)
+            rows.append((p, value, min(self.count, math.ceil(self.count * p / 100))))
+        return rows
+
+    def ascii_chart(self, width=40, bins=12):
+        """로그 간격 구간으로 묶은 막대 그래프 문자열 목록"""
+        if not self.count:
+            return []
+        low = max(self.min_us, 1)
+        high = max(self.max_us, low + 1)
+        ratio = (high / low) ** (1 / bins)
+        edges = [low * ratio ** i for i in range(bins + 1)]
+
+        totals = [0] * bins
+        for key, count in self.counts.items():
+            bucket_low, bucket_high = self._bucket_range(*key)
+            middle = (bucket_low + bucket_high) / 2
+            index = 0
+            while index < bins - 1 and middle >= edges[index + 1]:
+                index += 1
+            totals[index] += count
+
+        peak = max(totals)
+        lines = []
+        for index, total in enumerate(totals):
+            if not total:
+                continue
+            bar = '█' * max(1, round(total / peak * width))
+            lines.append(f"{edges[index] / 1000:>9.2f} ~ {edges[index + 1] / 1000:>9.2f}ms |{bar} {total}")
+        return lines
@@ -2,20 +2,47 @@
 """
 MEDCHECKER 코드 품질 검사 및 자동 수정 스크립트
 - ESLint: JavaScript/TypeScript 린팅 및 자동 수정
-- Python 문법 검사 (scripts 폴더)
+- Python 문법 검사 (프로젝트 전체 재귀 탐색, 병렬 컴파일, 변경 없는 파일 건너뜀)
 - 타입 체크 (TypeScript)
+- 검사 도구를 동시에 실행하고 출력을 [도구] 접두어로 실시간 표시
+  (자동 수정 시 같은 소스 트리를 고치는 ESLint/Prettier만 순서대로 실행)
+- 증분 모드 (--changed / --incremental): 변경된 파일만 검사, 통과 결과는 내용 해시로 캐시
+- ESLint는 상주 서버(lint_daemon.js), tsc는 .tsbuildinfo 증분 빌드로 재실행 비용 절감
+  (--cold: 매번 npx로 새로 실행)
 """
 
 import subprocess
 import sys
 import os
-import glob
+import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import lint_daemon
+from task_graph import Task, TaskGraph
+from lint_cache import EXCLUDE_DIRS, LintCache, LintScope, changed_files, collect_files, fingerprint
 
 # 프로젝트 경로
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 BACKEND_DIR = os.path.join(PROJECT_DIR, 'backend')
 FRONTEND_DIR = os.path.join(PROJECT_DIR, 'frontend')
+CACHE_FILE = os.path.join(SCRIPT_DIR, 'lint_cache.json')
+TSBUILDINFO_FILE = os.path.join(SCRIPT_DIR, 'lint_cache.tsbuildinfo')
+
+# Python 검사 범위 (os.pathsep로 구분, 상대 경로는 현재 디렉토리 기준)
+PYTHON_ROOTS = [path for path in os.getenv('LINT_PYTHON_ROOTS', PROJECT_DIR).split(os.pathsep) if path]
+PYTHON_EXCLUDES = EXCLUDE_DIRS | {'.venv', 'venv', 'env', '.tox', '.mypy_cache', '.pytest_cache'} | {
+    pattern for pattern in os.getenv('LINT_PYTHON_EXCLUDE', '').split(os.pathsep) if pattern
+}
+PARALLEL_MIN_FILES = 256   # 이보다 적으면 프로세스 풀 없이 바로 컴파일 (spawn 워커 시작 약 0.5초)
+
+JS_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx')
+ESLINT_CONFIGS = [
+    '.eslintrc.js', '.eslintrc.json', '.eslintrc.yml',
+    'eslint.config.js', 'eslint.config.mjs'
+]
 
 def run_command(cmd, cwd=None, description=""):
     """명령 실행 및 결과 반환"""
@@ -25,50 +52,155 @@ def run_command(cmd, cwd=None, description=""):
     print(f"{'=' * 40}")
 
     try:
-        result = subprocess.run(
+        # 도구 출력을 끝날 때까지 모으지 않고 줄 단위로 바로 출력
+        process = subprocess.Popen(
             cmd,
             shell=True,
             cwd=cwd,
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace'
         )
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-        return result.returncode == 0
+        for line in process.stdout:
+            print(line, end='')
+        return process.wait() == 0
     except Exception as e:
         print(f"[ERROR] 명령 실행 실패: {e}")
         return False
 
-def check_python_syntax():
-    """Python 스크립트 문법 검사"""
+def select_files(tool, paths, scope, config=None):
+    """증분 모드일 때 검사할 파일만 남김 (scope가 None이면 그대로)"""
+    if scope is None:
+        return paths
+    if scope.changed is not None:
+        paths = [path for path in paths if path in scope.changed]
+    return scope.cache.filter_unchecked(tool, paths, config)
+
+def _compile_file(filepath):
+    """파일 하나 컴파일 (워커 프로세스) -> (경로, 오류 메시지 또는 None, 소요 ms)"""
+    started = time.perf_counter()
+    try:
+        with open(filepath, 'rb') as f:
+            source = f.read()
+        compile(source, filepath, 'exec', dont_inherit=True)
+        error = None
+    except SyntaxError as e:
+        error = f"Line {e.lineno} - {e.msg}"
+    except (ValueError, OSError) as e:
+        error = str(e)
+    return filepath, error, (time.perf_counter() - started) * 1000
+
+def find_python_files(roots=None, excludes=None):
+    """roots 아래 Python 파일을 재귀적으로 찾음 (excludes: 이름/상대 경로 글롭)"""
+    roots = roots or PYTHON_ROOTS
+    excludes = set(PYTHON_EXCLUDES) | set(excludes or ())
+    found = set()
+    for root in roots:
+        found.update(collect_files(os.path.abspath(root), ('.py',), excludes))
+    return sorted(found)
+
+def check_python_syntax(scope=None, roots=None, excludes=None, jobs=0):
+    """Python 파일 문법 검사 (여러 프로세스에서 병렬 컴파일)"""
     print("\n" + "=" * 50)
     print("[Python 문법 검사]")
     print("=" * 50)
 
-    python_files = glob.glob(os.path.join(SCRIPT_DIR, '*.py'))
+    found = find_python_files(roots, excludes)
+    python_files = select_files('python', found, scope, config=sys.version)
+    skipped = len(found) - len(python_files)
     errors = []
-
-    for filepath in python_files:
-        filename = os.path.basename(filepath)
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                source = f.read()
-            compile(source, filename, 'exec')
-            print(f"  [OK] {filename}")
-        except SyntaxError as e:
-            print(f"  [ERROR] {filename}: Line {e.lineno} - {e.msg}")
+    timings = []
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(python_files) >= PARALLEL_MIN_FILES:
+        # TaskGraph 작업 스레드 안에서 실행되므로 fork 대신 spawn
+        # (다른 스레드가 잡고 있던 잠금을 자식이 물려받아 멈출 수 있음)
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn')) as executor:
+            compiled = list(executor.map(_compile_file, python_files, chunksize=8))
+    else:
+        compiled = [_compile_file(filepath) for filepath in python_files]
+
+    for filepath, error, elapsed_ms in compiled:
+        filename = os.path.relpath(filepath, PROJECT_DIR)
+        if filename.startswith(os.pardir):
+            filename = filepath
+        if error is None:
+            print(f"  [OK] {filename} ({elapsed_ms:.1f}ms)")
+        else:
+            print(f"  [ERROR] {filename}: {error}")
             errors.append(filename)
+        timings.append((elapsed_ms, filename))
+        if scope is not None:
+            scope.cache.record('python', filepath, error is None)
+
+    if len(timings) > 1:
+        print("\n  컴파일 시간 상위:")
+        for elapsed_ms, filename in sorted(timings, reverse=True)[:5]:
+            print(f"    {elapsed_ms:8.1f}ms  {filename}")
 
     if errors:
         print(f"\n[ERROR] {len(errors)}개 파일에 문법 오류가 있습니다.")
         return False
     else:
-        print(f"\n[OK] 모든 Python 파일 문법 정상 ({len(python_files)}개)")
+        print(f"\n[OK] Python 파일 문법 정상 ({len(python_files)}개 검사, 변경 없음 {skipped}개 건너뜀)")
         return True
 
-def run_eslint_frontend(fix=True):
+def eslint_json_npx(files, cwd, fix):
+    """npx eslint --format json 실행 -> 결과 목록 (JSON이 아니면 출력 후 None)"""
+    cmd = ['npx', 'eslint', '--format', 'json', '--no-error-on-unmatched-pattern']
+    if fix:
+        cmd.append('--fix')
+    cmd += [os.path.relpath(path, cwd) for path in files]
+
+    try:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        return json.loads(result.stdout)
+    except ValueError:
+        # 설정 오류 등으로 JSON이 아닌 출력 - 결과를 캐시하지 않음
+        print(result.stdout)
+        print(result.stderr)
+    except Exception as e:
+        print(f"[ERROR] 명령 실행 실패: {e}")
+    return None
+
+def run_eslint_files(tool, files, cwd, fix, scope, description, warm=True):
+    """지정한 파일만 ESLint 실행 (JSON 결과로 파일별 통과 여부를 캐시에 기록)
+
+    warm이면 상주 서버(lint_daemon)를 사용하고, 쓸 수 없으면 npx로 실행합니다.
+    """
+    if not files:
+        cached = scope.cache.stats['cached'] if scope is not None else 0
+        print(f"[OK] 검사할 변경 파일 없음 (캐시 재사용: {cached}개)")
+        return True
+
+    print(f"\n{'=' * 40}")
+    print(f"실행: {description} ({len(files)}개 파일, {'상주 서버' if warm else 'npx'})")
+    print(f"{'=' * 40}")
+
+    reports = lint_daemon.eslint(cwd, files, fix) if warm else None
+    if reports is None:
+        reports = eslint_json_npx(files, cwd, fix)
+    if reports is None:
+        return False
+
+    passed = True
+    for report in reports:
+        path = report['filePath']
+        for message in report.get('messages', []):
+            level = 'error' if message.get('severity') == 2 else 'warning'
+            print(f"  {os.path.relpath(path, cwd)}:{message.get('line', 0)}:{message.get('column', 0)} "
+                  f"{level} {message.get('message', '')} ({message.get('ruleId') or '-'})")
+        file_passed = report.get('errorCount', 0) == 0
+        passed = passed and file_passed
+        if scope is not None:
+            scope.cache.record(tool, path, file_passed)
+
+    if passed:
+        print(f"  [OK] {len(files)}개 파일 통과")
+    return passed
+
+def run_eslint_frontend(fix=True, scope=None, warm=True):
     """프론트엔드 ESLint 실행"""
     print("\n" + "=" * 50)
     print("[프론트엔드 ESLint 검사]")
@@ -79,25 +211,25 @@ def run_eslint_frontend(fix=True):
         return True
 
     # ESLint 설정 파일 확인
-    eslint_configs = [
-        '.eslintrc.js', '.eslintrc.json', '.eslintrc.yml',
-        'eslint.config.js', 'eslint.config.mjs'
-    ]
-    has_eslint = any(
-        os.path.exists(os.path.join(FRONTEND_DIR, config))
-        for config in eslint_configs
-    )
+    config_paths = [os.path.join(FRONTEND_DIR, config) for config in ESLINT_CONFIGS]
+    has_eslint = any(os.path.exists(path) for path in config_paths)
 
     if not has_eslint:
         print("[INFO] ESLint 설정 파일이 없습니다. 기본 검사 건너뜁니다.")
         return True
 
+    if scope is not None or warm:
+        files = collect_files(os.path.join(FRONTEND_DIR, 'src'), JS_EXTENSIONS)
+        config = fingerprint(config_paths + [os.path.join(FRONTEND_DIR, 'package.json')])
+        files = select_files('eslint-frontend', files, scope, config)
+        return run_eslint_files('eslint-frontend', files, FRONTEND_DIR, fix, scope, "ESLint 프론트엔드", warm)
+
     fix_flag = "--fix" if fix else ""
     cmd = f"npx eslint src/**/*.{{js,jsx,ts,tsx}} {fix_flag} --no-error-on-unmatched-pattern"
 
     return run_command(cmd, cwd=FRONTEND_DIR, description="ESLint 프론트엔드")
 
-def run_eslint_backend(fix=True):
+def run_eslint_backend(fix=True, scope=None, warm=True):
     """백엔드 ESLint 실행"""
     print("\n" + "=" * 50)
     print("[백엔드 ESLint 검사]")
@@ -107,10 +239,10 @@ def run_eslint_backend(fix=True):
         print(f"[SKIP] 백엔드 디렉토리 없음: {BACKEND_DIR}")
         return True
 
-    # package.json에서 eslint 스크립트 확인
     package_json_path = os.path.join(BACKEND_DIR, 'package.json')
-    if os.path.exists(package_json_path):
-        import json
+
+    # package.json에서 eslint 스크립트 확인 (전체 검사일 때만 사용)
+    if scope is None and os.path.exists(package_json_path):
         with open(package_json_path, 'r') as f:
             package_data = json.load(f)
             scripts = package_data.get('scripts', {})
@@ -118,13 +250,30 @@ def run_eslint_backend(fix=True):
                 fix_flag = ":fix" if fix else ""
                 return run_command(f"npm run lint{fix_flag}", cwd=BACKEND_DIR, description="ESLint 백엔드")
 
-    # 기본 ESLint 실행
+    if scope is not None or warm:
+        # 파일 목록을 직접 만들어 검사 (node_modules 등 제외)
+        files = collect_files(BACKEND_DIR, ('.js',))
+        config_paths = [os.path.join(BACKEND_DIR, config) for config in ESLINT_CONFIGS]
+        config = fingerprint(config_paths + [package_json_path])
+        files = select_files('eslint-backend', files, scope, config)
+        return run_eslint_files('eslint-backend', files, BACKEND_DIR, fix, scope, "ESLint 백엔드", warm)
+
+    # 기본 ESLint 실행 (글롭을 따옴표로 감싸 ESLint가 직접 펼치도록 - node_modules 등 제외)
     fix_flag = "--fix" if fix else ""
-    cmd = f"npx eslint **/*.js {fix_flag} --no-error-on-unmatched-pattern"
+    ignore_flags = " ".join(f"--ignore-pattern '{name}/'" for name in sorted(EXCLUDE_DIRS))
+    cmd = f"npx eslint '**/*.js' {ignore_flags} {fix_flag} --no-error-on-unmatched-pattern"
 
     return run_command(cmd, cwd=BACKEND_DIR, description="ESLint 백엔드")
 
-def run_typescript_check():
+def tsc_command(warm=True):
+    """tsc 실행 명령 - warm이면 로컬 tsc를 직접 실행하고 증분 빌드 정보(.tsbuildinfo) 재사용"""
+    if not warm:
+        return "npx tsc --noEmit"
+    local_tsc = os.path.join(FRONTEND_DIR, 'node_modules', '.bin', 'tsc')
+    tsc = f"'{local_tsc}'" if os.path.exists(local_tsc) else "npx tsc"
+    return f"{tsc} --noEmit --incremental --tsBuildInfoFile '{TSBUILDINFO_FILE}'"
+
+def run_typescript_check(scope=None, warm=True):
     """TypeScript 타입 체크"""
     print("\n" + "=" * 50)
     print("[TypeScript 타입 검사]")
@@ -139,7 +288,20 @@ def run_typescript_check():
         print("[INFO] tsconfig.json이 없습니다. TypeScript 검사 건너뜁니다.")
         return True
 
-    return run_command("npx tsc --noEmit", cwd=FRONTEND_DIR, description="TypeScript 타입 체크")
+    cmd = tsc_command(warm)
+    if scope is None:
+        return run_command(cmd, cwd=FRONTEND_DIR, description="TypeScript 타입 체크")
+
+    # 프로젝트 단위 검사 - 소스/설정 전체 지문이 마지막 통과 때와 같으면 건너뜀
+    sources = collect_files(FRONTEND_DIR, ('.ts', '.tsx', '.d.ts'))
+    digest = fingerprint(sources + [tsconfig_path, os.path.join(FRONTEND_DIR, 'package.json')])
+    if scope.cache.is_clean('typescript', 'project', digest):
+        print("[OK] 마지막 통과 이후 변경 없음 (캐시)")
+        return True
+
+    passed = run_command(cmd, cwd=FRONTEND_DIR, description="TypeScript 타입 체크")
+    scope.cache.record_digest('typescript', 'project', digest, passed)
+    return passed
 
 def run_prettier(fix=True):
     """Prettier 코드 포맷팅"""
@@ -161,6 +323,32 @@ def run_prettier(fix=True):
 
     return True
 
+def build_tasks(args, fix, scope, cache):
+    """실행할 검사 목록 - 자동 수정 시 같은 소스 트리를 고치는 도구는 잠금으로 순서 보장"""
+    warm = not args.cold
+    frontend_lock = ('frontend-src',) if fix else ()
+    backend_lock = ('backend-src',) if fix else ()
+
+    # Python 검사는 전체 검사에서도 결과 캐시로 변경 없는 파일을 건너뜀
+    python_scope = scope or LintScope(cache)
+    python = Task('python', 'Python 문법', func=lambda: check_python_syntax(
+        python_scope, args.py_root, args.py_exclude))
+    eslint_frontend = Task('eslint-frontend', 'ESLint 프론트엔드',
+                           func=lambda: run_eslint_frontend(fix, scope, warm), locks=frontend_lock)
+    eslint_backend = Task('eslint-backend', 'ESLint 백엔드',
+                          func=lambda: run_eslint_backend(fix, scope, warm), locks=backend_lock)
+    typescript = Task('typescript', 'TypeScript', func=lambda: run_typescript_check(scope, warm))
+    prettier = Task('prettier', 'Prettier', func=lambda: run_prettier(fix), locks=frontend_lock)
+
+    if args.python_only:
+        return [python]
+    if args.eslint_only:
+        return [eslint_frontend, eslint_backend]
+    if args.typescript_only:
+        return [typescript]
+    # 전체 검사 (ESLint --fix 다음에 Prettier 포맷팅)
+    return [python, eslint_frontend, eslint_backend, typescript, prettier]
+
 def main():
     import argparse
 
@@ -169,30 +357,54 @@ def main():
     parser.add_argument('--python-only', action='store_true', help='Python 검사만')
     parser.add_argument('--eslint-only', action='store_true', help='ESLint만')
     parser.add_argument('--typescript-only', action='store_true', help='TypeScript만')
+    parser.add_argument('--changed', nargs='?', const='HEAD', metavar='REF',
+                        help='REF(기본 HEAD) 대비 변경된 파일만 검사 (증분 모드)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='마지막으로 통과한 이후 내용이 바뀐 파일만 검사')
+    parser.add_argument('--no-cache', action='store_true', help='이전 검사 결과 캐시 무시')
+    parser.add_argument('--py-root', action='append', metavar='DIR',
+                        help='Python 검사 시작 디렉토리 (여러 번 지정 가능, 기본: 프로젝트 전체)')
+    parser.add_argument('--py-exclude', action='append', default=[], metavar='GLOB',
+                        help='Python 검사 제외 패턴 (이름 또는 상대 경로 글롭)')
+    parser.add_argument('--cold', action='store_true',
+                        help='상주 서버/증분 빌드 정보 없이 매번 npx로 새로 실행')
+    parser.add_argument('--jobs', type=int, default=0,
+                        help='동시에 실행할 최대 검사 수 (기본: 제한 없음, 1이면 순차 실행)')
 
     args = parser.parse_args()
     fix = not args.no_fix
 
+    cache = LintCache(None if args.no_cache else CACHE_FILE)
+    scope = None
+    if args.changed or args.incremental:
+        changed = None
+        if args.changed:
+            try:
+                changed = changed_files(args.changed, cwd=PROJECT_DIR)
+            except (RuntimeError, OSError) as e:
+                print(f"[ERROR] 변경 파일 목록을 가져올 수 없습니다: {e}")
+                return 1
+        scope = LintScope(cache, changed)
+
     results = []
 
     print("=" * 60)
     print("MEDCHECKER 코드 품질 검사")
     print(f"모드: {'검사 + 자동수정' if fix else '검사만'}")
+    if scope is not None:
+        base = f"{args.changed} 대비 변경 파일" if args.changed else "마지막 통과 이후 변경 파일"
+        print(f"범위: {base}")
     print("=" * 60)
 
-    if args.python_only:
-        results.append(('Python 문법', check_python_syntax()))
-    elif args.eslint_only:
-        results.append(('ESLint 프론트엔드', run_eslint_frontend(fix)))
-        results.append(('ESLint 백엔드', run_eslint_backend(fix)))
-    elif args.typescript_only:
-        results.append(('TypeScript', run_typescript_check()))
-    else:
-        # 전체 검사
-        results.append(('Python 문법', check_python_syntax()))
-        results.append(('ESLint 프론트엔드', run_eslint_frontend(fix)))
-        results.append(('ESLint 백엔드', run_eslint_backend(fix)))
-        results.append(('TypeScript', run_typescript_check()))
+    graph = TaskGraph(stream=True)
+    for task in build_tasks(args, fix, scope, cache):
+        graph.add(task)
+    graph.run(max_workers=args.jobs or None)
+
+    for name, task in graph.tasks.items():
+        results.append((task.label, graph.results[name].status == 'passed'))
+
+    cache.save()
 
     # 결과 요약
     print("\n" + "=" * 60)
@@ -206,6 +418,10 @@ def main():
         if not passed:
             all_passed = False
 
+    if cache.stats['checked'] or cache.stats['cached']:
+        stats = cache.stats
+        print(f"  검사 파일: {stats['checked']}개 (캐시 재사용: {stats['cached']}개)")
+    graph.print_timing()
     print("=" * 60)
 
     if all_passed:
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 증분 린트 지원
+변경된 파일만 검사할 수 있도록 git 변경 파일 목록과 검사 결과 캐시를 제공합니다.
+
+- changed_files(): 기준 ref 대비 변경 파일 + 작업 트리 변경 + 추적되지 않은 파일
+- collect_files(): node_modules 등 제외 디렉토리를 건너뛰며 확장자별 파일 수집
+- LintCache: 도구별로 "파일 내용 해시 -> 통과 여부" 기록
+  (__pycache__처럼 mtime/크기가 같으면 해시 계산도 생략,
+   도구 설정 파일이 바뀌면 해당 도구의 기록은 무효화)
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from fnmatch import fnmatch
+
+EXCLUDE_DIRS = {'node_modules', 'dist', 'build', 'coverage', '.git', '.vite', '__pycache__'}
+
+
+def file_hash(path):
+    """파일 내용 sha256 (읽을 수 없으면 None)"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def fingerprint(paths):
+    """여러 파일 경로+내용을 합친 해시 (없는 파일은 경로만 반영)"""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.encode('utf-8'))
+        digest.update((file_hash(path) or '-').encode('ascii'))
+    return digest.hexdigest()
+
+
+def _excluded(name, rel_path, patterns):
+    return any(fnmatch(name, pattern) or fnmatch(rel_path, pattern) for pattern in patterns)
+
+
+def collect_files(root, extensions, exclude_dirs=EXCLUDE_DIRS):
+    """root 아래에서 확장자가 맞는 파일 수집 (정렬된 절대 경로)
+
+    exclude_dirs는 디렉토리/파일 이름 또는 root 기준 상대 경로 글롭 패턴입니다.
+    """
+    found = []
+    if not os.path.isdir(root):
+        return found
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        rel_dir = '' if rel_dir == '.' else rel_dir
+        dirnames[:] = [
+            d for d in dirnames if not _excluded(d, os.path.join(rel_dir, d), exclude_dirs)
+        ]
+        for filename in filenames:
+            if filename.endswith(tuple(extensions)) and not _excluded(
+                    filename, os.path.join(rel_dir, filename), exclude_dirs):
+                found.append(os.path.join(dirpath, filename))
+    return sorted(found)
+
+
+def _git_lines(args, cwd):
+    result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {' '.join(args)} 실패")
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(base_ref='HEAD', cwd=None):
+    """기준 ref 대비 변경된 파일의 절대 경로 집합 (삭제된 파일 제외)
+
+    base_ref 이후 커밋, 스테이징/작업 트리 변경, 추적되지 않은 파일을 모두 포함합니다.
+    """
+    top = _git_lines(['rev-parse', '--show-toplevel'], cwd)[0]
+    names = set(_git_lines(['diff', '--name-only', '--diff-filter=d', base_ref], cwd))
+    names.update(_git_lines(['ls-files', '--others', '--exclude-standard', '--full-name'], cwd))
+    return {os.path.join(top, name) for name in names}
+
+
+def _stat_key(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class LintCache:
+    """도구별 검사 결과 캐시
+
+    {tool: {'config': 설정 해시, 'files': {경로: [내용 해시, 통과, mtime_ns, 크기]}}}
+    """
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.data = {}
+        self.stats = {'checked': 0, 'cached': 0}
+        self._hashes = {}
+        self._lock = threading.Lock()     # 여러 검사를 동시에 실행할 때 보호
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                self.data = {}
+
+    def hash(self, path):
+        if path not in self._hashes:
+            self._hashes[path] = file_hash(path)
+        return self._hashes[path]
+
+    def forget_hash(self, path):
+        """--fix 등으로 파일이 바뀐 뒤 다시 해시하도록 메모 삭제"""
+        self._hashes.pop(path, None)
+
+    def _tool(self, tool, config=None):
+        with self._lock:
+            return self._tool_entry(tool, config)
+
+    def _tool_entry(self, tool, config):
+        entry = self.data.setdefault(tool, {'config': config, 'files': {}})
+        if config is not None and entry.get('config') != config:
+            entry['config'] = config
+            entry['files'] = {}
+        return entry
+
+    def filter_unchecked(self, tool, paths, config=None):
+        """마지막으로 통과한 내용과 달라진 파일만 반환"""
+        files = self._tool(tool, config)['files']
+        pending = []
+        for path in paths:
+            record = files.get(path)
+            if not (record and record[1]):
+                pending.append(path)
+            elif record[2:] == _stat_key(path):
+                continue    # mtime/크기가 같으면 해시 생략
+            elif record[0] == self.hash(path):
+                record[2:] = _stat_key(path) or []    # 내용은 같고 mtime만 바뀜 (checkout 등)
+            else:
+                pending.append(path)
+        with self._lock:
+            self.stats['cached'] += len(paths) - len(pending)
+            self.stats['checked'] += len(pending)
+        return pending
+
+    def record(self, tool, path, passed):
+        self.forget_hash(path)
+        digest = self.hash(path)
+        files = self._tool(tool)['files']
+        if digest is None:
+            files.pop(path, None)
+        else:
+            files[path] = [digest, bool(passed)] + (_stat_key(path) or [])
+
+    def is_clean(self, tool, key, digest):
+        """파일 단위가 아닌 검사(tsc 등)의 마지막 통과 지문과 비교"""
+        record = self._tool(tool)['files'].get(key)
+        return bool(record and record[1] and record[0] == digest)
+
+    def record_digest(self, tool, key, digest, passed):
+        self._tool(tool)['files'][key] = [digest, bool(passed)]
+
+    def save(self):
+        if not self.cache_file:
+            return
+        tmp_path = os.path.splitext(self.cache_file)[0] + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_file)
+
+
+@dataclass
+class LintScope:
+    """증분 검사 범위 - changed가 None이면 캐시 기준으로만 선별"""
+    cache: LintCache
+    changed: set = None
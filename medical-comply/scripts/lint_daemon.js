@@ -0,0 +1,178 @@
+#!/usr/bin/env node
+/**
+ * MEDCHECKER ESLint 상주 서버 (lint_and_fix.py --cold 가 아닐 때 사용)
+ *
+ * 프로젝트별 ESLint 인스턴스를 메모리에 유지해 Node 시작, npx 탐색,
+ * 설정/파서 로딩 비용을 첫 실행에서만 치르도록 합니다.
+ *
+ * 프로토콜: 유닉스 소켓, 연결당 JSON 한 줄 요청 -> JSON 한 줄 응답
+ *   {"cmd": "ping"}
+ *   {"cmd": "lint", "cwd": "...", "targets": ["src/a.jsx"], "fix": true}
+ *   {"cmd": "stop"}
+ *
+ * lint 요청의 cwd는 <프로젝트 경로> 아래만 허용 (cwd 기준으로 eslint를 require하므로)
+ * 소켓/로그 디렉토리 권한은 lint_daemon.py가 0700으로 준비
+ *
+ * 사용: node lint_daemon.js <소켓 경로> <프로젝트 경로>
+ */
+
+const fs = require('fs');
+const net = require('net');
+const path = require('path');
+
+const SOCKET_PATH = process.argv[2];
+const PROJECT_ROOT = process.argv[3] && fs.realpathSync(process.argv[3]);
+const IDLE_TIMEOUT_MS = Number(process.env.LINT_DAEMON_IDLE || 1800) * 1000;
+
+const CONFIG_FILES = [
+  '.eslintrc.js', '.eslintrc.cjs', '.eslintrc.json', '.eslintrc.yml',
+  'eslint.config.js', 'eslint.config.mjs', 'eslint.config.cjs', 'package.json'
+];
+
+// `${cwd}:${fix}` -> { signature, modulePath, ESLint, eslint }
+const instances = new Map();
+let idleTimer = null;
+
+// 설정 파일이 바뀌면 인스턴스를 다시 만들기 위한 서명
+const configSignature = (cwd) => CONFIG_FILES.map((name) => {
+  try {
+    const stat = fs.statSync(path.join(cwd, name));
+    return `${name}:${stat.mtimeMs}:${stat.size}`;
+  } catch (error) {
+    return `${name}:-`;
+  }
+}).join('|');
+
+const getInstance = (cwd, fix) => {
+  const key = `${cwd}:${fix}`;
+  const signature = configSignature(cwd);
+  const cached = instances.get(key);
+  if (cached && cached.signature === signature) {
+    return cached;
+  }
+
+  // 프로젝트의 node_modules에 설치된 eslint 사용
+  const modulePath = require.resolve('eslint', { paths: [cwd] });
+  if (cached && cached.modulePath !== modulePath) {
+    delete require.cache[cached.modulePath];
+  }
+  const { ESLint } = require(modulePath);
+  const instance = {
+    signature,
+    modulePath,
+    ESLint,
+    eslint: new ESLint({ cwd, fix, errorOnUnmatchedPattern: false })
+  };
+  instances.set(key, instance);
+  return instance;
+};
+
+const inProject = (cwd) => {
+  const resolved = fs.realpathSync(cwd);
+  return resolved === PROJECT_ROOT || resolved.startsWith(PROJECT_ROOT + path.sep);
+};
+
+const lint = async ({ cwd, targets, fix }) => {
+  if (typeof cwd !== 'string' || !inProject(cwd)) {
+    throw new Error(`프로젝트 밖 경로는 검사하지 않음: ${cwd}`);
+  }
+  const { ESLint, eslint } = getInstance(fs.realpathSync(cwd), Boolean(fix));
+  const results = await eslint.lintFiles(targets);
+  if (fix) {
+    await ESLint.outputFixes(results);
+  }
+  // eslint --format json 과 같은 필드만 전달
+  return results.map((result) => ({
+    filePath: result.filePath,
+    errorCount: result.errorCount,
+    warningCount: result.warningCount,
+    messages: result.messages.map((message) => ({
+      line: message.line,
+      column: message.column,
+      severity: message.severity,
+      message: message.message,
+      ruleId: message.ruleId
+    }))
+  }));
+};
+
+const resetIdleTimer = (server) => {
+  clearTimeout(idleTimer);
+  idleTimer = setTimeout(() => server.close(), IDLE_TIMEOUT_MS);
+  idleTimer.unref();
+};
+
+const handle = async (request, server) => {
+  if (request.cmd === 'ping') {
+    return { ok: true, pid: process.pid, instances: instances.size };
+  }
+  if (request.cmd === 'stop') {
+    setImmediate(() => server.close());
+    return { ok: true };
+  }
+  if (request.cmd === 'lint') {
+    return { ok: true, results: await lint(request) };
+  }
+  return { ok: false, error: `알 수 없는 명령: ${request.cmd}` };
+};
+
+const removeSocket = () => {
+  try {
+    fs.unlinkSync(SOCKET_PATH);
+  } catch (error) {
+    // 소켓 파일 없음
+  }
+};
+
+const serve = () => {
+  const server = net.createServer((socket) => {
+    let buffer = '';
+    let handled = false;
+    socket.setEncoding('utf8');
+    socket.on('data', async (chunk) => {
+      buffer += chunk;
+      const newline = buffer.indexOf('\n');
+      if (newline === -1 || handled) return;
+      handled = true;
+
+      resetIdleTimer(server);
+      let response;
+      try {
+        response = await handle(JSON.parse(buffer.slice(0, newline)), server);
+      } catch (error) {
+        response = { ok: false, error: error.message };
+      }
+      socket.end(JSON.stringify(response) + '\n');
+    });
+    socket.on('error', () => {});
+  });
+
+  server.on('close', () => process.exit(0));
+  process.on('exit', removeSocket);
+  process.on('SIGTERM', () => process.exit(0));
+  process.on('SIGINT', () => process.exit(0));
+
+  server.listen(SOCKET_PATH, () => {
+    resetIdleTimer(server);
+    console.log(`[lint-daemon] ${SOCKET_PATH} 대기 중 (pid ${process.pid})`);
+  });
+};
+
+if (!SOCKET_PATH || !PROJECT_ROOT) {
+  console.error('사용법: node lint_daemon.js <소켓 경로> <프로젝트 경로>');
+  process.exit(2);
+}
+
+// 소켓 파일을 본인만 접근하도록 생성
+process.umask(0o077);
+
+// 이전 서버가 남긴 소켓 파일 정리 (응답하는 서버가 있으면 종료)
+const probe = net.connect(SOCKET_PATH);
+probe.on('connect', () => {
+  console.error(`[lint-daemon] 이미 실행 중: ${SOCKET_PATH}`);
+  process.exit(1);
+});
+probe.on('error', () => {
+  removeSocket();
+  serve();
+});
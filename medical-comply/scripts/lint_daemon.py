@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER ESLint 상주 서버 클라이언트
+lint_daemon.js를 한 번 띄워 두고 이후 실행에서는 유닉스 소켓으로 검사를 요청합니다.
+
+- 서버가 없으면 자동으로 시작 (LINT_DAEMON_IDLE초 동안 요청이 없으면 스스로 종료)
+- 서버를 쓸 수 없으면 None을 반환 -> 호출 측에서 npx 실행으로 대체
+- 소켓/로그는 사용자 전용(0700) 디렉토리에 둠: $XDG_RUNTIME_DIR/medchecker 또는 scripts/run/lint
+  (공용 /tmp의 예측 가능한 이름은 다른 사용자가 선점하거나 심볼릭 링크로 바꿔칠 수 있음)
+- 검사 대상 cwd는 프로젝트 디렉토리 아래만 허용 (서버도 같은 제한)
+- 직접 실행: python3 lint_daemon.py [start|stop|status]
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from readiness import Backoff
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+DAEMON_SCRIPT = os.path.join(SCRIPT_DIR, 'lint_daemon.js')
+
+# 프로젝트별 소켓 - 유닉스 소켓 경로 길이 제한(약 104바이트)을 넘으면 임시 디렉토리 아래 사용자별 디렉토리
+_project_id = hashlib.sha1(PROJECT_DIR.encode('utf-8')).hexdigest()[:12]
+SOCKET_MAX_LENGTH = 100
+
+
+def _default_run_dir():
+    base = os.getenv('XDG_RUNTIME_DIR')
+    run_dir = os.path.join(base, 'medchecker') if base else os.path.join(SCRIPT_DIR, 'run', 'lint')
+    if len(os.path.join(run_dir, f'lint-{_project_id}.sock')) > SOCKET_MAX_LENGTH:
+        run_dir = os.path.join(tempfile.gettempdir(), f'medchecker-{os.getuid()}')
+    return run_dir
+
+
+SOCKET_PATH = os.getenv('LINT_DAEMON_SOCKET') or os.path.join(_default_run_dir(), f'lint-{_project_id}.sock')
+RUN_DIR = os.path.dirname(SOCKET_PATH)
+LOG_PATH = os.path.splitext(SOCKET_PATH)[0] + '.log'
+START_TIMEOUT = 10
+
+_start_lock = threading.Lock()
+
+
+class DaemonError(Exception):
+    """상주 서버 요청 실패"""
+
+
+def prepare_run_dir():
+    """소켓 디렉토리를 0700으로 만들고 본인 소유인지 확인 - 안전하지 않으면 DaemonError"""
+    os.makedirs(RUN_DIR, mode=0o700, exist_ok=True)
+    info = os.lstat(RUN_DIR)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise DaemonError(f'{RUN_DIR}: 본인 소유 디렉토리가 아님')
+    if info.st_mode & 0o077:
+        os.chmod(RUN_DIR, 0o700)
+
+
+def in_project(path):
+    """path가 PROJECT_DIR 아래인지 (심볼릭 링크 해석 후)"""
+    root = os.path.realpath(PROJECT_DIR)
+    path = os.path.realpath(path)
+    return path == root or path.startswith(root + os.sep)
+
+
+def request(message, timeout=300):
+    """JSON 요청 한 건 전송 후 응답 반환"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(SOCKET_PATH)
+        sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    try:
+        return json.loads(b''.join(chunks).decode('utf-8'))
+    except ValueError as e:
+        raise DaemonError(f'잘못된 응답: {e}')
+
+
+def ping():
+    """서버 상태 (실행 중이 아니면 None)"""
+    try:
+        response = request({'cmd': 'ping'}, timeout=1)
+    except (OSError, DaemonError):
+        return None
+    return response if response.get('ok') else None
+
+
+def ensure_daemon():
+    """서버가 없으면 시작하고 응답할 때까지 대기 - 사용 가능하면 True"""
+    with _start_lock:
+        if ping():
+            return True
+        if not shutil.which('node') or not hasattr(socket, 'AF_UNIX'):
+            return False
+        try:
+            prepare_run_dir()
+            # 로그 파일이 심볼릭 링크면 열지 않음
+            fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_NOFOLLOW, 0o600)
+        except (OSError, DaemonError) as e:
+            print(f"[WARNING] ESLint 상주 서버 디렉토리를 쓸 수 없습니다: {e}")
+            return False
+
+        with os.fdopen(fd, 'a', encoding='utf-8') as log:
+            subprocess.Popen(
+                ['node', DAEMON_SCRIPT, SOCKET_PATH, os.path.realpath(PROJECT_DIR)],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=log,
+                start_new_session=True,
+            )
+
+        deadline = time.monotonic() + START_TIMEOUT
+        backoff = Backoff(initial=0.02, maximum=0.2)
+        while time.monotonic() < deadline:
+            if ping():
+                return True
+            time.sleep(backoff.next_delay())
+        return False
+
+
+def eslint(cwd, targets, fix=True):
+    """상주 서버로 ESLint 실행 -> eslint --format json 형식 결과 목록
+
+    서버를 쓸 수 없거나 프로젝트에 eslint가 설치되어 있지 않으면 None을 반환합니다.
+    cwd는 PROJECT_DIR 아래여야 합니다 (서버가 cwd 기준으로 eslint를 require하므로).
+    """
+    if not in_project(cwd):
+        print(f"[INFO] 프로젝트 밖 경로({cwd})는 상주 서버로 검사하지 않습니다. npx로 실행합니다.")
+        return None
+    if not ensure_daemon():
+        print("[INFO] ESLint 상주 서버를 시작할 수 없습니다. npx로 실행합니다.")
+        return None
+    try:
+        response = request({'cmd': 'lint', 'cwd': cwd, 'targets': list(targets), 'fix': fix})
+    except (OSError, DaemonError) as e:
+        print(f"[INFO] ESLint 상주 서버 요청 실패 ({e}). npx로 실행합니다.")
+        return None
+    if not response.get('ok'):
+        error = (str(response.get('error')).splitlines() or ['알 수 없는 오류'])[0]
+        print(f"[INFO] ESLint 상주 서버 오류 ({error}). npx로 실행합니다.")
+        return None
+    return response['results']
+
+
+def stop():
+    """서버 종료 - 실행 중이었으면 True"""
+    try:
+        request({'cmd': 'stop'}, timeout=2)
+    except (OSError, DaemonError):
+        return False
+    return True
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'status'
+
+    if command == 'start':
+        if ensure_daemon():
+            print(f"[OK] ESLint 상주 서버 실행 중 (pid {ping()['pid']}, 소켓: {SOCKET_PATH})")
+            return 0
+        print(f"[ERROR] ESLint 상주 서버를 시작할 수 없습니다. 로그: {LOG_PATH}")
+        return 1
+    if command == 'stop':
+        print("[OK] ESLint 상주 서버 종료" if stop() else "[INFO] 실행 중인 서버 없음")
+        return 0
+    if command == 'status':
+        status = ping()
+        if status:
+            print(f"[OK] 실행 중 (pid {status['pid']}, ESLint 인스턴스 {status['instances']}개)")
+        else:
+            print("[INFO] 실행 중인 서버 없음")
+        return 0
+
+    print("사용법: python3 lint_daemon.py [start|stop|status]")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
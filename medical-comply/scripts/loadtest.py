@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER API 부하 테스트
+헬스 체크로는 알 수 없는 백엔드의 동시 처리 능력(검사 요청 등)을 측정합니다.
+
+- 요청 구성(mix): /api/health, /api/reports, /api/reports/scan, /api/aeo/analyze,
+  /api/monitoring/status 를 가중치에 따라 무작위로 섞어 전송 (--mix health=4,scan=1)
+- closed-loop (--concurrency N): N개 워커가 응답을 받은 뒤 다음 요청 전송
+- open-loop (--rate R): 응답과 무관하게 초당 R건씩 요청 (지연 시간은 예정 시각부터 측정)
+  서버가 느려져도 요청이 줄지 않으므로 포화 지점 확인에 사용, --max-inflight 초과분은 dropped
+- --start-backend: config/database.js의 Mock 모드(MOCK_DB=true)로 백엔드를 별도 포트에 띄워
+  DB 없이 오프라인으로 실행
+- 경로별 처리량, 오류율, 지연 시간 백분위수(p50/p95/p99) 출력
+- --save-baseline / --compare: 결과를 기준으로 저장하고 이후 실행과 비교 (회귀 시 종료 코드 1)
+
+인증이 필요한 경로는 준비 단계에서 테스트 사용자를 가입시켜 받은 토큰을 사용합니다.
+무료 사용자는 하루 1회만 검사할 수 있으므로 scan은 403도 정상 응답으로 집계하며,
+검사 자체의 부하를 보려면 --scan-users로 검사 전용 사용자를 미리 만들어 둡니다.
+
+사용:
+  python3 loadtest.py --start-backend --duration 30 --concurrency 20
+  python3 loadtest.py --rate 200 --duration 60 --compare main
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import service_logs
+from http_probe import ConnectionPool, fetch
+from latency import LatencyHistogram
+from readiness import Service, print_ready_results, wait_for_services
+from supervisor import ServiceSpec, spawn, stop_child
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+BACKEND_DIR = os.path.join(PROJECT_DIR, 'backend')
+
+BACKEND_PORT = int(os.getenv('BACKEND_PORT', 5000))
+BACKEND_HOST = os.getenv('BACKEND_HOST', 'localhost')
+FRONTEND_PORT = int(os.getenv('FRONTEND_PORT', 5173))
+
+# --start-backend로 띄우는 Mock 백엔드 포트 (실행 중인 서버와 겹치지 않도록)
+LOADTEST_PORT = int(os.getenv('LOADTEST_PORT', BACKEND_PORT + 10))
+BASELINE_DIR = os.getenv('LOADTEST_BASELINE_DIR', os.path.join(SCRIPT_DIR, 'loadtest_baselines'))
+
+# 검사/분석 요청이 크롤링할 사이트 (기본: 로컬 프론트엔드 - 외부 네트워크 불필요)
+SITE_URL = os.getenv('LOADTEST_SITE_URL', f'http://localhost:{FRONTEND_PORT}/')
+
+REGISTER_CONCURRENCY = 8
+TEST_PASSWORD = 'loadtest-password-1234'
+
+
+@dataclass
+class Route:
+    """부하 테스트 요청 종류"""
+    name: str
+    method: str
+    path: str
+    weight: float = 1.0
+    body: dict = None
+    auth: bool = False
+    expect: tuple = (200,)     # 정상으로 집계할 HTTP 상태
+
+
+def default_routes(site_url=SITE_URL):
+    return [
+        Route('health', 'GET', '/api/health', 4),
+        Route('reports', 'GET', '/api/reports?limit=10', 3, auth=True),
+        Route('monitoring', 'GET', '/api/monitoring/status', 2),
+        # 무료 사용자 일일 제한(403)도 서버가 정상 처리한 응답
+        Route('scan', 'POST', '/api/reports/scan', 1, {'url': site_url}, auth=True, expect=(201, 403)),
+        Route('aeo', 'POST', '/api/aeo/analyze', 1, {'url': site_url, 'prompt': ''}, auth=True),
+    ]
+
+
+def apply_mix(routes, mix):
+    """'health=4,scan=1' 형식으로 가중치 변경 (0이면 제외, 지정하지 않은 경로는 기본값 유지)"""
+    by_name = {route.name: route for route in routes}
+    for item in filter(None, (part.strip() for part in (mix or '').split(','))):
+        name, _, weight = item.partition('=')
+        if name not in by_name:
+            raise ValueError(f"알 수 없는 경로: {name} (사용 가능: {', '.join(by_name)})")
+        by_name[name].weight = float(weight or 1)
+    return [route for route in routes if route.weight > 0]
+
+
+@dataclass
+class RouteStats:
+    """경로별 집계 - 지연 시간은 HTTP 응답을 받은 요청만 기록"""
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    requests: int = 0
+    failures: int = 0
+
+    def record(self, route, response, latency_ms):
+        self.requests += 1
+        if response.error:
+            self.errors[response.error] += 1
+            self.failures += 1
+            return
+        self.statuses[response.status] += 1
+        self.histogram.record(latency_ms)
+        if response.status not in route.expect:
+            self.failures += 1
+
+    def merge(self, other):
+        self.histogram.merge(other.histogram)
+        self.statuses.update(other.statuses)
+        self.errors.update(other.errors)
+        self.requests += other.requests
+        self.failures += other.failures
+
+    def to_dict(self, elapsed):
+        return {
+            'requests': self.requests,
+            'rps': round(self.requests / elapsed, 2) if elapsed else 0,
+            'error_rate': round(self.failures / self.requests * 100, 3) if self.requests else 0,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'errors': dict(self.errors),
+            'latency': self.histogram.summary(),
+        }
+
+
+class LoadTest:
+    """하나의 keep-alive 연결 풀로 요청을 보내고 경로별로 집계"""
+
+    def __init__(self, base_url, routes, tokens, scan_tokens=(), timeout=10.0,
+                 warmup=0.0, keepalive=True, seed=None):
+        self.base_url = base_url.rstrip('/')
+        self.routes = routes
+        self.weights = [route.weight for route in routes]
+        self.tokens = list(tokens)
+        self.scan_tokens = deque(scan_tokens)
+        self.timeout = timeout
+        self.warmup = warmup
+        self.keepalive = keepalive
+        self.random = random.Random(seed)
+        self.stats = {route.name: RouteStats() for route in routes}
+        self.warmup_requests = 0
+        self.dropped = 0
+        self._sent = 0
+        self._measure_from = None
+        self._pool = None
+
+    def _pick(self):
+        return self.random.choices(self.routes, self.weights)[0]
+
+    def _token(self, route):
+        if route.name == 'scan' and self.scan_tokens:
+            return self.scan_tokens.popleft()
+        if not self.tokens:
+            return None
+        self._sent += 1
+        return self.tokens[self._sent % len(self.tokens)]
+
+    async def _send(self, route, started=None):
+        """요청 1건 - started(예정 시각)가 있으면 그 시각부터 지연 시간 측정"""
+        started = started or time.perf_counter()
+        headers = {}
+        body = None
+        if route.auth:
+            token = self._token(route)
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+        if route.body is not None:
+            body = json.dumps(route.body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        response = await fetch(self.base_url + route.path, timeout=self.timeout, pool=self._pool,
+                               method=route.method, body=body, headers=headers)
+        if started < self._measure_from:
+            self.warmup_requests += 1
+            return
+        self.stats[route.name].record(route, response, (time.perf_counter() - started) * 1000)
+
+    async def run_closed(self, concurrency, duration=None, requests=None):
+        """closed-loop: concurrency개 워커가 각자 응답을 받은 뒤 다음 요청"""
+        issued = 0
+        deadline = time.perf_counter() + self.warmup + duration if duration else None
+
+        async def worker():
+            nonlocal issued
+            while True:
+                if requests is not None and issued >= requests:
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                issued += 1
+                await self._send(self._pick())
+
+        return await self._run(worker() for _ in range(max(1, concurrency)))
+
+    async def run_open(self, rate, duration=None, requests=None, max_inflight=1000):
+        """open-loop: 초당 rate건을 일정 간격으로 요청 (응답을 기다리지 않음)
+
+        지연 시간은 예정 시각부터 측정하므로 클라이언트가 밀린 시간도 포함됩니다.
+        동시에 진행 중인 요청이 max_inflight를 넘으면 보내지 않고 dropped로 집계합니다.
+        """
+        inflight = set()
+        interval = 1.0 / rate
+
+        async def scheduler():
+            start = time.perf_counter()
+            deadline = start + self.warmup + duration if duration else None
+            index = 0
+            while True:
+                if requests is not None and index >= requests:
+                    break
+                scheduled = start + index * interval
+                if deadline is not None and scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                index += 1
+                if len(inflight) >= max_inflight:
+                    if scheduled >= self._measure_from:
+                        self.dropped += 1
+                    continue
+                task = asyncio.ensure_future(self._send(self._pick(), scheduled))
+                inflight.add(task)
+                task.add_done_callback(inflight.discard)
+            if inflight:
+                await asyncio.gather(*inflight)
+
+        return await self._run([scheduler()])
+
+    async def _run(self, coroutines):
+        self._pool = ConnectionPool(max_idle_per_host=1024) if self.keepalive else None
+        started = time.perf_counter()
+        self._measure_from = started + self.warmup
+        try:
+            await asyncio.gather(*coroutines)
+        finally:
+            if self._pool:
+                await self._pool.close()
+        return max(time.perf_counter() - self._measure_from, 1e-9)
+
+
+# --- 준비 단계 ---
+
+async def _post_json(url, payload, timeout):
+    response = await fetch(url, timeout=timeout, method='POST',
+                           body=json.dumps(payload).encode('utf-8'),
+                           headers={'Content-Type': 'application/json'})
+    return response, response.json()
+
+
+async def register_users(base_url, count, label, timeout=10.0):
+    """테스트 사용자 count명 가입 -> 토큰 목록 (실패한 사용자는 제외)"""
+    run_id = datetime.now().strftime('%Y%m%d%H%M%S')
+    semaphore = asyncio.Semaphore(REGISTER_CONCURRENCY)
+    errors = Counter()
+
+    async def register(index):
+        payload = {
+            'email': f'loadtest-{run_id}-{label}-{index}@example.com',
+            'password': TEST_PASSWORD,
+            'name': f'부하테스트 {label}-{index}',
+        }
+        async with semaphore:
+            response, data = await _post_json(f'{base_url}/api/auth/register', payload, timeout)
+        if response.status == 201 and data.get('token'):
+            return data['token']
+        errors[response.error or f'HTTP {response.status}'] += 1
+        return None
+
+    tokens = await asyncio.gather(*(register(index) for index in range(count)))
+    for reason, count in errors.items():
+        print(f"[WARNING] 사용자 가입 실패 {count}건 ({reason})")
+    return [token for token in tokens if token]
+
+
+async def backend_database(base_url, timeout=10.0):
+    """/api/health의 database 값 (응답이 없으면 None)"""
+    response = await fetch(f'{base_url}/api/health', timeout=timeout)
+    return response.json().get('database') if response.ok else None
+
+
+def start_mock_backend(port):
+    """Mock DB 모드 백엔드를 port에 시작하고 준비될 때까지 대기 -> Child (실패 시 None)"""
+    env = {
+        'PORT': port,
+        'MOCK_DB': 'true',
+        # 토큰 발급용 (이미 설정되어 있으면 그대로 사용)
+        'JWT_SECRET': os.getenv('JWT_SECRET', 'medchecker-loadtest'),
+    }
+    spec = ServiceSpec('loadtest-backend', ['npm', 'start'], BACKEND_DIR, env, port, log_name='loadtest-backend')
+    child = spawn(spec)
+    print(f"[OK] Mock DB 백엔드 시작 (PID: {child.pid}, 포트: {port})")
+    service = Service('Mock 백엔드', port, f'http://localhost:{port}/api/health')
+    if print_ready_results(wait_for_services([service], processes={service.name: child.process})):
+        return child
+    service_logs.print_tail('loadtest-backend')
+    stop_child(child)
+    return None
+
+
+# --- 결과 ---
+
+def build_result(test, elapsed, mode, args):
+    total = RouteStats()
+    for stats in test.stats.values():
+        total.merge(stats)
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'base_url': test.base_url,
+        'mode': mode,
+        'concurrency': args.concurrency if mode == 'closed' else None,
+        'rate': args.rate if mode == 'open' else None,
+        'elapsed_s': round(elapsed, 3),
+        'warmup_requests': test.warmup_requests,
+        'dropped': test.dropped,
+        'mix': {route.name: route.weight for route in test.routes},
+        'total': total.to_dict(elapsed),
+        'routes': {name: stats.to_dict(elapsed) for name, stats in test.stats.items() if stats.requests},
+    }
+
+
+def _fmt_ms(value):
+    return f"{value:.1f}" if value is not None else '-'
+
+
+def print_result(result):
+    """경로별 처리량/오류율/백분위수 표"""
+    rows = list(result['routes'].items()) + [('전체', result['total'])]
+    print(f"  {'경로':<12}{'요청':>8}{'처리량/s':>10}{'오류율':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    print("  " + "-" * 75)
+    for name, data in rows:
+        latency = data['latency']
+        print(f"  {name:<12}{data['requests']:>8}{data['rps']:>10.1f}{data['error_rate']:>8.2f}%"
+              + ''.join(f"{_fmt_ms(latency.get(key)):>9}" for key in ('p50', 'p95', 'p99', 'max')))
+
+    for name, data in result['routes'].items():
+        statuses = {status: count for status, count in data['statuses'].items() if status != '200'}
+        if statuses or data['errors']:
+            details = [f"HTTP {status} {count}건" for status, count in statuses.items()]
+            details += [f"{kind} {count}건" for kind, count in data['errors'].items()]
+            print(f"  - {name}: {', '.join(details)}")
+    if result['dropped']:
+        print(f"  - dropped (동시 요청 상한 초과): {result['dropped']}건")
+
+
+def _baseline_path(name):
+    return os.path.join(BASELINE_DIR, f'{name}.json')
+
+
+def save_baseline(result, name):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    tmp_path = _baseline_path(name) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, _baseline_path(name))
+    return _baseline_path(name)
+
+
+def load_baseline(name):
+    with open(_baseline_path(name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _change(current, baseline):
+    if current is None or not baseline:
+        return None
+    return (current - baseline) / baseline * 100
+
+
+def compare(result, baseline, threshold):
+    """기준 결과와 경로별 비교 -> 회귀 목록
+
+    p95 지연이 threshold% 넘게 늘거나, closed-loop 처리량이 threshold% 넘게 줄거나,
+    오류율이 1%p 넘게 늘면 회귀로 판단합니다.
+    """
+    regressions = []
+    print(f"  {'경로':<12}{'p95 (기준 -> 현재)':>26}{'변화':>9}{'처리량 변화':>12}{'오류율 변화':>12}")
+    print("  " + "-" * 71)
+    routes = [name for name in result['routes'] if name in baseline.get('routes', {})]
+    for name in routes + ['전체']:
+        current = result['total'] if name == '전체' else result['routes'][name]
+        base = baseline['total'] if name == '전체' else baseline['routes'][name]
+        p95, base_p95 = current['latency'].get('p95'), base['latency'].get('p95')
+        p95_change = _change(p95, base_p95)
+        rps_change = _change(current['rps'], base['rps'])
+        error_change = current['error_rate'] - base['error_rate']
+
+        if p95_change is not None and p95_change > threshold:
+            regressions.append(f"{name}: p95 {base_p95:.1f}ms -> {p95:.1f}ms (+{p95_change:.0f}%)")
+        if result['mode'] == 'closed' and rps_change is not None and rps_change < -threshold:
+            regressions.append(f"{name}: 처리량 {base['rps']:.1f} -> {current['rps']:.1f}/s ({rps_change:.0f}%)")
+        if error_change > 1:
+            regressions.append(f"{name}: 오류율 {base['error_rate']:.2f}% -> {current['error_rate']:.2f}%")
+
+        p95_text = f"{_fmt_ms(base_p95)} -> {_fmt_ms(p95)}ms"
+        p95_delta = f"{p95_change:+.0f}%" if p95_change is not None else '-'
+        rps_delta = f"{rps_change:+.0f}%" if rps_change is not None else '-'
+        print(f"  {name:<12}{p95_text:>26}{p95_delta:>9}{rps_delta:>12}{error_change:>+11.2f}p")
+    return regressions
+
+
+async def prepare_tokens(base_url, routes, token=None, users=1, scan_users=0, timeout=10.0,
+                         allow_register=False):
+    """인증 경로용 토큰 준비 -> (공용 토큰 목록, 검사 전용 토큰 목록), 실패 시 None
+
+    실제 DB를 쓰는 백엔드에는 allow_register 없이 테스트 사용자를 만들지 않습니다.
+    """
+    if not any(route.auth for route in routes):
+        return [], []
+    if token:
+        return [token], []
+
+    database = await backend_database(base_url, timeout)
+    if database is None:
+        print(f"[ERROR] 백엔드에 연결할 수 없습니다: {base_url}/api/health")
+        return None
+    if database != 'mock' and not allow_register:
+        print(f"[ERROR] 백엔드가 실제 DB({database})를 사용 중입니다. 테스트 사용자를 만들지 않도록")
+        print("        --token을 지정하거나 --start-backend(Mock DB)로 실행하세요. (강제: --allow-register)")
+        return None
+
+    tokens = await register_users(base_url, users, 'user', timeout)
+    scan_tokens = await register_users(base_url, scan_users, 'scan', timeout) if scan_users else []
+    if not tokens:
+        print("[ERROR] 테스트 사용자를 만들 수 없습니다.")
+        return None
+    print(f"[OK] 테스트 사용자 {len(tokens)}명" + (f", 검사 전용 {len(scan_tokens)}명" if scan_users else ""))
+    return tokens, scan_tokens
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER API 부하 테스트')
+    parser.add_argument('--url', help=f'백엔드 주소 (기본: http://{BACKEND_HOST}:{BACKEND_PORT})')
+    parser.add_argument('--start-backend', action='store_true',
+                        help=f'Mock DB 모드 백엔드를 별도 포트({LOADTEST_PORT})에 띄워 실행 (DB/네트워크 불필요)')
+    parser.add_argument('--port', type=int, default=LOADTEST_PORT, help='--start-backend 포트')
+    parser.add_argument('--mix', help="경로별 가중치 (예: health=4,reports=3,monitoring=2,scan=1,aeo=1, 0이면 제외)")
+    parser.add_argument('--site-url', default=SITE_URL, help='scan/aeo 요청이 검사할 사이트 URL')
+    parser.add_argument('--concurrency', type=int, default=10, help='closed-loop 워커 수 (기본: 10)')
+    parser.add_argument('--rate', type=float, help='open-loop: 초당 요청 수 (지정 시 open-loop)')
+    parser.add_argument('--max-inflight', type=int, default=1000, help='open-loop: 동시 진행 요청 상한')
+    parser.add_argument('--duration', type=float, help='측정 시간 (초, 기본: 30)')
+    parser.add_argument('--requests', type=int, help='총 요청 수 (지정 시 --duration 대신 사용)')
+    parser.add_argument('--warmup', type=float, default=2, help='집계에서 제외할 초기 구간 (초)')
+    parser.add_argument('--timeout', type=float, default=10, help='요청별 제한 시간 (초)')
+    parser.add_argument('--no-keepalive', action='store_true', help='요청마다 새 연결 사용')
+    parser.add_argument('--token', help='인증 토큰 (지정하지 않으면 테스트 사용자 가입)')
+    parser.add_argument('--users', type=int, help='가입할 테스트 사용자 수 (기본: min(동시 요청, 10))')
+    parser.add_argument('--scan-users', type=int, default=0,
+                        help='검사 전용 사용자 수 (사용자당 검사 1회, 소진 후에는 일일 제한 403)')
+    parser.add_argument('--allow-register', action='store_true', help='실제 DB 백엔드에도 테스트 사용자 가입')
+    parser.add_argument('--seed', type=int, help='요청 순서 난수 시드')
+    parser.add_argument('--json-out', help='결과 JSON 저장 경로')
+    parser.add_argument('--save-baseline', metavar='NAME', help=f'결과를 기준으로 저장 ({BASELINE_DIR}/NAME.json)')
+    parser.add_argument('--compare', metavar='NAME', help='저장된 기준과 비교 (회귀 시 종료 코드 1)')
+    parser.add_argument('--threshold', type=float, default=20, help='회귀 판단 기준 (%%, 기본: 20)')
+
+    args = parser.parse_args()
+
+    try:
+        routes = apply_mix(default_routes(args.site_url), args.mix)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    if not routes:
+        print("[ERROR] 보낼 경로가 없습니다. --mix를 확인하세요.")
+        return 1
+
+    duration = args.duration if args.duration or args.requests else 30
+    mode = 'open' if args.rate else 'closed'
+
+    print("=" * 60)
+    print("MEDCHECKER API 부하 테스트")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+
+    child = None
+    if args.start_backend:
+        child = start_mock_backend(args.port)
+        if not child:
+            return 1
+    base_url = args.url or (f'http://localhost:{args.port}' if args.start_backend
+                            else f'http://{BACKEND_HOST}:{BACKEND_PORT}')
+
+    try:
+        prepared = asyncio.run(prepare_tokens(
+            base_url, routes, args.token, args.users or min(args.concurrency, 10), args.scan_users,
+            args.timeout, args.allow_register
+        ))
+        if prepared is None:
+            return 1
+        tokens, scan_tokens = prepared
+
+        scope = f"{duration:g}초" if args.requests is None else f"{args.requests}건"
+        load = f"초당 {args.rate:g}건 (open-loop)" if mode == 'open' else f"동시 {args.concurrency} (closed-loop)"
+        print(f"대상: {base_url} / 부하: {load} / 측정: {scope} (워밍업 {args.warmup:g}초)")
+        print("구성: " + ', '.join(f"{route.name}={route.weight:g}" for route in routes))
+        print()
+
+        test = LoadTest(base_url, routes, tokens, scan_tokens, args.timeout, args.warmup,
+                        keepalive=not args.no_keepalive, seed=args.seed)
+        if mode == 'open':
+            elapsed = asyncio.run(test.run_open(args.rate, duration if args.requests is None else None,
+                                                args.requests, args.max_inflight))
+        else:
+            elapsed = asyncio.run(test.run_closed(args.concurrency, duration if args.requests is None else None,
+                                                  args.requests))
+    finally:
+        if child:
+            stop_child(child)
+
+    result = build_result(test, elapsed, mode, args)
+    print_result(result)
+
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_out}")
+
+    exit_code = 0
+    if args.compare:
+        try:
+            baseline = load_baseline(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"\n[ERROR] 기준 결과를 읽을 수 없습니다: {e}")
+            return 1
+        print(f"\n[기준 비교: {args.compare} ({baseline.get('timestamp', '?')[:19]})]")
+        if baseline.get('mode') != mode:
+            print(f"[WARNING] 측정 방식이 다릅니다 (기준: {baseline.get('mode')}, 현재: {mode})")
+        regressions = compare(result, baseline, args.threshold)
+        if regressions:
+            print(f"\n[FAIL] 성능 회귀 {len(regressions)}건 (기준 {args.threshold:g}%)")
+            for item in regressions:
+                print(f"  - {item}")
+            exit_code = 1
+        else:
+            print("\n[OK] 성능 회귀 없음")
+
+    if args.save_baseline:
+        print(f"\n기준 저장: {save_baseline(result, args.save_baseline)}")
+
+    print("=" * 60)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 성능 회귀 검사
+배포 검사(deploy_check.py)에서 성능 지표를 기록하고 최근 기록과 비교합니다.
+
+지표 (모두 값이 작을수록 좋음):
+- build.duration_s: npm run build 소요 시간
+- bundle.total_bytes / bundle.gzip_bytes / bundle.chunk.<이름>_bytes: frontend/dist 번들 크기
+  (청크 이름의 빌드 해시는 제거하여 빌드 간 비교)
+- ready.<서버>_ms: 서버 재시작 후 준비 완료까지 걸린 시간 (auto_restart.py가 기록)
+- latency.<health|scan>.<p50|p95|p99>_ms: 엔드포인트 지연 시간 백분위수 (loadtest.py로 측정)
+
+기록은 perf_history.jsonl(JSON lines)에 한 줄씩 추가되며, 지표별로 최근 PERF_BASELINE_RUNS회
+기록의 중앙값을 기준으로 삼아 기준 대비 threshold% 넘게 나빠지면 실패합니다.
+(측정 잡음을 무시하기 위해 단위별 최소 변화량 미만은 회귀로 보지 않음)
+회귀로 판정된 값은 기록은 하되 기준 계산에서 제외합니다 - 같은 회귀로 재시도해도 기준이 따라가지 않음.
+의도한 변화(기능 추가로 번들 증가 등)는 --accept로 새 기준에 포함시킵니다.
+
+사용:
+  python3 perf_gate.py                 # 번들 크기 + 실행 중인 백엔드 지연 시간
+  python3 perf_gate.py --build         # 빌드 시간까지 측정
+  python3 perf_gate.py --history 10    # 최근 기록 출력
+  python3 perf_gate.py --accept        # 현재 값을 회귀여도 통과시키고 기준에 포함
+"""
+
+import asyncio
+import fnmatch
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from bundle_analysis import dist_chunks
+from loadtest import LoadTest, default_routes, prepare_tokens
+from supervisor import RUN_DIR
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+FRONTEND_DIR = os.path.join(PROJECT_DIR, 'frontend')
+DIST_DIR = os.path.join(FRONTEND_DIR, 'dist')
+
+BACKEND_PORT = int(os.getenv('BACKEND_PORT', 5000))
+BACKEND_HOST = os.getenv('BACKEND_HOST', 'localhost')
+
+HISTORY_FILE = os.getenv('PERF_HISTORY_FILE', os.path.join(SCRIPT_DIR, 'perf_history.jsonl'))
+READY_TIMES_FILE = os.path.join(RUN_DIR, 'ready_times.json')
+
+THRESHOLD = float(os.getenv('PERF_THRESHOLD', 20))         # 기준 대비 허용 악화율 (%)
+BASELINE_RUNS = int(os.getenv('PERF_BASELINE_RUNS', 5))     # 기준으로 삼을 최근 기록 수
+MIN_HISTORY = int(os.getenv('PERF_MIN_HISTORY', 3))         # 비교에 필요한 최소 기록 수
+LOAD_SECONDS = float(os.getenv('PERF_LOAD_SECONDS', 5))
+LOAD_CONCURRENCY = int(os.getenv('PERF_LOAD_CONCURRENCY', 4))
+SCAN_REQUESTS = int(os.getenv('PERF_SCAN_REQUESTS', 10))
+
+# 단위별 최소 변화량 - 이보다 작은 차이는 측정 잡음으로 간주
+MIN_DELTA = {'_ms': 5.0, '_s': 1.0, '_bytes': 2048}
+
+
+# --- 수집 ---
+
+def record_ready_times(ready_ms):
+    """서버별 준비 시간(ms) 기록 (auto_restart.py에서 호출) - {'backend': 812.0, ...}"""
+    os.makedirs(RUN_DIR, exist_ok=True)
+    tmp_path = READY_TIMES_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'recorded': time.time(), 'ready_ms': ready_ms}, f)
+    os.replace(tmp_path, READY_TIMES_FILE)
+
+
+def ready_metrics(since=None):
+    """since 이후 기록된 서버 준비 시간 지표"""
+    try:
+        with open(READY_TIMES_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if since is not None and data.get('recorded', 0) < since:
+        return {}
+    return {f'ready.{name}_ms': round(value, 1) for name, value in data.get('ready_ms', {}).items()
+            if value is not None}
+
+
+def bundle_metrics(dist_dir=DIST_DIR):
+    """빌드 결과물의 JS/CSS 청크별 크기, 전체 크기, gzip 크기"""
+    metrics = {}
+    total = gzip_total = 0
+    for name, size, gzip_size in dist_chunks(dist_dir):
+        key = f'bundle.chunk.{name}_bytes'
+        metrics[key] = metrics.get(key, 0) + size
+        total += size
+        gzip_total += gzip_size
+    if metrics:
+        metrics['bundle.total_bytes'] = total
+        metrics['bundle.gzip_bytes'] = gzip_total
+    return metrics
+
+
+def timed_build():
+    """npm run build 실행 -> 소요 시간(초), 실패 시 None"""
+    started = time.monotonic()
+    result = subprocess.run(['npm', 'run', 'build'], cwd=FRONTEND_DIR)
+    return time.monotonic() - started if result.returncode == 0 else None
+
+
+async def _latency(base_url):
+    routes = {route.name: route for route in default_routes()}
+    health, scan = routes['health'], routes['scan']
+
+    test = LoadTest(base_url, [health], [], warmup=1.0, seed=0)
+    await test.run_closed(LOAD_CONCURRENCY, duration=LOAD_SECONDS)
+    stats = {'health': test.stats['health']}
+
+    # 검사 요청은 사용자당 하루 1회이므로 요청마다 새 사용자 사용 (Mock DB 또는 PERF_TOKEN일 때만)
+    prepared = await prepare_tokens(base_url, [scan], os.getenv('PERF_TOKEN'), users=1, scan_users=SCAN_REQUESTS)
+    if prepared is None:
+        print("[INFO] 검사 요청 지연 시간 측정 건너뜀")
+    else:
+        tokens, scan_tokens = prepared
+        test = LoadTest(base_url, [scan], tokens, scan_tokens, seed=0)
+        await test.run_closed(min(LOAD_CONCURRENCY, SCAN_REQUESTS), requests=SCAN_REQUESTS)
+        stats['scan'] = test.stats['scan']
+
+    metrics = {}
+    for name, route_stats in stats.items():
+        if route_stats.failures:
+            print(f"[WARNING] {name} 요청 {route_stats.requests}건 중 {route_stats.failures}건 실패")
+        summary = route_stats.histogram.summary()
+        for key in ('p50', 'p95', 'p99'):
+            if summary.get(key) is not None:
+                metrics[f'latency.{name}.{key}_ms'] = round(summary[key], 2)
+    return metrics
+
+
+def latency_metrics(base_url):
+    """health/scan 엔드포인트 지연 시간 백분위수"""
+    return asyncio.run(_latency(base_url))
+
+
+# --- 기록 / 비교 ---
+
+def _git_revision():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                cwd=PROJECT_DIR, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def load_history(path=HISTORY_FILE):
+    """기록 목록 (손상된 줄은 건너뜀)"""
+    history = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    history.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return history
+
+
+def append_history(record, path=HISTORY_FILE):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def _counts_for_baseline(record, name):
+    """기준 계산에 쓸 값인지 - 회귀로 판정된 값은 --accept로 승인된 경우만"""
+    if name not in record.get('metrics', {}):
+        return False
+    return record.get('accepted') or name not in (record.get('regressions') or ())
+
+
+def baseline(history, name, runs=BASELINE_RUNS):
+    """지표의 최근 runs회 기록 중앙값 (회귀 값 제외, 기록이 MIN_HISTORY회 미만이면 None)"""
+    values = [record['metrics'][name] for record in history if _counts_for_baseline(record, name)][-runs:]
+    if len(values) < MIN_HISTORY:
+        return None
+    return statistics.median(values)
+
+
+def threshold_for(name, default, overrides):
+    """지표별 허용 악화율 - overrides는 [(패턴, %)], 나중에 지정한 패턴 우선"""
+    for pattern, value in reversed(overrides):
+        if fnmatch.fnmatch(name, pattern):
+            return value
+    return default
+
+
+def _min_delta(name):
+    return next((delta for suffix, delta in MIN_DELTA.items() if name.endswith(suffix)), 0)
+
+
+def evaluate(metrics, history, threshold=THRESHOLD, overrides=()):
+    """지표별 비교 -> [(이름, 값, 기준, 변화율%, 회귀 여부)]"""
+    rows = []
+    for name in sorted(metrics):
+        value = metrics[name]
+        base = baseline(history, name)
+        if base is None:
+            rows.append((name, value, None, None, False))
+            continue
+        change = (value - base) / base * 100 if base else 0.0
+        limit = threshold_for(name, threshold, overrides)
+        regressed = change > limit and value - base > _min_delta(name)
+        rows.append((name, value, base, change, regressed))
+    return rows
+
+
+def _format(name, value):
+    if name.endswith('_bytes'):
+        return f"{value / 1024:.1f}KB"
+    if name.endswith('_ms'):
+        return f"{value:.1f}ms"
+    if name.endswith('_s'):
+        return f"{value:.1f}s"
+    return f"{value:g}"
+
+
+def print_rows(rows):
+    width = max([len('지표')] + [len(row[0]) for row in rows])
+    print(f"  {'지표'.ljust(width)}  {'현재':>10}  {'기준':>10}  {'변화':>7}")
+    print("  " + "-" * (width + 35))
+    for name, value, base, change, regressed in rows:
+        base_text = _format(name, base) if base is not None else '(기록 부족)'
+        change_text = f"{change:+.0f}%" if change is not None else ''
+        mark = "  [REGRESSION]" if regressed else ""
+        print(f"  {name.ljust(width)}  {_format(name, value):>10}  {base_text:>10}  {change_text:>7}{mark}")
+
+
+def history_record(metrics, rows, accepted=False):
+    """perf_history.jsonl에 추가할 한 줄"""
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': _git_revision(),
+        'regressions': [row[0] for row in rows if row[4]],
+        'metrics': metrics,
+    }
+    if accepted:
+        record['accepted'] = True
+    return record
+
+
+def run_gate(build_seconds=None, since=None, base_url=None, latency=True, record=True,
+             threshold=THRESHOLD, overrides=(), accept=False):
+    """지표 수집 -> 기준과 비교 -> 기록 - 회귀가 없으면 True (deploy_check.py 단계)
+
+    accept=True이면 회귀가 있어도 통과시키고, 이번 값을 이후 기준 계산에 포함합니다.
+    """
+    base_url = base_url or f'http://{BACKEND_HOST}:{BACKEND_PORT}'
+    metrics = {}
+    if build_seconds is not None:
+        metrics['build.duration_s'] = round(build_seconds, 2)
+
+    bundle = bundle_metrics()
+    if bundle:
+        metrics.update(bundle)
+    else:
+        print(f"[INFO] 빌드 결과물 없음 - 번들 크기 측정 건너뜀 ({DIST_DIR})")
+    metrics.update(ready_metrics(since))
+    if latency:
+        metrics.update(latency_metrics(base_url))
+
+    if not metrics:
+        print("[WARNING] 수집된 성능 지표가 없습니다.")
+        return True
+
+    history = load_history()
+    rows = evaluate(metrics, history, threshold, overrides)
+    print(f"[성능 지표] 기준: 최근 {BASELINE_RUNS}회 중앙값, 허용 악화율 {threshold:g}%")
+    print_rows(rows)
+
+    regressions = [row for row in rows if row[4]]
+    if record:
+        append_history(history_record(metrics, rows, accepted=accept))
+
+    if regressions and accept:
+        print(f"[ACCEPT] 성능 회귀 {len(regressions)}건을 새 기준으로 승인")
+        return True
+    if regressions:
+        print(f"[FAIL] 성능 회귀 {len(regressions)}건")
+        return False
+    print("[OK] 성능 회귀 없음")
+    return True
+
+
+def parse_overrides(items):
+    """['bundle.*=10', ...] -> [('bundle.*', 10.0), ...]"""
+    overrides = []
+    for item in items or ():
+        pattern, sep, value = item.rpartition('=')
+        if not sep or not pattern:
+            raise ValueError(f"잘못된 형식: {item} (예: 'bundle.*=10')")
+        overrides.append((pattern, float(value)))
+    return overrides
+
+
+def print_history(count):
+    history = load_history()[-count:]
+    if not history:
+        print(f"[INFO] 기록 없음: {HISTORY_FILE}")
+        return
+    for record in history:
+        regressions = record.get('regressions') or []
+        status = f"[회귀 {len(regressions)}건]" if regressions else "[OK]"
+        if regressions and record.get('accepted'):
+            status = f"[승인 {len(regressions)}건]"
+        print(f"{record.get('timestamp')} {record.get('revision') or '-':<9} {status} "
+              f"지표 {len(record.get('metrics', {}))}개")
+        for name in regressions:
+            print(f"    - {name}: {_format(name, record['metrics'][name])}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 성능 회귀 검사')
+    parser.add_argument('--build', action='store_true', help='npm run build를 실행해 빌드 시간도 측정')
+    parser.add_argument('--url', help=f'지연 시간 측정 대상 백엔드 (기본: http://{BACKEND_HOST}:{BACKEND_PORT})')
+    parser.add_argument('--no-latency', action='store_true', help='엔드포인트 지연 시간 측정 안함')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help=f'허용 악화율 (%%, 기본: {THRESHOLD:g})')
+    parser.add_argument('--threshold-for', action='append', metavar='PATTERN=PCT',
+                        help="지표별 허용 악화율 (예: 'bundle.*=10', 여러 번 지정 가능)")
+    parser.add_argument('--no-record', action='store_true', help='결과를 기록하지 않음')
+    parser.add_argument('--accept', action='store_true', help='회귀가 있어도 통과시키고 현재 값을 기준에 포함 (의도한 변화)')
+    parser.add_argument('--history', type=int, metavar='N', help='최근 N개 기록 출력')
+
+    args = parser.parse_args()
+
+    if args.history:
+        print_history(args.history)
+        return 0
+
+    try:
+        overrides = parse_overrides(args.threshold_for)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    build_seconds = None
+    if args.build:
+        build_seconds = timed_build()
+        if build_seconds is None:
+            print("[ERROR] 빌드 실패")
+            return 1
+
+    ok = run_gate(build_seconds, base_url=args.url, latency=not args.no_latency,
+                  record=not args.no_record, threshold=args.threshold, overrides=overrides,
+                  accept=args.accept)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
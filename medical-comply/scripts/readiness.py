@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 서버 준비 상태 대기
+고정 sleep 대신 포트 바인딩 → 헬스 엔드포인트 순서로 폴링하여
+서버가 준비되는 즉시 반환합니다.
+
+- 지터를 섞은 지수 백오프 (초기 50ms, 최대 0.5초)
+- 전체 제한 시간 (deadline) 초과 시 실패 반환
+- 여러 서버를 동시에 대기하고 서버별 준비 시간(time-to-ready) 측정
+"""
+
+import asyncio
+import os
+import random
+import time
+from dataclasses import dataclass
+
+from http_probe import fetch
+
+READY_TIMEOUT = float(os.getenv('READY_TIMEOUT', 60))
+
+
+@dataclass
+class Service:
+    """대기 대상 서버"""
+    name: str
+    port: int
+    health_url: str = None     # None이면 포트 바인딩만 확인
+    host: str = 'localhost'
+
+
+@dataclass
+class ReadyResult:
+    """대기 결과 (시간은 대기 시작 기준 ms)"""
+    name: str
+    ready: bool
+    port_ms: float = None      # 포트 바인딩 확인 시점
+    ready_ms: float = None     # 헬스 엔드포인트 정상 응답 시점
+    attempts: int = 0
+    error: str = ''
+
+
+class Backoff:
+    """지터 지수 백오프 - delay * (1 - jitter ~ 1) 범위에서 무작위 대기"""
+
+    def __init__(self, initial=0.05, maximum=0.5, factor=2.0, jitter=0.5):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.attempt = 0
+
+    def next_delay(self):
+        delay = min(self.maximum, self.initial * self.factor ** self.attempt)
+        self.attempt += 1
+        return delay * random.uniform(1 - self.jitter, 1)
+
+
+async def _port_open(host, port, timeout=0.5):
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def _sleep_until(backoff, deadline):
+    """백오프 간격만큼 대기 (deadline을 넘기지 않음) - deadline 도달 시 False"""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return False
+    await asyncio.sleep(min(backoff.next_delay(), remaining))
+    return True
+
+
+async def wait_ready(service, timeout=READY_TIMEOUT, process=None):
+    """포트 바인딩 후 헬스 엔드포인트가 200을 반환할 때까지 대기
+
+    process(Popen)를 넘기면 대기 중 프로세스가 종료된 경우 즉시 실패합니다.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    result = ReadyResult(service.name, False)
+    backoff = Backoff()
+
+    def elapsed_ms():
+        return (time.monotonic() - started) * 1000
+
+    def exited():
+        if process is not None and process.poll() is not None:
+            result.error = f'프로세스 종료됨 (코드 {process.returncode})'
+            return True
+        return False
+
+    # 1단계: 포트 바인딩
+    while True:
+        result.attempts += 1
+        if await _port_open(service.host, service.port):
+            result.port_ms = elapsed_ms()
+            break
+        if exited():
+            return result
+        if not await _sleep_until(backoff, deadline):
+            result.error = f'포트 {service.port} 바인딩 대기 시간 초과'
+            return result
+
+    if not service.health_url:
+        result.ready = True
+        result.ready_ms = result.port_ms
+        return result
+
+    # 2단계: 헬스 엔드포인트 (포트가 열린 직후이므로 백오프를 다시 짧게 시작)
+    backoff = Backoff()
+    while True:
+        result.attempts += 1
+        remaining = deadline - time.monotonic()
+        response = await fetch(service.health_url, timeout=max(0.1, min(2.0, remaining)))
+        if response.ok:
+            result.ready = True
+            result.ready_ms = elapsed_ms()
+            return result
+        if exited():
+            return result
+        if not await _sleep_until(backoff, deadline):
+            detail = f'HTTP {response.status}' if response.error is None else response.error
+            result.error = f'헬스 체크 대기 시간 초과 ({detail})'
+            return result
+
+
+async def wait_port_free(port, timeout=10, host='localhost'):
+    """포트가 해제될 때까지 대기 - 해제되면 True"""
+    deadline = time.monotonic() + timeout
+    backoff = Backoff(initial=0.02, maximum=0.5)
+    while await _port_open(host, port, timeout=0.2):
+        if not await _sleep_until(backoff, deadline):
+            return False
+    return True
+
+
+async def _wait_all(services, timeout, processes):
+    return await asyncio.gather(*(
+        wait_ready(service, timeout, processes.get(service.name)) for service in services
+    ))
+
+
+def wait_for_services(services, timeout=READY_TIMEOUT, processes=None):
+    """여러 서버를 동시에 대기 -> ReadyResult 목록 (services 순서)"""
+    return asyncio.run(_wait_all(services, timeout, processes or {}))
+
+
+def wait_for_ports_free(ports, timeout=10):
+    """여러 포트 해제를 동시에 대기 -> {port: 해제 여부}"""
+    async def run():
+        results = await asyncio.gather(*(wait_port_free(port, timeout) for port in ports))
+        return dict(zip(ports, results))
+    return asyncio.run(run())
+
+
+def print_ready_results(results):
+    """서버별 준비 시간 출력 - 모두 준비되면 True"""
+    all_ready = True
+    for result in results:
+        if result.ready:
+            port_info = f", 포트 바인딩 {result.port_ms:.0f}ms" if result.port_ms != result.ready_ms else ""
+            print(f"[READY] {result.name}: {result.ready_ms:.0f}ms (시도 {result.attempts}회{port_info})")
+        else:
+            print(f"[ERROR] {result.name} 준비 실패: {result.error}")
+            all_ready = False
+    return all_ready
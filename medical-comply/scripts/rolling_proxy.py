@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 백엔드 무중단 재시작용 TCP 프록시
+공개 포트(BACKEND_PORT)를 프록시가 잡고, 실제 백엔드는 대체 포트에서 실행합니다.
+
+- 새 연결은 현재 upstream 포트로 전달, switch 명령으로 upstream 교체
+- 교체 전 upstream으로 열린 연결은 끊지 않고 끝날 때까지 유지 (drain)
+- 제어: 유닉스 소켓으로 JSON 한 줄 요청 (status / switch / stop)
+
+사용: python3 rolling_proxy.py --listen 5000 --upstream 5001 --control run/backend-proxy.sock
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from collections import Counter
+
+UPSTREAM_HOST = '127.0.0.1'
+CONNECT_RETRIES = 3
+BUFFER_SIZE = 65536
+
+
+class TcpProxy:
+    """연결 단위 TCP 프록시 - upstream별 활성 연결 수를 추적"""
+
+    def __init__(self, upstream_port, upstream_host=UPSTREAM_HOST):
+        self.upstream_port = upstream_port
+        self.upstream_host = upstream_host
+        self.active = Counter()
+        self.total = Counter()
+        self.failed = 0
+
+    async def _pipe(self, reader, writer):
+        try:
+            while True:
+                data = await reader.read(BUFFER_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+        except (ConnectionError, OSError):
+            writer.close()
+
+    async def _connect(self):
+        """현재 upstream에 연결 (교체 직후 실패하면 새 upstream으로 재시도)"""
+        for attempt in range(CONNECT_RETRIES):
+            port = self.upstream_port
+            try:
+                reader, writer = await asyncio.open_connection(self.upstream_host, port)
+                return port, reader, writer
+            except OSError:
+                if attempt == CONNECT_RETRIES - 1:
+                    raise
+                await asyncio.sleep(0.05 * (attempt + 1))
+
+    async def handle(self, client_reader, client_writer):
+        try:
+            port, upstream_reader, upstream_writer = await self._connect()
+        except OSError:
+            self.failed += 1
+            client_writer.close()
+            return
+
+        self.active[port] += 1
+        self.total[port] += 1
+        try:
+            await asyncio.gather(
+                self._pipe(client_reader, upstream_writer),
+                self._pipe(upstream_reader, client_writer),
+            )
+        finally:
+            self.active[port] -= 1
+            upstream_writer.close()
+            client_writer.close()
+
+    def status(self):
+        return {
+            'upstream': self.upstream_port,
+            'active': {str(port): count for port, count in self.active.items() if count},
+            'total': {str(port): count for port, count in self.total.items()},
+            'failed': self.failed,
+        }
+
+
+async def _bind(listen_port, handler, timeout):
+    """공개 포트 바인딩 (이전 서버가 포트를 놓을 때까지 짧게 재시도)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return await asyncio.start_server(handler, port=listen_port, reuse_address=True)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            await asyncio.sleep(0.01)
+
+
+async def serve(listen_port, upstream_port, control_path, bind_timeout=10):
+    proxy = TcpProxy(upstream_port)
+    stopped = asyncio.Event()
+
+    async def control(reader, writer):
+        try:
+            message = json.loads(await reader.readline())
+            command = message.get('cmd')
+            if command == 'status':
+                response = {'ok': True, **proxy.status()}
+            elif command == 'switch':
+                previous = proxy.upstream_port
+                proxy.upstream_port = int(message['port'])
+                print(f"[proxy] upstream {previous} -> {proxy.upstream_port}", flush=True)
+                response = {'ok': True, 'previous': previous, **proxy.status()}
+            elif command == 'stop':
+                stopped.set()
+                response = {'ok': True}
+            else:
+                response = {'ok': False, 'error': f'알 수 없는 명령: {command}'}
+        except (ValueError, KeyError) as e:
+            response = {'ok': False, 'error': str(e)}
+        writer.write(json.dumps(response).encode('utf-8') + b'\n')
+        await writer.drain()
+        writer.close()
+
+    if os.path.exists(control_path):
+        os.remove(control_path)
+    control_server = await asyncio.start_unix_server(control, path=control_path)
+    server = await _bind(listen_port, proxy.handle, bind_timeout)
+    print(f"[proxy] :{listen_port} -> :{upstream_port} (제어: {control_path})", flush=True)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopped.set)
+
+    await stopped.wait()
+    server.close()
+    control_server.close()
+    await server.wait_closed()
+    try:
+        os.remove(control_path)
+    except OSError:
+        pass
+
+
+# --- 제어 클라이언트 ---
+
+def control_request(control_path, message, timeout=2):
+    """프록시에 제어 요청 -> 응답 dict (프록시가 없으면 None)"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(control_path)
+            sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            data = b''
+            while not data.endswith(b'\n'):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+        return json.loads(data.decode('utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def proxy_status(control_path):
+    response = control_request(control_path, {'cmd': 'status'})
+    return response if response and response.get('ok') else None
+
+
+def switch_upstream(control_path, port):
+    response = control_request(control_path, {'cmd': 'switch', 'port': port})
+    return bool(response and response.get('ok'))
+
+
+def wait_drained(control_path, port, timeout):
+    """port로 향하던 연결이 모두 끝날 때까지 대기 -> 남은 연결 수"""
+    deadline = time.monotonic() + timeout
+    while True:
+        status = proxy_status(control_path)
+        remaining = int(status['active'].get(str(port), 0)) if status else 0
+        if remaining == 0 or time.monotonic() >= deadline:
+            return remaining
+        time.sleep(0.05)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 백엔드 무중단 재시작용 TCP 프록시')
+    parser.add_argument('--listen', type=int, required=True, help='공개 포트')
+    parser.add_argument('--upstream', type=int, required=True, help='처음 연결할 백엔드 포트')
+    parser.add_argument('--control', required=True, help='제어용 유닉스 소켓 경로')
+
+    args = parser.parse_args()
+    asyncio.run(serve(args.listen, args.upstream, args.control))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
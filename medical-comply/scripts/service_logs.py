@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 서버 로그 수집
+auto_restart.py로 띄운 서버의 stdout/stderr를 버리지 않고 파일로 남깁니다.
+
+- capture: 서버 명령을 자식으로 실행하고 논블로킹 파이프로 출력을 읽어
+  "시각 [서비스] [stdout|stderr] 내용" 형식으로 크기 기준 회전 로그에 기록
+  (줄 길이 제한으로 메모리 사용량 일정)
+- server.js 요청 로그("ISO시각 - METHOD 경로")를 경로별 요청 수로 집계 (<서비스>.routes.json)
+- tail(): 최근 N줄 조회 (healthcheck/deploy_check에서 실패 시 출력)
+
+사용:
+  python3 service_logs.py capture backend -- npm start
+  python3 service_logs.py tail backend -n 50
+  python3 service_logs.py routes backend
+"""
+
+import json
+import os
+import re
+import selectors
+import signal
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.getenv('SERVICE_LOG_DIR', os.path.join(SCRIPT_DIR, 'logs'))
+LOG_MAX_BYTES = int(os.getenv('SERVICE_LOG_MAX_BYTES', 5 * 1024 * 1024))
+LOG_BACKUPS = int(os.getenv('SERVICE_LOG_BACKUPS', 3))
+
+MAX_LINE_BYTES = 16 * 1024      # 이보다 긴 줄은 잘라서 기록
+MAX_ROUTES = 500                # 경로 종류 상한 (초과분은 '기타'로 집계)
+ROUTES_FLUSH_SECONDS = 2.0
+
+# server.js 요청 로깅 미들웨어: `${new Date().toISOString()} - ${req.method} ${req.path}`
+REQUEST_LOG = re.compile(r'^(\d{4}-\d{2}-\d{2}T[\d:.]+Z?) - ([A-Z]+) (\S+)$')
+ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F-]{16,})$')
+
+
+def log_path(service):
+    return os.path.join(LOG_DIR, f'{service}.log')
+
+
+def routes_path(service):
+    return os.path.join(LOG_DIR, f'{service}.routes.json')
+
+
+class RotatingLog:
+    """크기 기준 회전 로그 (service.log -> service.log.1 -> ... -> service.log.N)
+
+    다른 프로세스(무중단 재시작 중인 이전 서버 등)가 회전시킨 경우 새 파일을 다시 엽니다.
+    """
+
+    def __init__(self, path, max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._open()
+
+    def _open(self):
+        self.file = open(self.path, 'ab')
+        self.inode = os.fstat(self.file.fileno()).st_ino
+
+    def _rotate(self):
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f'{self.path}.{index}'
+            if os.path.exists(source):
+                os.replace(source, f'{self.path}.{index + 1}')
+        if self.backups > 0:
+            os.replace(self.path, f'{self.path}.1')
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def write(self, line):
+        try:
+            if os.stat(self.path).st_ino != self.inode:
+                self.file.close()
+                self._open()
+        except FileNotFoundError:
+            self.file.close()
+            self._open()
+        if self.file.tell() >= self.max_bytes:
+            self._rotate()
+        self.file.write(line.encode('utf-8', errors='replace') + b'\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def normalize_route(path):
+    """숫자/UUID 경로 조각을 :id로 바꿔 경로 종류 수를 제한"""
+    path = path.split('?', 1)[0]
+    return '/'.join(':id' if ID_SEGMENT.match(part) else part for part in path.split('/'))
+
+
+def _lock_file(f):
+    """파일 배타 잠금 (닫을 때 해제) - fcntl이 없는 환경(Windows)에서는 msvcrt, 둘 다 없으면 잠그지 않음"""
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    if fcntl is not None:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        return
+    try:
+        import msvcrt
+    except ImportError:
+        return
+    f.write(' ')
+    f.flush()
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+class RouteCounter:
+    """요청 로그 줄을 경로별 요청 수로 집계하고 주기적으로 파일에 합산
+
+    같은 서비스를 여러 프로세스가 동시에 기록할 수 있으므로(무중단 재시작 중)
+    저장 시 파일 잠금 후 기존 값에 증가분만 더합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pending = Counter()
+        self.first_seen = None
+        self.last_seen = None
+        self._flushed = time.monotonic()
+
+    def feed(self, line):
+        match = REQUEST_LOG.match(line.strip())
+        if not match:
+            return False
+        timestamp, method, path = match.groups()
+        self.pending[f'{method} {normalize_route(path)}'] += 1
+        self.first_seen = self.first_seen or timestamp
+        self.last_seen = timestamp
+        if time.monotonic() - self._flushed >= ROUTES_FLUSH_SECONDS:
+            self.flush()
+        return True
+
+    def flush(self):
+        self._flushed = time.monotonic()
+        if not self.pending:
+            return
+        with open(self.path + '.lock', 'w') as lock:
+            _lock_file(lock)
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            counts = Counter(data.get('routes', {}))
+            for key, count in self.pending.items():
+                if key not in counts and len(counts) >= MAX_ROUTES:
+                    key = f"{key.split(' ', 1)[0]} (기타)"
+                counts[key] += count
+            data = {
+                'routes': dict(counts.most_common()),
+                'total': sum(counts.values()),
+                'first_seen': data.get('first_seen') or self.first_seen,
+                'last_seen': self.last_seen,
+            }
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        self.pending.clear()
+
+
+def _timestamp():
+    return datetime.now().isoformat(timespec='milliseconds')
+
+
+def capture(service, cmd):
+    """cmd를 실행하며 출력을 로그로 수집 -> 자식 종료 코드 (신호 종료는 128 + 신호 번호)"""
+    log = RotatingLog(log_path(service))
+    routes = RouteCounter(routes_path(service))
+    process = subprocess.Popen(
+        cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+
+    # 그룹 전체가 아닌 이 프로세스에만 종료 신호가 온 경우 자식에게 전달
+    def forward(signum, frame):
+        if process.poll() is None:
+            process.send_signal(signum)
+    for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(sig, forward)
+
+    log.write(f"{_timestamp()} [{service}] [capture] 시작: {' '.join(cmd)} (PID {process.pid})")
+
+    selector = selectors.DefaultSelector()
+    buffers = {}
+    for name, stream in (('stdout', process.stdout), ('stderr', process.stderr)):
+        os.set_blocking(stream.fileno(), False)
+        selector.register(stream, selectors.EVENT_READ, name)
+        buffers[name] = b''
+
+    def emit(name, raw):
+        line = raw.decode('utf-8', errors='replace').rstrip('\r')
+        log.write(f"{_timestamp()} [{service}] [{name}] {line}")
+        if name == 'stdout':
+            routes.feed(line)
+
+    while selector.get_map():
+        for key, _ in selector.select(timeout=ROUTES_FLUSH_SECONDS):
+            name = key.data
+            try:
+                chunk = os.read(key.fileobj.fileno(), 65536)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                selector.unregister(key.fileobj)
+                if buffers[name]:
+                    emit(name, buffers[name])
+                continue
+            *lines, rest = (buffers[name] + chunk).split(b'\n')
+            for raw in lines:
+                emit(name, raw[:MAX_LINE_BYTES])
+            if len(rest) > MAX_LINE_BYTES:
+                emit(name, rest[:MAX_LINE_BYTES] + ' ...(잘림)'.encode('utf-8'))
+                rest = b''
+            buffers[name] = rest
+        routes.flush()
+
+    code = process.wait()
+    routes.flush()
+    log.write(f"{_timestamp()} [{service}] [capture] 종료 (코드 {code})")
+    log.close()
+    return code if code >= 0 else 128 - code
+
+
+def capture_command(service, cmd):
+    """cmd를 로그 수집 프로세스로 감싼 명령"""
+    return [sys.executable, os.path.abspath(__file__), 'capture', service, '--', *cmd]
+
+
+def tail(service, lines=50):
+    """최근 lines줄 (회전된 이전 파일까지 거슬러 읽음)"""
+    collected = []
+    paths = [log_path(service)] + [f'{log_path(service)}.{index}' for index in range(1, LOG_BACKUPS + 1)]
+    for path in paths:
+        if len(collected) >= lines:
+            break
+        collected = _tail_file(path, lines - len(collected)) + collected
+    return collected
+
+
+def _tail_file(path, lines, block_size=8192):
+    """파일 끝에서부터 블록 단위로 읽어 마지막 lines줄 반환"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b''
+            while position > 0 and data.count(b'\n') <= lines:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+    except OSError:
+        return []
+    text = data.decode('utf-8', errors='replace').splitlines()
+    return text[-lines:] if lines else []
+
+
+def print_tail(service, lines=20):
+    """최근 로그 출력 (healthcheck/deploy_check 실패 시) - 로그가 있으면 True"""
+    recent = tail(service, lines)
+    if not recent:
+        return False
+    print(f"\n  [{service} 최근 로그 {len(recent)}줄] ({log_path(service)})")
+    for line in recent:
+        print(f"    {line}")
+    return True
+
+
+def route_counts(service):
+    """경로별 요청 수 {'GET /api/health': n, ...}"""
+    try:
+        with open(routes_path(service), 'r', encoding='utf-8') as f:
+            return json.load(f).get('routes', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    import argparse
+
+    if len(sys.argv) > 2 and sys.argv[1] == 'capture':
+        # capture <서비스> -- <명령...> (명령 인자는 argparse로 해석하지 않음)
+        service = sys.argv[2]
+        cmd = sys.argv[4:] if sys.argv[3:4] == ['--'] else sys.argv[3:]
+        return capture(service, cmd)
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 서버 로그 조회')
+    parser.add_argument('command', choices=['tail', 'routes'], help='tail: 최근 로그, routes: 경로별 요청 수')
+    parser.add_argument('service', help='서비스 이름 (backend, frontend 등)')
+    parser.add_argument('-n', '--lines', type=int, default=50, help='tail 줄 수 (기본: 50)')
+
+    args = parser.parse_args()
+
+    if args.command == 'tail':
+        if not print_tail(args.service, args.lines):
+            print(f"[INFO] 로그 없음: {log_path(args.service)}")
+        return 0
+
+    counts = route_counts(args.service)
+    if not counts:
+        print(f"[INFO] 집계된 요청 없음: {routes_path(args.service)}")
+        return 0
+    print(f"[{args.service} 경로별 요청 수] 총 {sum(counts.values())}건")
+    for route, count in counts.items():
+        print(f"  {count:>8}  {route}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 서버 프로세스 관리
+lsof/kill -9 셸 호출 대신 자식 프로세스와 프로세스 그룹을 직접 관리합니다.
+
+- 포트 점유 프로세스: /proc/net/tcp(6)의 LISTEN 소켓 inode -> /proc/<pid>/fd 매칭
+  (프로세스를 띄우지 않으며, 해당 포트에 연결만 한 클라이언트는 건드리지 않음)
+- 종료: SIGTERM 후 제한 시간 안에 끝나지 않을 때만 SIGKILL
+- 시작한 서버는 새 프로세스 그룹(세션)으로 실행하고 pid 파일에 기록
+  (npm -> node 처럼 자식까지 그룹 단위로 종료)
+- Supervisor: 포그라운드에서 서버를 감시하고 비정상 종료 시 백오프 후 재시작
+- log_name이 지정된 서버는 service_logs 수집 프로세스로 감싸 출력을 로그 파일로 남김
+
+POSIX(Linux/macOS) 전용: os.killpg/getpgrp, start_new_session, /proc 또는 lsof를 사용합니다.
+Windows 포트 종료는 auto_restart.kill_port의 netstat/taskkill 경로가 담당합니다.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+import service_logs
+from readiness import Backoff
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RUN_DIR = os.getenv('SUPERVISOR_RUN_DIR', os.path.join(SCRIPT_DIR, 'run'))
+STOP_TIMEOUT = float(os.getenv('SUPERVISOR_STOP_TIMEOUT', 10))
+
+TCP_LISTEN = '0A'
+PROC_NET_TCP = ('/proc/net/tcp', '/proc/net/tcp6')
+
+
+@dataclass
+class ServiceSpec:
+    """관리 대상 서버 - cmd는 셸을 거치지 않고 직접 실행
+
+    log_name: 출력을 기록할 로그 이름 (None이면 출력을 버림)
+    """
+    name: str
+    cmd: list
+    cwd: str = None
+    env: dict = field(default_factory=dict)
+    port: int = None
+    log_name: str = None
+
+
+@dataclass
+class Child:
+    """실행 중인 서버 프로세스"""
+    spec: ServiceSpec
+    process: subprocess.Popen
+    started: float
+    restarts: int = 0
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+
+# --- 포트 점유 프로세스 탐색 ---
+
+def _listening_inodes(port):
+    """port에서 LISTEN 중인 소켓 inode 집합"""
+    inodes = set()
+    for path in PROC_NET_TCP:
+        try:
+            with open(path, 'r') as f:
+                next(f)  # 헤더
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 10 or fields[3] != TCP_LISTEN:
+                        continue
+                    if int(fields[1].rsplit(':', 1)[1], 16) == port:
+                        inodes.add(fields[9])
+        except (OSError, StopIteration):
+            continue
+    return inodes
+
+
+def _socket_owners(inodes):
+    """소켓 inode를 열고 있는 pid 집합 (권한이 없는 프로세스는 건너뜀)"""
+    targets = {f'socket:[{inode}]' for inode in inodes}
+    owners = set()
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        fd_dir = f'/proc/{entry}/fd'
+        try:
+            for fd in os.listdir(fd_dir):
+                if os.readlink(f'{fd_dir}/{fd}') in targets:
+                    owners.add(int(entry))
+                    break
+        except OSError:
+            continue
+    return owners
+
+
+def listening_pids(port):
+    """port에서 연결을 받고 있는(LISTEN) 프로세스 pid 집합"""
+    if os.path.exists(PROC_NET_TCP[0]):
+        inodes = _listening_inodes(port)
+        return _socket_owners(inodes) if inodes else set()
+
+    # /proc이 없는 환경(macOS 등) - LISTEN 소켓만 조회
+    result = subprocess.run(
+        ['lsof', '-nP', f'-iTCP:{port}', '-sTCP:LISTEN', '-t'],
+        capture_output=True, text=True
+    )
+    return {int(pid) for pid in result.stdout.split() if pid.isdigit()}
+
+
+# --- 종료 ---
+
+def pid_alive(pid):
+    """프로세스가 살아 있는지 (좀비는 종료된 것으로 간주)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    try:
+        with open(f'/proc/{pid}/stat', 'r') as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except (OSError, IndexError):
+        return True
+
+
+def _alive(pid, group):
+    """group이면 그룹에 남은 프로세스가 있는지, 아니면 해당 프로세스가 살아 있는지"""
+    if not group:
+        return pid_alive(pid)
+    try:
+        os.killpg(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _signal(pid, sig, group):
+    """group이면 프로세스 그룹 전체에, 아니면 해당 프로세스에만 신호 전송"""
+    try:
+        if group:
+            os.killpg(pid, sig)
+        else:
+            os.kill(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _reap(pid):
+    """직접 띄운 자식이면 좀비가 남지 않도록 회수"""
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        pass
+
+
+def stop_pids(pids, timeout=STOP_TIMEOUT, groups=()):
+    """SIGTERM -> (deadline 초과 시) SIGKILL
+
+    groups에 포함된 pid는 프로세스 그룹 리더로 보고 그룹 전체에 신호를 보냅니다.
+    반환: (정상 종료된 pid 목록, 강제 종료된 pid 목록)
+    """
+    pids = [pid for pid in pids if pid != os.getpid()]
+    own_group = os.getpgrp()
+    use_group = {pid: pid in groups and pid != own_group for pid in pids}
+
+    for pid in pids:
+        _signal(pid, signal.SIGTERM, use_group[pid])
+
+    deadline = time.monotonic() + timeout
+    backoff = Backoff(initial=0.005, maximum=0.1)
+    remaining = list(pids)
+    while remaining and time.monotonic() < deadline:
+        for pid in remaining:
+            _reap(pid)
+        remaining = [pid for pid in remaining if _alive(pid, use_group[pid])]
+        if remaining:
+            time.sleep(backoff.next_delay())
+
+    for pid in remaining:
+        _signal(pid, signal.SIGKILL, use_group[pid])
+        _reap(pid)
+    terminated = [pid for pid in pids if pid not in remaining]
+    return terminated, remaining
+
+
+# --- pid 파일 ---
+
+def _pidfile_path(name):
+    return os.path.join(RUN_DIR, f'{name}.pid')
+
+
+def write_pidfile(child):
+    os.makedirs(RUN_DIR, exist_ok=True)
+    data = {
+        'name': child.spec.name,
+        'pid': child.pid,
+        'pgid': child.pid,
+        'port': child.spec.port,
+        'cmd': child.spec.cmd,
+        'started': time.time(),
+    }
+    tmp_path = _pidfile_path(child.spec.name) + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, _pidfile_path(child.spec.name))
+
+
+def read_pidfile(name):
+    """기록된 서버 정보 (없거나 이미 종료됐으면 None)"""
+    try:
+        with open(_pidfile_path(name), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if pid_alive(data.get('pid', 0)) else None
+
+
+def remove_pidfile(name):
+    try:
+        os.remove(_pidfile_path(name))
+    except OSError:
+        pass
+
+
+def tracked_groups():
+    """pid 파일에 기록된(이 스크립트가 띄운) 프로세스 그룹 {pgid: name}"""
+    groups = {}
+    if not os.path.isdir(RUN_DIR):
+        return groups
+    for filename in os.listdir(RUN_DIR):
+        if filename.endswith('.pid'):
+            data = read_pidfile(filename[:-4])
+            if data:
+                groups[data['pgid']] = data['name']
+    return groups
+
+
+def _pgid(pid):
+    try:
+        return os.getpgid(pid)
+    except OSError:
+        return None
+
+
+def stop_port(port, timeout=STOP_TIMEOUT):
+    """port를 LISTEN 중인 프로세스 종료 -> (정상 종료 pid, 강제 종료 pid)
+
+    이 스크립트가 띄운 서버(pid 파일 기록)면 프로세스 그룹 전체를,
+    그 밖의 프로세스는 LISTEN 소켓을 가진 프로세스만 종료합니다.
+    """
+    owners = listening_pids(port)
+    if not owners:
+        return [], []
+
+    tracked = tracked_groups()
+    targets = set()
+    groups = set()
+    for pid in owners:
+        pgid = _pgid(pid)
+        if pgid in tracked:
+            targets.add(pgid)
+            groups.add(pgid)
+        else:
+            targets.add(pid)
+
+    result = stop_pids(targets, timeout, groups)
+    for pgid in groups:
+        remove_pidfile(tracked[pgid])
+    return result
+
+
+# --- 시작 ---
+
+def spawn(spec, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL):
+    """새 프로세스 그룹으로 서버 시작 후 pid 파일 기록
+
+    log_name이 있으면 수집 프로세스가 그룹 리더가 되어 서버와 함께 종료됩니다.
+    """
+    env = os.environ.copy()
+    env.update({key: str(value) for key, value in spec.env.items()})
+    cmd = spec.cmd
+    if spec.log_name:
+        cmd = service_logs.capture_command(spec.log_name, spec.cmd)
+    process = subprocess.Popen(
+        cmd,
+        cwd=spec.cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=stdout,
+        stderr=stderr,
+        start_new_session=True,
+    )
+    child = Child(spec, process, time.monotonic())
+    write_pidfile(child)
+    return child
+
+
+def stop_child(child, timeout=STOP_TIMEOUT):
+    """직접 띄운 서버를 그룹 단위로 종료 - 강제 종료했으면 False"""
+    _, killed = stop_pids([child.pid], timeout, groups={child.pid})
+    child.process.poll()
+    remove_pidfile(child.spec.name)
+    return not killed
+
+
+class Supervisor:
+    """서버를 포그라운드에서 감시하며 비정상 종료 시 재시작
+
+    재시작 간격은 지수 백오프(1초 ~ 30초)이며, STABLE_SECONDS 이상 정상 실행되면 초기화됩니다.
+    SIGINT/SIGTERM을 받으면 모든 서버를 정상 종료하고 반환합니다.
+    """
+
+    STABLE_SECONDS = 60
+
+    def __init__(self, specs, spawn_func=spawn, poll_interval=0.2):
+        self.specs = list(specs)
+        self.spawn_func = spawn_func
+        self.poll_interval = poll_interval
+        self.children = {}
+        self._backoff = {}
+        self._restart_at = {}
+        self._stopping = False
+
+    def _start(self, spec, restarts=0):
+        child = self.spawn_func(spec)
+        child.restarts = restarts
+        self.children[spec.name] = child
+        print(f"[OK] {spec.name} 시작 (PID: {child.pid})")
+        return child
+
+    def _handle_exit(self, name, child):
+        code = child.process.returncode
+        uptime = time.monotonic() - child.started
+        # 그룹 리더만 죽고 남은 자식(npm 아래 node 등)이 포트를 잡고 있지 않도록 정리
+        stop_pids([child.pid], timeout=2, groups={child.pid})
+        remove_pidfile(name)
+
+        backoff = self._backoff.setdefault(name, Backoff(initial=1.0, maximum=30.0, jitter=0.2))
+        if uptime >= self.STABLE_SECONDS:
+            backoff.attempt = 0
+        delay = backoff.next_delay()
+        self._restart_at[name] = (time.monotonic() + delay, child.restarts + 1)
+        print(f"[WARNING] {name} 종료됨 (코드 {code}, 실행 {uptime:.1f}초) - {delay:.1f}초 후 재시작")
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
+
+    def run(self):
+        """감시 루프 - 종료 신호를 받으면 모든 서버를 멈추고 0 반환"""
+        previous = {sig: signal.signal(sig, self._request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            for spec in self.specs:
+                self._start(spec)
+
+            while not self._stopping:
+                now = time.monotonic()
+                for name, child in list(self.children.items()):
+                    if child.process.poll() is not None:
+                        del self.children[name]
+                        self._handle_exit(name, child)
+
+                for spec in self.specs:
+                    pending = self._restart_at.get(spec.name)
+                    if pending and now >= pending[0]:
+                        del self._restart_at[spec.name]
+                        self._start(spec, restarts=pending[1])
+
+                time.sleep(self.poll_interval)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+            self.stop_all()
+        return 0
+
+    def stop_all(self, timeout=STOP_TIMEOUT):
+        for name, child in list(self.children.items()):
+            graceful = stop_child(child, timeout)
+            print(f"[OK] {name} 종료" + ("" if graceful else " (강제 종료)"))
+        self.children.clear()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER 서버 프로세스 관리')
+    parser.add_argument('--who', type=int, metavar='PORT',
+                        help='포트를 LISTEN 중인 프로세스 조회 (기본: pid 파일에 기록된 서버 목록)')
+
+    args = parser.parse_args()
+
+    if args.who:
+        pids = sorted(listening_pids(args.who))
+        if not pids:
+            print(f"[INFO] 포트 {args.who}에서 LISTEN 중인 프로세스 없음")
+        for pid in pids:
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    cmdline = f.read().replace(b'\0', b' ').decode(errors='replace').strip()
+            except OSError:
+                cmdline = '?'
+            print(f"  PID {pid} (그룹 {_pgid(pid)}): {cmdline}")
+        return 0
+
+    groups = tracked_groups()
+    if not groups:
+        print("[INFO] 기록된 실행 중 서버 없음")
+    for pgid, name in groups.items():
+        data = read_pidfile(name)
+        print(f"  {name}: PID {pgid}, 포트 {data.get('port')}, 명령 {' '.join(data.get('cmd', []))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+MEDCHECKER 작업 의존성 그래프 실행기
+의존 관계가 없는 작업을 동시에 실행하고, 실패한 작업의 후속 작업만 건너뜁니다.
+
+- 작업별 출력은 버퍼링 후 완료 시 [작업명] 접두어를 붙여 한 번에 출력
+  (stream=True이면 줄 단위로 즉시 출력)
+- 같은 잠금(locks)을 쓰는 작업은 동시에 실행하지 않음 (같은 파일을 고치는 작업 등)
+- soft 작업은 실패해도 후속 작업을 막지 않음 (경고)
+- 실행 후 작업별 소요 시간과 임계 경로(critical path) 요약
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Task:
+    """실행 단위 - cmd(명령) 또는 func(파이썬 함수, bool 반환) 중 하나"""
+    name: str
+    label: str
+    cmd: object = None          # str이면 shell 실행, list면 직접 실행
+    func: object = None
+    cwd: str = None
+    deps: tuple = ()
+    soft: bool = False
+    locks: tuple = ()           # 동시에 잡을 수 없는 자원 이름 (등록 순서대로 실행)
+
+
+@dataclass
+class TaskResult:
+    name: str
+    status: str = 'pending'     # 'running' | 'passed' | 'failed' | 'skipped'
+    returncode: int = None
+    started: float = None
+    finished: float = None
+    output: list = field(default_factory=list)
+    reason: str = ''
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class _TaskStdout:
+    """실행 중 sys.stdout 대리자 - 작업 스레드의 print 출력을 작업별로 모음"""
+
+    def __init__(self, graph, target):
+        self.graph = graph
+        self.target = target
+        self.local = threading.local()
+
+    def write(self, text):
+        name = getattr(self.local, 'task', None)
+        if name is None:
+            with self.graph._print_lock:
+                self.target.write(text)
+            return len(text)
+        *lines, self.local.partial = (self.local.partial + text).split('\n')
+        for line in lines:
+            self.graph._task_line(name, line)
+        return len(text)
+
+    def flush(self):
+        self.target.flush()
+
+    def begin(self, name):
+        self.local.task = name
+        self.local.partial = ''
+
+    def end(self):
+        if self.local.partial:
+            self.graph._task_line(self.local.task, self.local.partial)
+        self.local.task = None
+
+    def __getattr__(self, attr):
+        return getattr(self.target, attr)
+
+
+class TaskGraph:
+    """작업 그래프 - add()로 작업을 등록하고 run()으로 실행
+
+    stream=True이면 작업 출력을 버퍼링하지 않고 [작업명] 접두어를 붙여 바로 출력합니다.
+    """
+
+    def __init__(self, stream=False):
+        self.tasks = {}
+        self.results = {}
+        self.stream = stream
+        self._print_lock = threading.Lock()
+        self._origin = None
+        self._out = sys.stdout
+
+    def add(self, task):
+        if task.name in self.tasks:
+            raise ValueError(f'중복된 작업 이름: {task.name}')
+        self.tasks[task.name] = task
+        return task
+
+    def _validate(self):
+        """존재하지 않는 의존성과 순환 의존성 검사"""
+        for task in self.tasks.values():
+            for dep in task.deps:
+                if dep not in self.tasks:
+                    raise ValueError(f'{task.name}: 알 수 없는 의존 작업 {dep}')
+
+        state = {}
+
+        def visit(name, path):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError('순환 의존성: ' + ' -> '.join(path + [name]))
+            state[name] = 'visiting'
+            for dep in self.tasks[name].deps:
+                visit(dep, path + [name])
+            state[name] = 'done'
+
+        for name in self.tasks:
+            visit(name, [])
+
+    def _emit(self, lines):
+        with self._print_lock:
+            for line in lines:
+                self._out.write(line + '\n')
+            self._out.flush()
+
+    def _task_line(self, name, line):
+        """작업 출력 한 줄 기록 (스트리밍 모드면 즉시 출력)"""
+        self.results[name].output.append(line)
+        if self.stream:
+            self._emit([f"[{name}] {line}"])
+
+    def _run_command(self, task):
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        process = subprocess.Popen(
+            task.cmd,
+            shell=isinstance(task.cmd, str),
+            cwd=task.cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace',
+        )
+        for line in process.stdout:
+            self._task_line(task.name, line.rstrip('\n'))
+        return process.wait()
+
+    def _execute(self, task, stdout):
+        result = self.results[task.name]
+        result.started = time.monotonic()
+        self._emit([f"[시작] {task.label}"])
+
+        stdout.begin(task.name)
+        try:
+            if task.func is not None:
+                ok = bool(task.func())
+                result.returncode = 0 if ok else 1
+            else:
+                result.returncode = self._run_command(task)
+        except Exception as e:
+            self._task_line(task.name, f"[ERROR] 실행 실패: {e}")
+            result.returncode = -1
+        finally:
+            stdout.end()
+
+        result.finished = time.monotonic()
+        result.status = 'passed' if result.returncode == 0 else 'failed'
+
+        status = "완료" if result.status == 'passed' else "실패"
+        lines = [] if self.stream else [f"[{task.name}] {line}" for line in result.output]
+        lines.append(f"[{status}] {task.label} ({result.duration:.1f}초)")
+        self._emit(lines)
+        return result
+
+    def _blocked_by(self, task):
+        """후속 실행을 막는 실패/건너뜀 의존 작업 이름 (없으면 None)"""
+        for dep in task.deps:
+            dep_result = self.results[dep]
+            if dep_result.status == 'skipped':
+                return dep
+            if dep_result.status == 'failed' and not self.tasks[dep].soft:
+                return dep
+        return None
+
+    def run(self, max_workers=None):
+        """모든 작업 실행 -> {이름: TaskResult}"""
+        self._validate()
+        self.results = {name: TaskResult(name) for name in self.tasks}
+        self._origin = time.monotonic()
+        max_workers = max_workers or max(1, len(self.tasks))
+
+        # 작업 함수의 print 출력도 작업별로 모으도록 stdout 교체
+        self._out = sys.stdout
+        stdout = _TaskStdout(self, self._out)
+        sys.stdout = stdout
+        try:
+            self._schedule(max_workers, stdout)
+        finally:
+            sys.stdout = self._out
+        return self.results
+
+    def _schedule(self, max_workers, stdout):
+        pending = dict(self.tasks)
+        running = {}
+        held = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # 의존 작업이 모두 끝난 작업을 실행 (건너뜀은 연쇄적으로 처리)
+                changed = True
+                while changed:
+                    changed = False
+                    for name, task in list(pending.items()):
+                        if any(self.results[dep].status in ('pending', 'running') for dep in task.deps):
+                            continue
+                        if held.intersection(task.locks):
+                            continue
+                        del pending[name]
+                        changed = True
+                        blocker = self._blocked_by(task)
+                        if blocker:
+                            result = self.results[name]
+                            result.status = 'skipped'
+                            result.reason = f'{self.tasks[blocker].label} 실패'
+                            self._emit([f"[건너뜀] {task.label} ({result.reason})"])
+                        else:
+                            self.results[name].status = 'running'
+                            held.update(task.locks)
+                            running[executor.submit(self._execute, task, stdout)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    held.difference_update(self.tasks[running.pop(future)].locks)
+                    future.result()
+
+    def _predecessors(self, name):
+        """먼저 끝나야 시작할 수 있었던 작업 - 의존 작업 + 같은 잠금을 먼저 쓴 작업"""
+        task = self.tasks[name]
+        result = self.results[name]
+        names = set(task.deps)
+        for other, other_task in self.tasks.items():
+            other_result = self.results[other]
+            if (other != name and set(task.locks) & set(other_task.locks)
+                    and other_result.finished is not None and other_result.finished <= result.started):
+                names.add(other)
+        return [self.results[n] for n in names if self.results[n].finished is not None]
+
+    def critical_path(self):
+        """가장 늦게 끝난 작업에서 거꾸로, 가장 늦게 끝난 선행 작업을 따라간 경로"""
+        finished = [r for r in self.results.values() if r.finished is not None]
+        if not finished:
+            return []
+        current = max(finished, key=lambda r: r.finished)
+        path = [current]
+        while True:
+            predecessors = self._predecessors(current.name)
+            if not predecessors:
+                break
+            current = max(predecessors, key=lambda r: r.finished)
+            path.append(current)
+        return list(reversed(path))
+
+    def print_timing(self):
+        """작업별 시작/소요 시간과 임계 경로 출력"""
+        print("\n[작업별 소요 시간]")
+        for name, task in self.tasks.items():
+            result = self.results[name]
+            if result.started is None:
+                print(f"  {task.label:<24} {'-':>8}  ({result.reason or '실행 안 함'})")
+                continue
+            offset = result.started - self._origin
+            print(f"  {task.label:<24} {result.duration:>7.1f}초  (시작 +{offset:.1f}초)")
+
+        path = self.critical_path()
+        if path:
+            total = path[-1].finished - self._origin
+            chain = ' → '.join(f"{self.tasks[r.name].label}({r.duration:.1f}초)" for r in path)
+            print(f"\n임계 경로 ({total:.1f}초): {chain}")
@@ -0,0 +1,41 @@
+"""jsx_tokenizer 회귀 테스트 (python3 -m pytest test_jsx_tokenizer.py)"""
+
+import time
+
+import pytest
+
+from jsx_tokenizer import JSXTokenizer, tokenize
+
+
+def names(events):
+    return [(event.kind, event.name) for event in events]
+
+
+@pytest.mark.parametrize('source', ['<a x={' * 8000, '<a x="' * 8000, '<!--' * 8000, '<a x={<b y={' * 8000])
+def test_unterminated_input_is_linear(source):
+    # 미완성 태그마다 입력 끝까지 재탐색하면 수십 초 걸림
+    started = time.perf_counter()
+    assert tokenize(source) == []
+    assert time.perf_counter() - started < 1.0
+
+
+def test_quote_in_nested_jsx_text():
+    events = tokenize("<Tip content={<span>Can't</span>} side='top'><b>x</b></Tip>")
+    assert names(events) == [('start', 'Tip'), ('start', 'b'), ('end', 'b'), ('end', 'Tip')]
+    assert events[0].attrs == {'content': "{<span>Can't</span>}", 'side': 'top'}
+
+
+def test_comparison_and_comment_inside_braces():
+    events = tokenize("<A x={a < b && c > 'd'} on={() => { // don't\n return 1 }}/><B/>")
+    assert names(events) == [('start', 'A'), ('start', 'B')]
+    assert events[0].attrs['x'] == "{a < b && c > 'd'}"
+
+
+def test_feed_in_chunks_matches_tokenize():
+    source = '<div className="a" onClick={() => go("x > y")}>\n<img src={logo} alt="" /></div>'
+    tokenizer = JSXTokenizer()
+    events = []
+    for i in range(0, len(source), 7):
+        events += tokenizer.feed(source[i:i + 7])
+    events += tokenizer.close()
+    assert events == tokenize(source)
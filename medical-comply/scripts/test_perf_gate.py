@@ -0,0 +1,31 @@
+"""perf_gate 회귀 테스트 (python3 -m pytest test_perf_gate.py)"""
+
+import perf_gate
+from perf_gate import evaluate, history_record
+
+METRIC = 'bundle.total_bytes'
+
+
+def record(value, regressions=(), accepted=False):
+    data = {'metrics': {METRIC: value}, 'regressions': list(regressions)}
+    if accepted:
+        data['accepted'] = True
+    return data
+
+
+def test_retried_regression_does_not_move_baseline(monkeypatch):
+    monkeypatch.setattr(perf_gate, '_git_revision', lambda: None)
+    history = [record(100_000) for _ in range(5)]
+    for _ in range(3):
+        rows = evaluate({METRIC: 150_000}, history)
+        assert rows[0][2] == 100_000
+        assert rows[0][4], '재시도한 회귀가 통과됨'
+        history.append(history_record({METRIC: 150_000}, rows))
+    assert evaluate({METRIC: 150_000}, history)[0][4]
+
+
+def test_accepted_regression_becomes_baseline():
+    history = [record(100_000) for _ in range(5)]
+    history += [record(150_000, [METRIC], accepted=True) for _ in range(3)]
+    name, value, base, change, regressed = evaluate({METRIC: 150_000}, history)[0]
+    assert base == 150_000 and not regressed
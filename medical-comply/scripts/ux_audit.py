@@ -7,16 +7,268 @@ MEDCHECKER UX 자동 평가 스크립트
 import os
 import re
 import json
+import glob
+import hashlib
 import sys
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from jsx_tokenizer import tokenize
+from bundle_analysis import (
+    CHUNK_WARNING_BYTES, CODE_EXTENSIONS, INLINE_ASSET_LIMIT, ImportGraph,
+    declared_twice, dist_chunks, inline_assets, lockfile_duplicates, scan_module,
+)
 
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_DIR = SCRIPT_DIR.parent
 FRONTEND_DIR = PROJECT_DIR / 'frontend' / 'src'
 
+CACHE_FILE = SCRIPT_DIR / 'ux_audit_cache.json'
+CACHE_VERSION = 4
+
+SEMANTIC_TAGS = {'header', 'nav', 'main', 'section', 'article', 'aside', 'footer'}
+LINK_TAGS = {'Link', 'NavLink'}
+
+# 성능: 이보다 큰 모듈은 분리 권장, 진입점(main.jsx)에서 정적으로 불러오는 소스 합계 예산
+LARGE_MODULE_BYTES = 30 * 1024
+INITIAL_SOURCE_BUDGET = 150 * 1024
+ROUTE_COMPONENT = re.compile(r'<([A-Z][\w.]*)')
+
+
+def _is_inline_style(value):
+    """style={{ ... }} (JSX 객체 리터럴) 또는 style="..." (HTML)"""
+    return isinstance(value, str) and (value.startswith('{{') or not value.startswith('{'))
+
+
+def analyze_source(content, filename):
+    """소스 파일을 한 번 토큰화하여 카테고리별 부분 점수/이슈 계산"""
+    lowered = content.lower()
+
+    has_aria_label = False
+    img_missing_alt = 0
+    has_button = False
+    has_semantic_tag = False
+    inline_style_count = 0
+    btn_classes = set()
+    has_hover_handler = False
+    link_count = 0
+    route_count = 0
+    home_link = False
+    routes = []
+
+    for event in tokenize(content):
+        if event.kind != 'start':
+            continue
+        name = event.name
+        attrs = event.attrs
+
+        if 'aria-label' in attrs or 'aria-labelledby' in attrs:
+            has_aria_label = True
+        if name == 'img' and 'alt' not in attrs:
+            img_missing_alt += 1
+        elif name == 'button':
+            has_button = True
+        elif name in SEMANTIC_TAGS:
+            has_semantic_tag = True
+
+        if _is_inline_style(attrs.get('style')):
+            inline_style_count += 1
+        class_name = attrs.get('className', attrs.get('class'))
+        if isinstance(class_name, str) and not class_name.startswith('{'):
+            if 'btn' in class_name:
+                btn_classes.add(class_name)
+            if 'hover' in class_name:
+                has_hover_handler = True
+        if 'onMouseOver' in attrs or 'onMouseEnter' in attrs:
+            has_hover_handler = True
+
+        to = attrs.get('to')
+        if name in LINK_TAGS and isinstance(to, str):
+            link_count += 1
+        if to == '/':
+            home_link = True
+        if name == 'Route' and isinstance(attrs.get('path'), str):
+            route_count += 1
+            element = attrs.get('element')
+            if isinstance(element, str):
+                routes.append([attrs['path'], ROUTE_COMPONENT.findall(element)])
+
+    # 접근성
+    accessibility = {'score': 0, 'issues': []}
+    if has_aria_label:
+        accessibility['score'] += 2
+    else:
+        accessibility['issues'].append(f"{filename}: aria-label 속성 부족")
+    for _ in range(img_missing_alt):
+        accessibility['issues'].append(f"{filename}: 이미지에 alt 속성 누락")
+    if has_button:
+        accessibility['score'] += 2
+    if has_semantic_tag:
+        accessibility['score'] += 1
+
+    # 일관성
+    consistency = {
+        'inline_style_count': inline_style_count,
+        'btn_classes': sorted(btn_classes),
+    }
+
+    # 피드백 (상태 처리는 JS 코드 키워드, 호버는 요소 속성과 CSS)
+    feedback = {'score': 0, 'issues': []}
+    if 'loading' in lowered or 'spinner' in lowered:
+        feedback['score'] += 3
+    else:
+        feedback['issues'].append(f"{filename}: 로딩 상태 표시 없음")
+    if 'error' in lowered or 'catch' in content:
+        feedback['score'] += 3
+    else:
+        feedback['issues'].append(f"{filename}: 에러 상태 처리 없음")
+    if '성공' in content or 'success' in lowered:
+        feedback['score'] += 2
+    if has_hover_handler or ':hover' in content:
+        feedback['score'] += 2
+
+    # 네비게이션
+    navigation = {
+        'link_count': link_count,
+        'route_count': route_count,
+        'home_link': home_link,
+        'logout': 'logout' in lowered or '로그아웃' in content,
+    }
+
+    # 성능 (모듈 크기, import 관계, 라우트별 페이지 컴포넌트)
+    performance = scan_module(content)
+    performance['routes'] = routes
+
+    return {
+        'name': filename,
+        'accessibility': accessibility,
+        'consistency': consistency,
+        'feedback': feedback,
+        'navigation': navigation,
+        'performance': performance,
+    }
+
+
+class SourceIndex:
+    """프론트엔드 소스 인덱스 - 실행당 파일마다 한 번만 읽고 스캔
+
+    cache_file을 지정하면 파일 내용 해시별 부분 결과를 저장해 두고,
+    다음 실행에서는 변경된 파일만 다시 분석합니다.
+    """
+
+    def __init__(self, root=FRONTEND_DIR, cache_file=None):
+        self.root = Path(root)
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.stats = {'analyzed': 0, 'cached': 0}
+        self._partials = {}
+        self._cache = self._load_cache()
+        self._entries = {}
+
+    def _load_cache(self):
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('files', {})
+
+    def save(self):
+        """이번 실행에서 확인한 파일만 캐시에 기록 (삭제된 파일은 정리됨)"""
+        if not self.cache_file:
+            return
+        data = {'version': CACHE_VERSION, 'files': self._entries}
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_file, self.cache_file)
+
+    def _key(self, path):
+        if path.is_relative_to(self.root):
+            return path.relative_to(self.root).as_posix()
+        return str(path)
+
+    def prefetch(self, paths, jobs=1):
+        """여러 파일을 한 번에 인덱싱 - 캐시 미스 파일만 jobs개 프로세스로 분석
+
+        분석 결과는 입력 순서대로 병합되므로 jobs 값과 무관하게 동일합니다.
+        """
+        pending = []
+        for path in paths:
+            path = Path(path)
+            if path in self._partials or not path.exists():
+                continue
+
+            key = self._key(path)
+            stat = path.stat()
+            entry = self._cache.get(key)
+
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                self.stats['cached'] += 1
+            else:
+                data = path.read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if entry and entry['sha256'] == digest:
+                    self.stats['cached'] += 1
+                else:
+                    pending.append((path, key, stat, digest, data.decode('utf-8')))
+                    continue
+                entry = dict(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+            self._entries[key] = entry
+            self._partials[path] = entry['partials']
+
+        if not pending:
+            return
+
+        contents = [item[4] for item in pending]
+        names = [item[0].name for item in pending]
+        if jobs > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+                chunksize = max(1, len(pending) // (jobs * 4))
+                analyzed = list(executor.map(analyze_source, contents, names, chunksize=chunksize))
+        else:
+            analyzed = list(map(analyze_source, contents, names))
+
+        for (path, key, stat, digest, _), partials in zip(pending, analyzed):
+            entry = {'sha256': digest, 'partials': partials, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+            self._entries[key] = entry
+            self._partials[path] = partials
+            self.stats['analyzed'] += 1
+
+    def get(self, path):
+        """파일의 카테고리별 부분 결과 반환 (없으면 None)"""
+        path = Path(path)
+        if path not in self._partials:
+            self.prefetch([path])
+        return self._partials.get(path)
+
+    def paths(self, subdir, pattern='*.jsx'):
+        """디렉토리 내 파일 경로 목록 (파일명 순)"""
+        directory = self.root / subdir
+        if not directory.exists():
+            return []
+        return sorted(directory.glob(pattern))
+
+    def collect(self, paths):
+        """주어진 파일들의 부분 결과 목록 (존재하지 않는 파일 제외)"""
+        paths = [Path(path) for path in paths]
+        self.prefetch(paths)
+        return [self._partials[path] for path in paths if path in self._partials]
+
+    def glob(self, subdir, pattern='*.jsx'):
+        """디렉토리 내 파일 부분 결과 목록 (파일명 순)"""
+        return self.collect(self.paths(subdir, pattern))
+
+
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, index=None, jobs=1, extra_paths=()):
+        self.index = index or SourceIndex()
+        self.jobs = jobs
+        # 페이지와 함께 검사할 추가 마크업 파일 (예: medchecker/backend/public/*.html)
+        self.extra_paths = sorted(Path(path) for path in extra_paths)
         self.results = {
             'timestamp': datetime.now().isoformat(),
             'categories': {},
@@ -32,38 +284,13 @@ class UXAuditor:
         max_score = 25
         issues = []
 
-        pages_dir = FRONTEND_DIR / 'pages'
-        components_dir = FRONTEND_DIR / 'components'
-
-        all_jsx_files = list(pages_dir.glob('*.jsx')) + list(components_dir.glob('*.jsx')) if pages_dir.exists() else []
+        pages_dir = self.index.root / 'pages'
+        all_files = self.index.glob('pages') + self.index.glob('components') if pages_dir.exists() else []
+        all_files += self.index.collect(self.extra_paths)
 
-        for jsx_file in all_jsx_files:
-            content = jsx_file.read_text(encoding='utf-8')
-            filename = jsx_file.name
-
-            # aria-label 체크
-            if 'aria-label' in content or 'aria-labelledby' in content:
-                score += 2
-            else:
-                issues.append(f"{filename}: aria-label 속성 부족")
-
-            # alt 속성 체크 (이미지)
-            img_tags = re.findall(r'<img[^>]*>', content)
-            for img in img_tags:
-                if 'alt=' not in img:
-                    issues.append(f"{filename}: 이미지에 alt 속성 누락")
-
-            # 버튼 접근성
-            buttons = re.findall(r'<button[^>]*>.*?</button>', content, re.DOTALL)
-            if buttons:
-                score += 2
-
-            # 시맨틱 태그 사용
-            semantic_tags = ['<header', '<nav', '<main', '<section', '<article', '<aside', '<footer']
-            for tag in semantic_tags:
-                if tag in content:
-                    score += 1
-                    break
+        for partials in all_files:
+            score += partials['accessibility']['score']
+            issues.extend(partials['accessibility']['issues'])
 
         score = min(score, max_score)
         self.results['categories']['accessibility'] = {
@@ -81,7 +308,7 @@ class UXAuditor:
         issues = []
 
         # 스타일 일관성 체크
-        global_css = FRONTEND_DIR / 'styles' / 'global.css'
+        global_css = self.index.root / 'styles' / 'global.css'
         if global_css.exists():
             score += 10
             css_content = global_css.read_text(encoding='utf-8')
@@ -93,12 +320,11 @@ class UXAuditor:
                 issues.append("CSS 변수 미사용 - 일관성 저하 가능")
 
         # 컴포넌트 스타일 일관성
-        pages_dir = FRONTEND_DIR / 'pages'
-        if pages_dir.exists():
-            inline_styles_count = 0
-            for jsx_file in pages_dir.glob('*.jsx'):
-                content = jsx_file.read_text(encoding='utf-8')
-                inline_styles_count += len(re.findall(r'style=\{\{', content))
+        pages_dir = self.index.root / 'pages'
+        page_files = self.index.glob('pages') + self.index.collect(self.extra_paths)
+        has_pages = pages_dir.exists() or bool(self.extra_paths)
+        if has_pages:
+            inline_styles_count = sum(p['consistency']['inline_style_count'] for p in page_files)
 
             if inline_styles_count > 50:
                 issues.append(f"인라인 스타일 과다 사용 ({inline_styles_count}개) - CSS 클래스 권장")
@@ -106,11 +332,10 @@ class UXAuditor:
                 score += 5
 
         # 버튼 스타일 일관성
-        if pages_dir.exists():
+        if has_pages:
             btn_classes = set()
-            for jsx_file in pages_dir.glob('*.jsx'):
-                content = jsx_file.read_text(encoding='utf-8')
-                btn_classes.update(re.findall(r'className="[^"]*btn[^"]*"', content))
+            for partials in page_files:
+                btn_classes.update(partials['consistency']['btn_classes'])
 
             if len(btn_classes) <= 5:
                 score += 5
@@ -132,8 +357,8 @@ class UXAuditor:
         max_score = 25
         issues = []
 
-        pages_dir = FRONTEND_DIR / 'pages'
-        if not pages_dir.exists():
+        pages_dir = self.index.root / 'pages'
+        if not pages_dir.exists() and not self.extra_paths:
             self.results['categories']['feedback'] = {
                 'name': '피드백',
                 'score': 0,
@@ -142,29 +367,9 @@ class UXAuditor:
             }
             return 0, max_score
 
-        for jsx_file in pages_dir.glob('*.jsx'):
-            content = jsx_file.read_text(encoding='utf-8')
-            filename = jsx_file.name
-
-            # 로딩 상태 체크
-            if 'loading' in content.lower() or 'spinner' in content.lower():
-                score += 3
-            else:
-                issues.append(f"{filename}: 로딩 상태 표시 없음")
-
-            # 에러 처리 체크
-            if 'error' in content.lower() or 'catch' in content:
-                score += 3
-            else:
-                issues.append(f"{filename}: 에러 상태 처리 없음")
-
-            # 성공 피드백
-            if '성공' in content or 'success' in content.lower():
-                score += 2
-
-            # 호버 효과
-            if 'onMouseOver' in content or ':hover' in content or 'hover' in content:
-                score += 2
+        for partials in self.index.glob('pages') + self.index.collect(self.extra_paths):
+            score += partials['feedback']['score']
+            issues.extend(partials['feedback']['issues'])
 
         score = min(score, max_score)
         self.results['categories']['feedback'] = {
@@ -182,39 +387,37 @@ class UXAuditor:
         issues = []
 
         # Header 컴포넌트 체크
-        header_file = FRONTEND_DIR / 'components' / 'Header.jsx'
-        if header_file.exists():
-            content = header_file.read_text(encoding='utf-8')
+        header = self.index.get(self.index.root / 'components' / 'Header.jsx')
+        if header:
+            nav = header['navigation']
             score += 5
 
             # 네비게이션 링크 수
-            links = re.findall(r'<Link[^>]*to="[^"]*"', content)
-            if len(links) >= 3:
+            if nav['link_count'] >= 3:
                 score += 5
             else:
-                issues.append(f"네비게이션 링크 부족 ({len(links)}개)")
+                issues.append(f"네비게이션 링크 부족 ({nav['link_count']}개)")
 
             # 로고/홈 링크
-            if 'to="/"' in content or "to='/'" in content:
+            if nav['home_link']:
                 score += 5
             else:
                 issues.append("홈으로 가는 로고 링크 없음")
 
             # 로그인/로그아웃
-            if 'logout' in content.lower() or '로그아웃' in content:
+            if nav['logout']:
                 score += 5
         else:
             issues.append("Header 컴포넌트 없음")
 
         # App.jsx 라우팅 체크
-        app_file = FRONTEND_DIR / 'App.jsx'
-        if app_file.exists():
-            content = app_file.read_text(encoding='utf-8')
-            routes = re.findall(r'<Route[^>]*path="[^"]*"', content)
-            if len(routes) >= 5:
+        app = self.index.get(self.index.root / 'App.jsx')
+        if app:
+            route_count = app['navigation']['route_count']
+            if route_count >= 5:
                 score += 5
             else:
-                issues.append(f"라우트 수 부족 ({len(routes)}개)")
+                issues.append(f"라우트 수 부족 ({route_count}개)")
 
         score = min(score, max_score)
         self.results['categories']['navigation'] = {
@@ -225,6 +428,113 @@ class UXAuditor:
         }
         return score, max_score
 
+    def code_paths(self):
+        """src 아래 JS/JSX/TS 모듈 경로 목록"""
+        return sorted(path for ext in CODE_EXTENSIONS for path in self.index.paths('', f'**/*{ext}'))
+
+    def audit_performance(self):
+        """로딩 성능 검사 (빌드 결과물과 src import 그래프, 오프라인)"""
+        score = 0
+        max_score = 25
+        issues = []
+        root = self.index.root.resolve()
+        package_dir = root.parent
+
+        paths = self.code_paths()
+        modules = {path.resolve(): partials['performance']
+                   for path, partials in zip(paths, self.index.collect(paths))}
+        graph = ImportGraph(modules)
+
+        def label(path):
+            return path.relative_to(root).as_posix() if path.is_relative_to(root) else str(path)
+
+        # 라우트 페이지 lazy 로딩 (App.jsx에서 정적 import한 페이지는 초기 번들에 포함)
+        app_path = root / 'App.jsx'
+        app = modules.get(app_path)
+        non_lazy = []
+        route_pages = 0
+        if app:
+            seen = set()
+            for route_path, components in app['routes']:
+                for component in components:
+                    specifier = app['lazy'].get(component) or app['bindings'].get(component)
+                    if component in seen or not specifier or 'pages/' not in specifier:
+                        continue
+                    seen.add(component)
+                    route_pages += 1
+                    target = next((t for t in graph.static[app_path] if t.stem == specifier.rsplit('/', 1)[-1]),
+                                  None)
+                    if component not in app['lazy'] and target and route_path != '/':
+                        non_lazy.append((component, route_path, graph.size(graph.closure(target))))
+        non_lazy.sort(key=lambda item: item[2], reverse=True)
+        if route_pages:
+            score += round(8 * (1 - len(non_lazy) / route_pages))
+            for component, route_path, size in non_lazy:
+                issues.append(f"App.jsx: {component} 페이지가 lazy 로딩되지 않음 ({size / 1024:.1f}KB, {route_path})")
+        else:
+            score += 8
+
+        # 큰 모듈
+        large = [(path, size, lines) for path, size, lines in graph.largest(len(modules))
+                 if size > LARGE_MODULE_BYTES]
+        score += max(0, 5 - 2 * len(large))
+        for path, size, lines in large:
+            issues.append(f"{label(path)}: 모듈 크기 {size / 1024:.1f}KB ({lines}줄) - 컴포넌트 분리 권장")
+
+        # 초기 로딩 크기 (main.jsx에서 정적으로 도달하는 소스 합계, 빌드 결과물이 있으면 청크 크기도)
+        entry = root / 'main.jsx'
+        initial_bytes = graph.size(graph.closure(entry)) if entry in modules else 0
+        size_score = 4
+        if initial_bytes > INITIAL_SOURCE_BUDGET:
+            size_score = 2 if initial_bytes <= 2 * INITIAL_SOURCE_BUDGET else 0
+            issues.append(f"초기 로딩 소스 {initial_bytes / 1024:.1f}KB "
+                          f"(예산 {INITIAL_SOURCE_BUDGET // 1024}KB, main.jsx 기준)")
+
+        chunks = dist_chunks(package_dir / 'dist') if (package_dir / 'dist').exists() else []
+        oversized_chunks = [chunk for chunk in chunks if chunk[1] > CHUNK_WARNING_BYTES]
+        if oversized_chunks:
+            size_score = max(0, size_score - 2)
+        for name, size, gzip_size in oversized_chunks:
+            issues.append(f"dist/{name}: 청크 크기 {size / 1024:.1f}KB (gzip {gzip_size / 1024:.1f}KB)")
+        score += size_score
+
+        # 중복 의존성
+        duplicates = lockfile_duplicates(package_dir)
+        twice = declared_twice(package_dir)
+        score += max(0, 4 - 2 * (len(duplicates) + len(twice)))
+        for name, versions in duplicates.items():
+            issues.append(f"package-lock.json: {name} 여러 버전 설치 ({', '.join(versions)})")
+        for name in twice:
+            issues.append(f"package.json: {name}이(가) dependencies와 devDependencies에 중복 선언")
+
+        # 큰 인라인 에셋 (data: URI, 인라인 SVG) - CSS는 그래프에 없으므로 직접 스캔
+        assets = [(path, kind, size) for path, info in modules.items()
+                  for kind, size in info['inline_assets']]
+        for path in self.index.paths('', '**/*.css'):
+            assets += [(path.resolve(), kind, size)
+                       for kind, size in inline_assets(path.read_text(encoding='utf-8', errors='replace'))]
+        oversized = [asset for asset in assets if asset[2] > INLINE_ASSET_LIMIT]
+        score += max(0, 4 - 2 * len(oversized))
+        for path, kind, size in oversized:
+            issues.append(f"{label(path)}: 인라인 에셋({kind}) {size / 1024:.1f}KB - 별도 파일로 분리 권장")
+
+        score = min(score, max_score)
+        self.results['categories']['performance'] = {
+            'name': '성능',
+            'score': score,
+            'max_score': max_score,
+            'issues': issues,
+            'details': {
+                'largest_modules': [{'path': label(path), 'bytes': size, 'lines': lines}
+                                    for path, size, lines in graph.largest()],
+                'initial_source_bytes': initial_bytes,
+                'non_lazy_routes': [component for component, _, _ in non_lazy],
+                'dist_chunks': [{'name': name, 'bytes': size, 'gzip_bytes': gzip_size}
+                                for name, size, gzip_size in chunks[:5]],
+            }
+        }
+        return score, max_score
+
     def generate_recommendations(self):
         """개선 권고사항 생성"""
         recommendations = []
@@ -257,6 +567,12 @@ class UXAuditor:
                         'category': '네비게이션',
                         'recommendation': '브레드크럼, 사이드바 네비게이션 추가 권장'
                     })
+                elif category == 'performance':
+                    recommendations.append({
+                        'priority': 'HIGH',
+                        'category': '성능',
+                        'recommendation': 'React.lazy + Suspense로 라우트 페이지 분할, 큰 페이지 컴포넌트 분리 권장'
+                    })
 
         self.results['recommendations'] = recommendations
 
@@ -270,6 +586,12 @@ class UXAuditor:
         total_score = 0
         max_score = 0
 
+        # 검사 대상 파일 일괄 분석 (--jobs 병렬) - pages/components/App.jsx를 포함한 src 전체 모듈
+        self.index.prefetch(
+            self.code_paths() + self.extra_paths,
+            jobs=self.jobs
+        )
+
         # 각 카테고리 검사
         s, m = self.audit_accessibility()
         total_score += s
@@ -287,6 +609,15 @@ class UXAuditor:
         total_score += s
         max_score += m
 
+        s, m = self.audit_performance()
+        total_score += s
+        max_score += m
+
+        # 증분 캐시 저장
+        self.index.save()
+        stats = self.index.stats
+        print(f"\n분석 파일: {stats['analyzed']}개 (캐시 재사용: {stats['cached']}개)")
+
         self.results['total_score'] = total_score
         self.results['max_score'] = max_score
 
@@ -348,7 +679,20 @@ class UXAuditor:
 
 
 def main():
-    auditor = UXAuditor()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='MEDCHECKER UX 자동 평가')
+    parser.add_argument('--no-cache', action='store_true', help='증분 캐시 없이 전체 파일 재분석')
+    parser.add_argument('--jobs', type=int, default=1, help='파일 분석 병렬 프로세스 수 (0: CPU 코어 수)')
+    parser.add_argument('--include', action='append', default=[], metavar='GLOB',
+                        help='페이지와 함께 검사할 추가 JSX/HTML 파일 패턴 (반복 가능)')
+
+    args = parser.parse_args()
+
+    index = SourceIndex(cache_file=None if args.no_cache else CACHE_FILE)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    extra_paths = sorted({path for pattern in args.include for path in glob.glob(pattern, recursive=True)})
+    auditor = UXAuditor(index, jobs=jobs, extra_paths=extra_paths)
     results = auditor.run_audit()
 
     total_percentage = (results['total_score'] / results['max_score'] * 100) if results['max_score'] > 0 else 0